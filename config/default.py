@@ -25,4 +25,60 @@ class Default:
     PERMANENT_SESSION_LIFETIME = timedelta(days=7)
 
     # Database Content Pagination
-    ITEMS_PER_PAGE = 20
\ No newline at end of file
+    ITEMS_PER_PAGE = 20
+
+    # Cache Backend ("memory", "filesystem" or "redis")
+    CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")
+    CACHE_KEY_PREFIX = os.getenv("CACHE_KEY_PREFIX", "breakfast-bar:")
+    CACHE_DEFAULT_TIMEOUT = int(os.getenv("CACHE_DEFAULT_TIMEOUT", 300))
+    CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", 1024))
+    CACHE_DIR = os.getenv("CACHE_DIR", "cache")
+    CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+    CACHE_REDIS_TIMEOUT = float(os.getenv("CACHE_REDIS_TIMEOUT", 0.5))
+
+    # Cache Lifetimes (seconds)
+    CATALOG_CACHE_TTL = int(os.getenv("CATALOG_CACHE_TTL", 300))
+    ADMIN_DASHBOARD_CACHE_TTL = int(os.getenv("ADMIN_DASHBOARD_CACHE_TTL", 60))
+    DASHBOARD_CACHE_TTL = int(os.getenv("DASHBOARD_CACHE_TTL", 300))
+    SYSTEM_STATS_MAX_STALENESS = int(os.getenv("SYSTEM_STATS_MAX_STALENESS", 30))
+    COUNT_CACHE_TTL = int(os.getenv("COUNT_CACHE_TTL", 60))
+
+    # Admin listing totals: "exact", "cached" (COUNT_CACHE_TTL) or "estimate" (MySQL row estimates)
+    ADMIN_ORDERS_COUNT = os.getenv("ADMIN_ORDERS_COUNT", "cached")
+    ADMIN_USERS_COUNT = os.getenv("ADMIN_USERS_COUNT", "exact")
+    ADMIN_FOOD_ITEMS_COUNT = os.getenv("ADMIN_FOOD_ITEMS_COUNT", "exact")
+
+    # Menu search: "index" (in-process inverted index) or "fulltext" (MySQL FULLTEXT)
+    SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "index")
+    SEARCH_WARM_ON_START = os.getenv("SEARCH_WARM_ON_START", "True") == "True"
+
+    # Menu price filter bands (ascending upper bounds; the last band is open-ended)
+    MENU_PRICE_BANDS = os.getenv("MENU_PRICE_BANDS", "10,20,30")
+
+    # Recommendations ("frequently bought together", mined from order items)
+    RECOMMENDATIONS_ENABLED = os.getenv("RECOMMENDATIONS_ENABLED", "True") == "True"
+    RECOMMENDATIONS_REFRESH_INTERVAL = float(os.getenv("RECOMMENDATIONS_REFRESH_INTERVAL", 300))
+    RECOMMENDATIONS_REBUILD_INTERVAL = float(os.getenv("RECOMMENDATIONS_REBUILD_INTERVAL", 86400))
+    RECOMMENDATIONS_MIN_SUPPORT = int(os.getenv("RECOMMENDATIONS_MIN_SUPPORT", 2))
+    RECOMMENDATIONS_TOP_K = int(os.getenv("RECOMMENDATIONS_TOP_K", 12))
+
+    # Analytics (IANA name; report days start at local midnight)
+    REPORTING_TIMEZONE = os.getenv("REPORTING_TIMEZONE", "UTC")
+
+    # Order numbers reserved per counter increment (per worker)
+    ORDER_NUMBER_BLOCK_SIZE = int(os.getenv("ORDER_NUMBER_BLOCK_SIZE", 1))
+
+    # SQL Profiling (see website.modules.QueryProfiler)
+    SQL_PROFILE_HEADERS = os.getenv("SQL_PROFILE_HEADERS", "False") == "True"
+    SQL_PROFILE_TOP = int(os.getenv("SQL_PROFILE_TOP", 5))
+    SLOW_QUERY_LOG = os.getenv("SLOW_QUERY_LOG", "False") == "True"
+    SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", 200))
+    SLOW_REQUEST_DB_TIME_MS = float(os.getenv("SLOW_REQUEST_DB_TIME_MS", 1000))
+    SLOW_REQUEST_QUERY_COUNT = int(os.getenv("SLOW_REQUEST_QUERY_COUNT", 50))
+
+    # Metrics (/metrics, merged across workers through METRICS_DIR)
+    # Off unless asked for; outside debug mode scrapes need METRICS_TOKEN
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "False") == "True"
+    METRICS_DIR = os.getenv("METRICS_DIR", os.path.join("tmp", "metrics"))
+    METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", 5))
+    METRICS_TOKEN = os.getenv("METRICS_TOKEN")
\ No newline at end of file
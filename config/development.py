@@ -24,4 +24,7 @@ class Development(Default):
         "echo": os.getenv("SQLALCHEMY_ECHO", "False") == "True",
     }
 
-    PRESERVE_CONTEXT_ON_EXCEPTION = False
\ No newline at end of file
+    PRESERVE_CONTEXT_ON_EXCEPTION = False
+
+    # Per-response query stats (X-DB-Query-Count, X-DB-Time-ms, Server-Timing)
+    SQL_PROFILE_HEADERS = os.getenv("SQL_PROFILE_HEADERS", "True") == "True"
\ No newline at end of file
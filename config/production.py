@@ -20,4 +20,16 @@ class Production(Default):
         "echo": os.getenv("SQLALCHEMY_ECHO", "False") == "True",
     }
 
-    PRESERVE_CONTEXT_ON_EXCEPTION = False
\ No newline at end of file
+    PRESERVE_CONTEXT_ON_EXCEPTION = False
+
+    # Shared across gunicorn workers (set "redis" + CACHE_REDIS_URL for multi-host)
+    CACHE_BACKEND = os.getenv("CACHE_BACKEND", "filesystem")
+
+    # Reserve order numbers in blocks so checkouts don't queue on the counter row
+    ORDER_NUMBER_BLOCK_SIZE = int(os.getenv("ORDER_NUMBER_BLOCK_SIZE", 10))
+
+    # Slow-query log (logs/system/database/slow-queries.log)
+    SLOW_QUERY_LOG = os.getenv("SLOW_QUERY_LOG", "True") == "True"
+    SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", 250))
+    SLOW_REQUEST_DB_TIME_MS = float(os.getenv("SLOW_REQUEST_DB_TIME_MS", 750))
+    SLOW_REQUEST_QUERY_COUNT = int(os.getenv("SLOW_REQUEST_QUERY_COUNT", 40))
\ No newline at end of file
@@ -0,0 +1,53 @@
+"""food item rating counters
+
+Revision ID: 24a239ac772e
+Revises: e8961e598c85
+Create Date: 2026-10-17 09:12:44.318207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '24a239ac772e'
+down_revision = 'e8961e598c85'
+branch_labels = None
+depends_on = None
+
+
+RATING_COLUMNS = [
+    'rating_sum',
+    'rating_count',
+    'rating_1_count',
+    'rating_2_count',
+    'rating_3_count',
+    'rating_4_count',
+    'rating_5_count',
+]
+
+
+def upgrade():
+    with op.batch_alter_table('food_items', schema=None) as batch_op:
+        for column in RATING_COLUMNS:
+            batch_op.add_column(sa.Column(column, sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill counters from existing reviews
+    op.execute(
+        """
+        UPDATE food_items SET
+            rating_sum = COALESCE((SELECT SUM(r.rating) FROM reviews r WHERE r.food_item_id = food_items.id), 0),
+            rating_count = (SELECT COUNT(*) FROM reviews r WHERE r.food_item_id = food_items.id),
+            rating_1_count = (SELECT COUNT(*) FROM reviews r WHERE r.food_item_id = food_items.id AND r.rating = 1),
+            rating_2_count = (SELECT COUNT(*) FROM reviews r WHERE r.food_item_id = food_items.id AND r.rating = 2),
+            rating_3_count = (SELECT COUNT(*) FROM reviews r WHERE r.food_item_id = food_items.id AND r.rating = 3),
+            rating_4_count = (SELECT COUNT(*) FROM reviews r WHERE r.food_item_id = food_items.id AND r.rating = 4),
+            rating_5_count = (SELECT COUNT(*) FROM reviews r WHERE r.food_item_id = food_items.id AND r.rating = 5)
+        """
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('food_items', schema=None) as batch_op:
+        for column in reversed(RATING_COLUMNS):
+            batch_op.drop_column(column)
@@ -0,0 +1,26 @@
+"""review listing index
+
+Revision ID: 4f2a8c1d6e90
+Revises: c71e4b08d5a3
+Create Date: 2026-10-17 16:48:05.271630
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4f2a8c1d6e90'
+down_revision = 'c71e4b08d5a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('reviews', schema=None) as batch_op:
+        batch_op.create_index('idx_review_food_item_created', ['food_item_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('reviews', schema=None) as batch_op:
+        batch_op.drop_index('idx_review_food_item_created')
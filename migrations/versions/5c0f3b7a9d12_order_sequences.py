@@ -0,0 +1,50 @@
+"""order sequences
+
+Revision ID: 5c0f3b7a9d12
+Revises: 958590c77021
+Create Date: 2026-10-17 11:36:52.104385
+
+"""
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c0f3b7a9d12'
+down_revision = '958590c77021'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    order_sequences = op.create_table('order_sequences',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('last_value', sa.Integer(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('day')
+    )
+
+    # Seed counters past the numbers already issued (BR-YYYYMMDD-XXX)
+    connection = op.get_bind()
+    last_values = {}
+    for (order_number,) in connection.execute(
+        sa.text("SELECT order_number FROM orders WHERE order_number LIKE 'BR-%'")
+    ):
+        try:
+            _, day, value = order_number.split('-')
+            day = datetime.strptime(day, '%Y%m%d').date()
+            value = int(value)
+        except ValueError:
+            continue
+        last_values[day] = max(last_values.get(day, 0), value)
+
+    if last_values:
+        op.bulk_insert(order_sequences, [
+            {'day': day, 'last_value': value}
+            for day, value in last_values.items()
+        ])
+
+
+def downgrade():
+    op.drop_table('order_sequences')
@@ -0,0 +1,27 @@
+"""daily sales summary discounts
+
+Revision ID: 958590c77021
+Revises: 24a239ac772e
+Create Date: 2026-10-17 10:41:07.552901
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '958590c77021'
+down_revision = '24a239ac772e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Rows are (re)built by `flask rollup-sales --from ... --to ...`
+    with op.batch_alter_table('daily_sales_summary', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('total_discounts', sa.Numeric(precision=10, scale=2), server_default='0', nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table('daily_sales_summary', schema=None) as batch_op:
+        batch_op.drop_column('total_discounts')
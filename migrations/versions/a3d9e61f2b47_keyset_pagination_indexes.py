@@ -0,0 +1,36 @@
+"""keyset pagination indexes
+
+Revision ID: a3d9e61f2b47
+Revises: 5c0f3b7a9d12
+Create Date: 2026-10-17 14:02:18.440913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3d9e61f2b47'
+down_revision = '5c0f3b7a9d12'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.create_index('idx_order_created', ['created_at', 'id'], unique=False)
+        batch_op.create_index('idx_order_customer_created', ['customer_id', 'created_at'], unique=False)
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index('idx_user_created', ['created_at', 'id'], unique=False)
+        batch_op.create_index('idx_user_role_created', ['role', 'created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index('idx_user_role_created')
+        batch_op.drop_index('idx_user_created')
+
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.drop_index('idx_order_customer_created')
+        batch_op.drop_index('idx_order_created')
@@ -0,0 +1,39 @@
+"""menu search fulltext indexes
+
+Revision ID: c71e4b08d5a3
+Revises: a3d9e61f2b47
+Create Date: 2026-10-17 15:21:40.118274
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c71e4b08d5a3'
+down_revision = 'a3d9e61f2b47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # FULLTEXT is MySQL-only; elsewhere these are plain indexes
+    with op.batch_alter_table('food_items', schema=None) as batch_op:
+        batch_op.create_index('ft_food_item_text', ['name', 'description'], unique=False, mysql_prefix='FULLTEXT')
+
+    with op.batch_alter_table('categories', schema=None) as batch_op:
+        batch_op.create_index('ft_category_name', ['name'], unique=False, mysql_prefix='FULLTEXT')
+
+    with op.batch_alter_table('ingredients', schema=None) as batch_op:
+        batch_op.create_index('ft_ingredient_name', ['name'], unique=False, mysql_prefix='FULLTEXT')
+
+
+def downgrade():
+    with op.batch_alter_table('ingredients', schema=None) as batch_op:
+        batch_op.drop_index('ft_ingredient_name')
+
+    with op.batch_alter_table('categories', schema=None) as batch_op:
+        batch_op.drop_index('ft_category_name')
+
+    with op.batch_alter_table('food_items', schema=None) as batch_op:
+        batch_op.drop_index('ft_food_item_text')
@@ -0,0 +1,96 @@
+from contextlib import contextmanager
+from decimal import Decimal
+
+import pytest
+from flask import Flask
+from sqlalchemy import event
+
+from database import db
+
+
+@pytest.fixture
+def app():
+    """Bare app on in-memory SQLite with every model's table created"""
+    app = Flask("website", root_path="website")
+    app.config.update(
+        TESTING=True,
+        SECRET_KEY="test",
+        SQLALCHEMY_DATABASE_URI="sqlite://"
+    )
+    db.init_app(app)
+
+    with app.app_context():
+        from website import models  # noqa: F401 (registers tables and events)
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def count_queries():
+    """
+    Context manager collecting every statement sent to the current app's
+    database:
+        with count_queries() as statements: ...
+    With parameters=True it collects (statement, parameters) pairs.
+    """
+    @contextmanager
+    def counter(parameters: bool = False):
+        statements = []
+
+        def record(conn, cursor, statement, params, context, executemany):
+            statements.append((statement, params) if parameters else statement)
+
+        engine = db.engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+    return counter
+
+
+@pytest.fixture
+def menu(app):
+    """Three categories with two available items each"""
+    from website.models import Category, FoodItem
+
+    categories = [Category(name=f"Category {i}", is_active=True, sort_order=i) for i in range(3)]
+    db.session.add_all(categories)
+    db.session.flush()
+
+    items = [
+        FoodItem(
+            name=f"Item {i}",
+            description=f"Item {i} description",
+            price=Decimal("5.00") + i,
+            category_id=categories[i % 3].id,
+            is_available=True
+        )
+        for i in range(6)
+    ]
+    db.session.add_all(items)
+    db.session.commit()
+    return items
+
+
+@pytest.fixture
+def customer_user(app):
+    """A customer user with a linked customer record (same id)"""
+    from website.models import User, Customer
+
+    user = User(
+        first_name="Ada",
+        last_name="Wanjiku",
+        email="ada@example.com",
+        phone="0700000000",
+        password_hash="x"
+    )
+    db.session.add(user)
+    db.session.flush()
+
+    db.session.add(Customer(id=user.id, user_id=user.id, name="Ada Wanjiku", phone=user.phone))
+    db.session.commit()
+    return user
@@ -0,0 +1,19 @@
+from website.services import AdminService
+
+
+def test_system_stats_are_not_cached_with_the_dashboard(app, count_queries, customer_user):
+    app.config.update(ADMIN_DASHBOARD_CACHE_TTL=60, SYSTEM_STATS_MAX_STALENESS=30)
+    service = AdminService()
+
+    assert service.get_admin_dashboard()['system_stats']['total_users'] == 1
+
+    # Dashboard entry still fresh, stats snapshot expired
+    from website.modules import Cache
+    Cache.delete(service.admin_repo.SYSTEM_STATS_CACHE_KEY)
+
+    with count_queries() as statements:
+        dashboard = service.get_admin_dashboard()
+
+    assert len(statements) == 1
+    assert dashboard['system_stats']['total_users'] == 1
+    assert 'revenue_stats' in dashboard
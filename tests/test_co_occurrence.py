@@ -0,0 +1,145 @@
+import math
+import random
+from decimal import Decimal
+
+import pytest
+
+from database import db
+from website.models import Order, OrderItem, OrderStatus, OrderType
+from website.modules import Recommender
+from website.modules.recommendations.co_occurrence import CoOccurrence
+
+
+def random_baskets(count, items=30, seed=7):
+    generator = random.Random(seed)
+    # Skewed popularity so some items pair often and others rarely
+    weights = [1 / (rank + 1) for rank in range(items)]
+    return [
+        generator.choices(range(1, items + 1), weights=weights, k=generator.randint(1, 6))
+        for _ in range(count)
+    ]
+
+
+def full_build(baskets, **options):
+    matrix = CoOccurrence(**options)
+    for basket in baskets:
+        matrix.add_basket(basket)
+    matrix.refresh_neighbors()
+    return matrix
+
+
+def test_add_basket_counts_distinct_items_and_pairs():
+    matrix = CoOccurrence()
+
+    matrix.add_basket([1, 2, 2, 3])
+    matrix.add_basket([2, 3])
+    matrix.add_basket([])
+
+    assert matrix.orders == 2
+    assert matrix.baskets == {1: 1, 2: 2, 3: 2}
+    assert matrix.pairs[2][3] == matrix.pairs[3][2] == 2
+    assert matrix.pairs[1] == {2: 1, 3: 1}
+    assert matrix.stats() == {'orders': 2, 'items': 3, 'pairs': 3, 'served_items': 0}
+
+
+def test_oversized_baskets_count_items_but_not_pairs():
+    matrix = CoOccurrence()
+
+    matrix.add_basket(range(CoOccurrence.MAX_BASKET + 1))
+
+    assert len(matrix) == CoOccurrence.MAX_BASKET + 1
+    assert matrix.pairs == {}
+
+
+def test_refresh_ranks_by_cosine_above_min_support():
+    matrix = CoOccurrence(min_support=2)
+    for basket in ([1, 2], [1, 2], [1, 3], [1, 3], [1, 3], [3], [3], [1, 4]):
+        matrix.add_basket(basket)
+
+    assert matrix.refresh_neighbors() == 4
+    assert matrix.refresh_neighbors() == 0
+
+    # 1 is in 6 orders, 2 in 2, 3 in 5: 2/sqrt(12) beats 3/sqrt(30)
+    assert matrix.neighbors[1] == [(2, round(2 / math.sqrt(12), 4)), (3, round(3 / math.sqrt(30), 4))]
+    assert matrix.related(1) == [2, 3]
+    assert matrix.related(1, limit=1) == [2]
+    # 1-4 was seen once, below min_support
+    assert 4 not in matrix.neighbors
+    assert matrix.score(1, 4) == 0.0
+
+
+def test_for_basket_sums_scores_and_excludes_the_basket():
+    matrix = full_build([[1, 2, 3]] * 3 + [[2, 4]] * 2 + [[3, 4]] * 2 + [[1, 5]] * 2)
+
+    suggestions = matrix.for_basket([2, 3])
+
+    assert 2 not in suggestions and 3 not in suggestions
+    # 1 pairs with both basket items, 4 with both but less often, 5 with neither
+    assert suggestions == [1, 4]
+    assert matrix.for_basket([2, 3], limit=1) == [1]
+    assert matrix.for_basket([99]) == []
+
+
+@pytest.mark.parametrize("batch_size", [1, 7, 50])
+def test_incremental_refresh_matches_full_rebuild(batch_size):
+    baskets = random_baskets(400)
+    options = {'top_k': 3, 'min_support': 3}
+
+    incremental = CoOccurrence(**options)
+    for start in range(0, len(baskets), batch_size):
+        for basket in baskets[start:start + batch_size]:
+            incremental.add_basket(basket)
+        incremental.refresh_neighbors()
+
+    rebuilt = full_build(baskets, **options)
+
+    assert rebuilt.neighbors
+    assert incremental.neighbors == rebuilt.neighbors
+    for basket in baskets[:20]:
+        assert incremental.for_basket(basket) == rebuilt.for_basket(basket)
+
+
+def test_refresh_reranks_neighbors_of_touched_items():
+    matrix = full_build([[1, 2]] * 2 + [[1, 3]] * 2)
+    assert matrix.neighbors[2] == [(1, round(2 / math.sqrt(4 * 2), 4))]
+
+    # Only 1 is added, but 2's score shares 1's basket count
+    matrix.add_basket([1])
+    assert matrix.refresh_neighbors() == 3
+    assert matrix.neighbors[2] == [(1, round(2 / math.sqrt(5 * 2), 4))]
+
+
+def place_baskets(baskets, start=0, status=OrderStatus.COMPLETED):
+    for number, basket in enumerate(baskets, start=start):
+        order = Order(
+            order_number=f"BR-C{number}",
+            total_amount=Decimal("0"),
+            order_type=OrderType.TAKEOUT,
+            status=status
+        )
+        for item in basket:
+            order.order_items.append(
+                OrderItem(food_item_id=item.id, quantity=1, unit_price=item.price, subtotal=item.price)
+            )
+        db.session.add(order)
+    db.session.commit()
+
+
+def test_recommender_refresh_matches_rebuild(menu, monkeypatch):
+    for name in ("_matrix", "_last_order_id", "_built_at", "_refreshed_at"):
+        monkeypatch.setattr(Recommender, name, getattr(Recommender, name))
+
+    place_baskets([[menu[0], menu[1]], [menu[0], menu[1]], [menu[2], menu[3]]])
+    place_baskets([[menu[0], menu[4]]] * 3, start=10, status=OrderStatus.CANCELLED)
+    Recommender.rebuild()
+    assert Recommender.related(menu[0].id) == [menu[1].id]
+
+    place_baskets([[menu[0], menu[2]], [menu[0], menu[2]], [menu[2], menu[3]]], start=20)
+    assert Recommender.refresh() > 0
+    refreshed = Recommender._matrix.neighbors
+
+    # Cancelled orders never count
+    assert menu[4].id not in Recommender.for_basket([menu[0].id])
+    assert Recommender.for_basket([menu[0].id]) == [menu[1].id, menu[2].id]
+
+    assert Recommender.rebuild().neighbors == refreshed
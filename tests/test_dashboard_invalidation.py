@@ -0,0 +1,38 @@
+from database import db
+from website.models import Favorite, Order, OrderItem, OrderType
+from website.modules import CatalogCache
+from website.services import DashboardService
+
+
+def test_user_changes_refresh_user_and_points(customer_user):
+    service = DashboardService()
+    service.get_dashboard_data(customer_user.id)
+
+    customer_user.first_name = "Grace"
+    customer_user.points_balance = 120
+    db.session.commit()
+
+    dashboard = service.get_dashboard_data(customer_user.id)
+
+    assert dashboard['user']['first_name'] == "Grace"
+    assert dashboard['points']['points_balance'] == 120
+
+
+def test_catalog_edits_refresh_sections_with_food_items(customer_user, menu):
+    item = menu[0]
+    order = Order(order_number="BR-C1", total_amount=0, order_type=OrderType.TAKEOUT, customer_id=customer_user.id)
+    order.order_items.append(OrderItem(food_item_id=item.id, quantity=1, unit_price=item.price))
+    db.session.add_all([order, Favorite(user_id=customer_user.id, food_item_id=item.id)])
+    db.session.commit()
+
+    service = DashboardService()
+    service.get_dashboard_data(customer_user.id)
+
+    item.name = "Renamed"
+    db.session.commit()
+    CatalogCache.invalidate()
+
+    dashboard = service.get_dashboard_data(customer_user.id)
+
+    assert dashboard['favorites'][0]['name'] == "Renamed"
+    assert dashboard['recent_orders'][0]['items'][0]['name'] == "Renamed"
@@ -0,0 +1,86 @@
+from decimal import Decimal
+
+from database import db
+from website.models import Order, OrderItem, OrderStatus, OrderType, Favorite, Review
+from website.services import DashboardService
+
+
+# A cold dashboard build must stay within this many statements
+MAX_DASHBOARD_QUERIES = 5
+
+
+def place_orders(user, items, prefix="BR-T"):
+    statuses = [OrderStatus.COMPLETED] * 6 + [OrderStatus.PENDING, OrderStatus.PREPARING, OrderStatus.CANCELLED]
+    orders = []
+    for number, status in enumerate(statuses):
+        order = Order(
+            order_number=f"{prefix}{number}",
+            total_amount=Decimal("0"),
+            order_type=OrderType.TAKEOUT,
+            customer_id=user.id,
+            status=status
+        )
+        for item in items[:2]:
+            order.order_items.append(
+                OrderItem(food_item_id=item.id, quantity=2, unit_price=item.price, subtotal=item.price * 2)
+            )
+        db.session.add(order)
+        orders.append(order)
+    db.session.commit()
+    return orders
+
+
+def test_cold_dashboard_build_uses_fixed_number_of_queries(customer_user, menu, count_queries):
+    orders = place_orders(customer_user, menu)
+    db.session.add_all([Favorite(user_id=customer_user.id, food_item_id=item.id) for item in menu[:3]])
+    db.session.add_all([
+        Review(user_id=customer_user.id, food_item_id=item.id, order_id=orders[0].id, rating=4)
+        for item in menu[:2]
+    ])
+    db.session.commit()
+    user_id = customer_user.id
+    db.session.expire_all()
+
+    with count_queries() as statements:
+        dashboard = DashboardService().get_dashboard_data(user_id)
+
+    assert len(statements) <= MAX_DASHBOARD_QUERIES, "\n\n".join(statements)
+
+    assert dashboard['user']['id'] == user_id
+    assert len(dashboard['recent_orders']) == 5
+    assert {order['status'] for order in dashboard['active_orders']} == {'pending', 'preparing'}
+    assert len(dashboard['favorites']) == 3
+    assert len(dashboard['reviews']) == 2
+    assert dashboard['metrics']['favorites_count'] == 3
+
+
+def test_query_count_does_not_grow_with_history(customer_user, menu, count_queries):
+    place_orders(customer_user, menu)
+    user_id = customer_user.id
+    db.session.expire_all()
+
+    with count_queries() as few:
+        DashboardService()._build_dashboard_data(user_id)
+
+    for batch in range(5):
+        place_orders(customer_user, menu, prefix=f"BR-H{batch}-")
+    DashboardService.invalidate_dashboard(user_id)
+    db.session.expire_all()
+
+    with count_queries() as many:
+        DashboardService()._build_dashboard_data(user_id)
+
+    assert len(many) == len(few)
+
+
+def test_warm_dashboard_build_uses_no_queries(customer_user, menu, count_queries):
+    place_orders(customer_user, menu)
+    user_id = customer_user.id
+    service = DashboardService()
+    service.get_dashboard_data(user_id)
+    db.session.expire_all()
+
+    with count_queries() as statements:
+        service.get_dashboard_data(user_id)
+
+    assert statements == []
@@ -0,0 +1,127 @@
+from database import db
+from website.modules import FacetIndex
+from website.services import MenuService
+
+
+def make_item(item_id, category_id, price, rating=0.0, allergen_free=True, is_available=True):
+    return {
+        'id': item_id,
+        'category': {'id': category_id},
+        'price': price,
+        'rating': {'average': rating},
+        'allergen_free': allergen_free,
+        'is_available': is_available
+    }
+
+
+def build_facets():
+    items = [
+        make_item(1, 1, 4.0, rating=4.5),
+        make_item(2, 1, 12.0, rating=3.2, allergen_free=False),
+        make_item(3, 2, 8.0, rating=2.0),
+        make_item(4, 2, 25.0, rating=4.1, is_available=False),
+        make_item(5, 3, 15.0)
+    ]
+    return FacetIndex(items, price_edges=(10, 20))
+
+
+def ids(facets, bits):
+    return [item['id'] for item in facets.select(bits)]
+
+
+def test_price_bands_from_edges():
+    facets = build_facets()
+
+    assert [band for band, _, _ in facets.price_bands] == ["0-10", "10-20", "20+"]
+    assert facets.price_band(10) == "10-20"
+    assert facets.price_band(None) is None
+
+
+def test_mask_ors_values_and_ands_facets():
+    facets = build_facets()
+
+    assert ids(facets, facets.mask({})) == [1, 2, 3, 4, 5]
+    assert ids(facets, facets.mask({'category': [1, 3]})) == [1, 2, 5]
+    assert ids(facets, facets.mask({'category': [1, 3], 'price': "10-20"})) == [2, 5]
+    assert ids(facets, facets.mask({'rating': 4, 'available': True})) == [1]
+    assert ids(facets, facets.mask({'allergen_free': True, 'price': ["0-10", "20+"]})) == [1, 3, 4]
+    # None/empty means no filter, unknown values match nothing
+    assert facets.mask({'category': None, 'price': []}) == facets.all
+    assert facets.mask({'category': 99}) == 0
+
+
+def test_mask_within_and_skip():
+    facets = build_facets()
+    within = facets.bits_for([2, 3, 42])
+
+    assert ids(facets, within) == [2, 3]
+    assert ids(facets, facets.mask({'category': 1}, within)) == [2]
+    assert ids(facets, facets.mask({'category': 1, 'price': "0-10"}, skip='category')) == [1, 3]
+
+
+def test_counts_ignore_the_facets_own_selection():
+    facets = build_facets()
+    selected = {'category': 1, 'price': "0-10", 'available': True}
+
+    counts = facets.counts(selected)
+
+    # Categories are counted under price + availability only
+    assert counts['category'] == {1: 1, 2: 1, 3: 0}
+    # Prices under category + availability only
+    assert counts['price'] == {"0-10": 1, "10-20": 1, "20+": 0}
+    # Availability under category + price only
+    assert counts['available'] == {True: 1, False: 0}
+    assert counts['rating'] == {4: 1, 3: 1, 2: 1, 1: 1}
+    assert counts['allergen_free'] == {True: 1}
+
+
+def test_counts_within_search_results():
+    facets = build_facets()
+
+    counts = facets.counts({'price': "10-20"}, within=facets.bits_for([2, 3]))
+
+    assert counts['category'] == {1: 1, 2: 0, 3: 0}
+    assert counts['price'] == {"0-10": 1, "10-20": 1, "20+": 0}
+
+
+def test_select_follows_ranked_ids():
+    facets = build_facets()
+    bits = facets.mask({'category': [1, 2]})
+
+    assert [item['id'] for item in facets.select(bits, ranked_ids=[3, 5, 1, 42])] == [3, 1]
+
+
+def test_menu_search_combined_with_filters(menu, monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    menu[4].is_available = False
+    db.session.commit()
+    service = MenuService()
+
+    # Prices are 5..10; item 5 is the only one in "10-20"
+    data = service.get_menu_data(search="item", price_bands=["0-10"])
+    assert [item['id'] for item in data['items']] == [menu[i].id for i in (0, 1, 2, 3)]
+
+    data = service.get_menu_data(search="item", category_id=menu[1].category_id)
+    assert [item['id'] for item in data['items']] == [menu[1].id]
+
+    data = service.get_menu_data(search="item 3 description", category_id=menu[0].category_id)
+    assert [item['id'] for item in data['items']] == [menu[3].id]
+
+    data = service.get_menu_data(search="item", category_id=menu[2].category_id, price_bands=["0-10"])
+    assert [item['id'] for item in data['items']] == [menu[2].id]
+    assert data['pagination']['total'] == 1
+
+    facets = data['facets']
+    # Category counts keep the price filter but not the category choice
+    assert {category['id']: category['count'] for category in facets['categories']} == {
+        menu[0].category_id: 2, menu[1].category_id: 1, menu[2].category_id: 1
+    }
+    # Price counts keep the category choice but not the price filter
+    assert {band['value']: band['count'] for band in facets['price_bands']} == {
+        "0-10": 1, "10-20": 1, "20-30": 0, "30+": 0
+    }
+    assert facets['sold_out']['count'] == 0
+
+    data = service.get_menu_data(search="nothing like this")
+    assert data['items'] == []
+    assert [category['count'] for category in data['facets']['categories']] == [0, 0, 0]
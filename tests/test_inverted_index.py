@@ -0,0 +1,137 @@
+from database import db
+from website.modules.search.index_backend import IndexSearch
+from website.modules.search.inverted_index import InvertedIndex
+from website.repositories import FoodItemRepository
+
+
+def build_index():
+    index = InvertedIndex()
+    index.add(1, {'name': "Buttermilk Pancakes", 'description': "Stack of three with maple syrup"})
+    index.add(2, {'name': "Crème Brûlée", 'description': "Vanilla custard"})
+    index.add(3, {'name': "Spanish Omelette", 'ingredients': ["egg", "potato"]})
+    index.add(4, {'name': "Fruit Bowl", 'description': "Served with pancakes on request"})
+    index.add(5, {'name': "Chai", 'category': "Drinks"})
+    index.add(6, {'name': "Chat Platter", 'category': "Sharing"})
+    return index
+
+
+def ids(results):
+    return [doc_id for doc_id, _ in results]
+
+
+def test_exact_and_prefix_matching():
+    index = build_index()
+
+    assert ids(index.search("omelette")) == [3]
+    assert ids(index.search("butter")) == [1]
+    # Every token has to match
+    assert ids(index.search("spanish pot")) == [3]
+    assert index.search("spanish pancakes") == []
+    # Single characters are not expanded as prefixes
+    assert index.search("b") == []
+
+
+def test_accents_are_folded_both_ways():
+    index = build_index()
+
+    assert ids(index.search("creme brulee")) == [2]
+    assert ids(index.search("CRÈME")) == [2]
+    assert InvertedIndex.tokenize("Crème Brûlée") == ["creme", "brulee"]
+
+
+def test_typos_match_when_nothing_else_does():
+    index = build_index()
+
+    # Transposition and deletion, one edit each
+    assert ids(index.search("pancaeks")) == [1, 4]
+    assert ids(index.search("omlette")) == [3]
+    # Too short for typo matching
+    assert index.search("chi") == []
+    # An exact match suppresses typo candidates ("chai" is one edit from "chat")
+    assert ids(index.search("chai")) == [5]
+
+
+def test_ranking_prefers_name_fields_then_exact_terms():
+    index = build_index()
+
+    # Name weight beats a description mention of the same term
+    assert ids(index.search("pancakes")) == [1, 4]
+
+    # An exact term beats a prefix match of a longer one
+    index.add(7, {'name': "Pan Fried Eggs"})
+    results = index.search("pan")
+    assert results[0][0] == 7
+    assert set(ids(results)) == {1, 4, 7}
+    assert results == sorted(results, key=lambda pair: -pair[1])
+
+
+def test_remove_drops_postings_and_vocabulary():
+    index = build_index()
+
+    assert index.remove(2) is True
+    assert index.remove(2) is False
+    assert 2 not in index
+    assert len(index) == 5
+    assert index.search("creme") == []
+    assert index.terms_with_prefix("bru") == []
+    assert "custard" not in index.postings
+
+    # Re-adding an id replaces its terms
+    index.add(1, {'name': "Waffles"})
+    assert ids(index.search("pancakes")) == [4]
+    assert ids(index.search("waff")) == [1]
+
+
+def test_copy_is_independent():
+    index = build_index()
+    clone = index.copy()
+
+    clone.remove(3)
+    clone.add(8, {'name': "Omelette Wrap"})
+
+    assert ids(index.search("omelette")) == [3]
+    assert ids(clone.search("omelette")) == [8]
+
+
+def test_index_search_refresh_patches_a_copy(menu):
+    version = {'value': 1}
+    backend = IndexSearch(
+        loader=lambda item_ids: FoodItemRepository().find_search_documents(item_ids),
+        version=lambda: version['value']
+    )
+
+    assert backend.search("item 3") == [menu[3].id]
+    assert backend.search("category 1") == sorted([menu[1].id, menu[4].id])
+    before = backend._index
+
+    menu[3].name = "Masala Chai"
+    menu[4].is_available = False
+    db.session.commit()
+    version['value'] = 2
+    backend.refresh_items([menu[3].id, menu[4].id], previous_version=1, version=2)
+
+    assert backend._index is not before
+    assert backend.builds == 1
+    assert backend.search("masala") == [menu[3].id]
+    assert backend.search("category 1") == [menu[1].id]
+    # Readers holding the old index still see the old catalog
+    assert ids(before.search("item 3")) == [menu[3].id]
+    assert ids(before.search("masala")) == []
+
+
+def test_index_search_rebuilds_after_a_missed_version(menu):
+    version = {'value': 1}
+    backend = IndexSearch(
+        loader=lambda item_ids: FoodItemRepository().find_search_documents(item_ids),
+        version=lambda: version['value']
+    )
+    backend.warm()
+
+    menu[0].name = "Shakshuka"
+    db.session.commit()
+    version['value'] = 3
+    # Another worker bumped to 2 first: this patch is skipped
+    backend.refresh_items([menu[0].id], previous_version=2, version=3)
+
+    assert backend.search("shakshuka") == [menu[0].id]
+    assert backend.builds == 2
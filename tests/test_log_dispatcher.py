@@ -0,0 +1,46 @@
+import os
+from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler, WatchedFileHandler
+
+import pytest
+
+from utils.log_dispatcher import _RoutingHandler
+
+
+@pytest.fixture
+def routing(monkeypatch):
+    for name in ("LOG_ROTATION", "LOG_ROTATE_WHEN"):
+        monkeypatch.delenv(name, raising=False)
+    handler = _RoutingHandler()
+    yield handler
+    handler.close()
+
+
+def test_shared_file_is_watched_by_default(routing, tmp_path):
+    path = str(tmp_path / "errors.log")
+
+    handler = routing._file_handler(path)
+
+    assert isinstance(handler, WatchedFileHandler)
+    assert handler.baseFilename == path
+
+
+@pytest.mark.parametrize("rotation, handler_class", [
+    ("size", RotatingFileHandler),
+    ("time", TimedRotatingFileHandler)
+])
+def test_in_process_rotation_uses_per_worker_files(routing, tmp_path, monkeypatch, rotation, handler_class):
+    monkeypatch.setenv("LOG_ROTATION", rotation)
+
+    handler = routing._file_handler(str(tmp_path / "errors.log"))
+
+    assert isinstance(handler, handler_class)
+    assert handler.baseFilename == str(tmp_path / f"errors.{os.getpid()}.log")
+
+
+def test_rotate_when_alone_keeps_time_rotation(routing, tmp_path, monkeypatch):
+    monkeypatch.setenv("LOG_ROTATE_WHEN", "H")
+
+    handler = routing._file_handler(str(tmp_path / "errors.log"))
+
+    assert isinstance(handler, TimedRotatingFileHandler)
+    assert handler.when == "H"
@@ -0,0 +1,155 @@
+import json
+import os
+import stat
+import threading
+import time
+
+import pytest
+
+from utils import FakeSMTPServer, MailManager, MailQueue
+from utils.log_dispatcher import LogDispatcher
+from utils.smtp_pool import SMTPPool
+
+
+@pytest.fixture
+def spool(tmp_path, monkeypatch):
+    root = tmp_path / "spool" / "mail"
+    monkeypatch.setenv("MAIL_SPOOL_DIR", str(root))
+    return root
+
+
+def mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+def test_spool_is_owner_only(spool):
+    spool.mkdir(parents=True, mode=0o755)
+
+    MailQueue._make_spool()
+    MailQueue._write(MailQueue._path("pending", "m1"), {"id": "m1", "kwargs": {"body": "Code: 123456"}})
+
+    assert mode(spool) == 0o700
+    for folder in ("pending", "active", "failed"):
+        assert mode(spool / folder) == 0o700
+    assert mode(spool / "pending" / "m1.json") == 0o600
+
+
+def test_old_failed_messages_expire(spool, monkeypatch):
+    monkeypatch.setenv("MAIL_FAILED_RETENTION", "60")
+    MailQueue._make_spool()
+
+    old = MailQueue._path("failed", "old")
+    recent = MailQueue._path("failed", "recent")
+    MailQueue._write(old, {"id": "old"})
+    MailQueue._write(recent, {"id": "recent"})
+    os.utime(old, (time.time() - 120, time.time() - 120))
+
+    MailQueue._expire_failed()
+
+    assert not os.path.exists(old)
+    assert os.path.exists(recent)
+
+
+# Delivery (against the in-process SMTP stand-in)
+
+@pytest.fixture
+def smtp(spool, tmp_path, monkeypatch):
+    # errhandler/syshandler write logs/ relative to the working directory
+    monkeypatch.chdir(tmp_path)
+
+    with FakeSMTPServer() as server:
+        monkeypatch.setenv("MAIL_SERVER", server.host)
+        monkeypatch.setenv("MAIL_PORT", str(server.port))
+        monkeypatch.setenv("MAIL_QUEUE_WORKERS", "1")
+        monkeypatch.setenv("MAIL_QUEUE_POLL_INTERVAL", "0.02")
+        monkeypatch.setenv("MAIL_RETRY_BACKOFF", "0.1")
+        monkeypatch.setenv("MAIL_MAX_RETRIES", "3")
+        yield server
+
+        MailQueue.stop()
+        SMTPPool.close_all()
+        LogDispatcher.flush()
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_enqueue_returns_before_smtp(smtp, monkeypatch):
+    release = threading.Event()
+    deliver = MailManager.deliver
+
+    def held_deliver(*args, **kwargs):
+        release.wait(5)
+        deliver(*args, **kwargs)
+
+    monkeypatch.setattr(MailManager, "deliver", staticmethod(held_deliver))
+
+    assert MailQueue.enqueue("ada@example.com", "Your code", body="Code: 123456")
+
+    # Spooled and handed to a worker, but nothing sent yet
+    assert smtp.messages == []
+    assert sum(MailQueue.depth().values()) == 1
+
+    release.set()
+    assert MailQueue.join()
+    assert [message["Subject"] for message in smtp.messages] == ["Your code"]
+
+
+def test_worker_delivers_message(smtp):
+    assert MailQueue.enqueue("ada@example.com", "Welcome", body="Hello Ada")
+
+    assert MailQueue.join()
+    assert smtp.envelopes[0]["to"] == ["ada@example.com"]
+    assert smtp.messages[0].get_content().strip() == "Hello Ada"
+    assert MailQueue.depth() == {"pending": 0, "active": 0, "failed": 0}
+
+
+def test_failed_sends_back_off_then_land_in_failed(smtp, spool, monkeypatch):
+    attempts = []
+    deliver = MailManager.deliver
+
+    def timed_deliver(*args, **kwargs):
+        attempts.append(time.monotonic())
+        deliver(*args, **kwargs)
+
+    monkeypatch.setattr(MailManager, "deliver", staticmethod(timed_deliver))
+    smtp.fail_next(3)
+
+    assert MailQueue.enqueue("ada@example.com", "Receipt", body="Thanks")
+    assert wait_for(lambda: MailQueue.depth()["failed"] == 1)
+
+    assert smtp.messages == []
+    assert len(attempts) == 3
+    # Backoff 0.1s, then 0.2s
+    assert attempts[1] - attempts[0] >= 0.1
+    assert attempts[2] - attempts[1] >= 0.2
+
+    message = json.loads(next((spool / "failed").iterdir()).read_text())
+    assert message["attempts"] == 3
+    assert message["last_error"].startswith("SMTP")
+
+
+def test_spooled_message_is_sent_after_restart(smtp):
+    # Spooled by a process that stopped before sending it
+    MailQueue._write(MailQueue._path("pending", "m1"), {
+        "id": "m1",
+        "recipient": "ada@example.com",
+        "subject": "Left behind",
+        "kwargs": {"body": "Still here"},
+        "attempts": 0,
+        "next_attempt_at": 0,
+        "last_error": None
+    })
+
+    MailQueue.start()
+
+    assert wait_for(lambda: len(smtp.messages) == 1)
+    assert smtp.messages[0]["Subject"] == "Left behind"
+    assert wait_for(lambda: MailQueue.depth()["pending"] == 0)
@@ -0,0 +1,67 @@
+import json
+import os
+import time
+
+import pytest
+
+from website.modules import Metrics
+
+
+@pytest.fixture
+def metrics_app(app, tmp_path, monkeypatch):
+    app.config.update(METRICS_DIR=str(tmp_path), METRICS_FLUSH_INTERVAL=5)
+    monkeypatch.setattr(Metrics, "_app", app)
+    monkeypatch.setattr(Metrics, "_pid", None)
+    monkeypatch.setattr(Metrics, "_mail_queue_depth", staticmethod(lambda: {}))
+    monkeypatch.setattr(Metrics, "_collect_gauges", classmethod(lambda cls: None))
+    return app
+
+
+def write_snapshot(directory, pid, value, written_at, started_at=1.0):
+    with open(os.path.join(directory, f"metrics-{pid}.json"), "w") as f:
+        json.dump({
+            'pid': pid,
+            'started_at': started_at,
+            'written_at': written_at,
+            'counters': [["orders_created_total", [["type", "takeout"]], value]],
+            'histograms': [],
+            'gauges': [["db_pool_size", [], 10]]
+        }, f)
+
+
+def orders_total(body):
+    line = next(line for line in body.splitlines() if line.startswith("breakfast_bar_orders_created_total"))
+    return float(line.rsplit(" ", 1)[1])
+
+
+def test_exited_worker_files_are_archived(metrics_app, tmp_path):
+    write_snapshot(tmp_path, 999001, 3, written_at=time.time() - 3600)
+    write_snapshot(tmp_path, 999002, 4, written_at=time.time())
+
+    assert orders_total(Metrics.render()) == 7
+    assert not (tmp_path / "metrics-999001.json").exists()
+    assert (tmp_path / "metrics-999002.json").exists()
+
+    # Archived totals keep counting on later scrapes
+    assert orders_total(Metrics.render()) == 7
+
+
+def test_reused_pid_keeps_previous_totals(metrics_app, tmp_path):
+    write_snapshot(tmp_path, os.getpid(), 5, written_at=time.time(), started_at=1.0)
+
+    Metrics.inc("orders_created_total", type="takeout")
+
+    assert orders_total(Metrics.render()) == 6
+
+
+def test_scrape_needs_token_outside_debug(metrics_app):
+    from website.routes.metrics import metrics
+
+    metrics_app.register_blueprint(metrics)
+    client = metrics_app.test_client()
+
+    assert client.get("/metrics").status_code == 404
+
+    metrics_app.config["METRICS_TOKEN"] = "secret"
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer secret"}).status_code == 200
@@ -0,0 +1,43 @@
+from decimal import Decimal
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from database import db
+
+
+def test_order_events_issue_constant_statements_per_flush(app):
+    from website.models import events, events_benchmark
+
+    rows = events_benchmark.run(sizes=(5, 50, 500), rounds=1)
+
+    per_scenario = {}
+    for row in rows:
+        per_scenario.setdefault(row['scenario'], set()).add(row['event_statements'])
+    assert per_scenario == {'insert': {2}, 'update_all': {2}, 'update_one': {2}}
+
+    # The real listeners are back once the benchmark is done
+    assert event.contains(Session, 'before_flush', events.track_order_item_changes)
+    assert event.contains(Session, 'after_flush', events.reconcile_order_totals)
+
+
+def stored_total(order):
+    from website.models import Order
+    return db.session.execute(select(Order.total_amount).where(Order.id == order.id)).scalar_one()
+
+
+def test_flushed_totals_match_the_database(menu):
+    from website.models import Order, OrderItem, OrderType
+
+    order = Order(order_number="BR-R1", total_amount=0, order_type=OrderType.TAKEOUT)
+    order.order_items.append(OrderItem(food_item_id=menu[0].id, quantity=2, unit_price=Decimal("5.00")))
+    db.session.add(order)
+    db.session.flush()
+
+    # New order flushed together with its items
+    assert order.total_amount == stored_total(order) == Decimal("10.00")
+
+    order.order_items.append(OrderItem(food_item_id=menu[1].id, quantity=1, unit_price=Decimal("6.00")))
+    db.session.flush()
+
+    assert order.total_amount == stored_total(order) == Decimal("16.00")
@@ -0,0 +1,28 @@
+from decimal import Decimal
+
+import pytest
+
+from database import db
+from website.models import Order, OrderItem, OrderSequence, OrderType
+from website.models.order_service import OrderService
+
+
+def test_create_order_inserts_items_and_total(menu):
+    order = OrderService().create_order(
+        customer_id=None,
+        items=[{'food_item_id': menu[0].id, 'quantity': 2}, {'food_item_id': menu[1].id, 'quantity': 1}],
+        order_type=OrderType.TAKEOUT
+    )
+
+    assert order.total_amount == Decimal("16.00")
+    assert db.session.query(OrderItem).filter_by(order_id=order.id).count() == 2
+    assert db.session.query(OrderSequence).count() == 1
+
+
+def test_create_order_rejects_empty_items(menu):
+    with pytest.raises(ValueError):
+        OrderService().create_order(customer_id=None, items=[], order_type=OrderType.TAKEOUT)
+
+    db.session.rollback()
+    assert db.session.query(Order).count() == 0
+    assert db.session.query(OrderSequence).count() == 0
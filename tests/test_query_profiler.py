@@ -0,0 +1,20 @@
+from database import db
+from website.modules import QueryProfiler
+
+
+def test_queries_before_profiling_starts_do_not_leak_timestamps(app):
+    # Registered ahead of QueryProfiler._start_request, so g has no counter yet
+    app.before_request(lambda: db.session.execute(db.text("SELECT 1")) and None)
+    QueryProfiler.init_app(app)
+
+    @app.route("/probe")
+    def probe():
+        db.session.execute(db.text("SELECT 2"))
+        return str(QueryProfiler.stats()['query_count'])
+
+    client = app.test_client()
+    for _ in range(3):
+        assert client.get("/probe").get_data(as_text=True) == "1"
+
+    with db.engine.connect() as connection:
+        assert not connection.info.get("query_started")
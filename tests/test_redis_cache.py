@@ -0,0 +1,67 @@
+import time
+
+import pytest
+
+from website.modules.cache import FakeRedisServer, RedisCache
+
+
+@pytest.fixture
+def server():
+    with FakeRedisServer() as server:
+        yield server
+
+
+@pytest.fixture
+def cache(server):
+    return RedisCache(url=server.url, key_prefix="bb:")
+
+
+def test_get_set_round_trips_values(cache):
+    assert cache.get("menu") is None
+    assert cache.set("menu", {'items': [1, 2, 3]})
+    assert cache.get("menu") == {'items': [1, 2, 3]}
+    assert cache.ping()
+
+
+def test_values_expire_after_timeout(cache):
+    cache.set("short", "value", timeout=1)
+    cache.set("forever", "value", timeout=0)
+
+    time.sleep(1.1)
+
+    assert cache.get("short") is None
+    assert cache.get("forever") == "value"
+
+
+def test_delete_and_prefix_clear(server, cache):
+    other = RedisCache(url=server.url, key_prefix="other:")
+    cache.set("a", 1)
+    cache.set("b", 2)
+    other.set("a", 3)
+
+    assert cache.delete("a")
+    assert not cache.delete("a")
+    assert cache.get("a") is None
+
+    # With a prefix, clear() deletes only this backend's keys (KEYS bb:*)
+    assert cache.clear()
+    assert cache.get("b") is None
+    assert other.get("a") == 3
+
+
+def test_reconnects_after_server_drops_connection(server, cache):
+    cache.set("key", "value")
+    assert server.disconnect_clients() == 1
+
+    # First attempt hits the dead socket; the retry uses a fresh connection
+    assert cache.get("key") == "value"
+    assert cache.set("key", "new")
+    assert cache.get("key") == "new"
+
+
+def test_unreachable_server_degrades_to_miss(server):
+    cache = RedisCache(url=server.url)
+    server.stop()
+
+    assert cache.get("key") is None
+    assert cache.set("key", "value") is False
@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from database import db
+from website.models import Order, OrderType, Review
+from website.repositories import ReviewRepository
+from website.services import MenuService
+
+
+def add_reviews(user, menu):
+    """Eleven reviews of menu[0], with runs of equal timestamps, and one of menu[1]"""
+    order = Order(
+        order_number="BR-R1",
+        total_amount=Decimal("0"),
+        order_type=OrderType.TAKEOUT,
+        customer_id=user.id
+    )
+    db.session.add(order)
+    db.session.flush()
+
+    noon = datetime(2024, 5, 1, 12, 0, 0)
+    offsets = [0, 0, 0, 0, 1, 1, 2, 2, 2, 3, 5]
+    reviews = [
+        Review(
+            user_id=user.id,
+            food_item_id=menu[0].id,
+            order_id=order.id,
+            rating=1 + position % 5,
+            comment=f"Review {position}",
+            created_at=noon - timedelta(hours=offset)
+        )
+        for position, offset in enumerate(offsets)
+    ]
+    reviews.append(Review(
+        user_id=user.id, food_item_id=menu[1].id, order_id=order.id, rating=5, created_at=noon
+    ))
+    db.session.add_all(reviews)
+    db.session.commit()
+
+    return sorted(
+        (review for review in reviews if review.food_item_id == menu[0].id),
+        key=lambda review: (review.created_at, review.id),
+        reverse=True
+    )
+
+
+def test_cursor_pages_cover_every_review_once_across_ties(customer_user, menu):
+    expected = [review.id for review in add_reviews(customer_user, menu)]
+    repo = ReviewRepository()
+
+    # Page sizes that split every run of equal timestamps
+    for per_page in (1, 2, 3, 4):
+        seen, cursor, pages = [], None, 0
+        while True:
+            page = repo.find_by_food_item(menu[0].id, per_page=per_page, cursor=cursor)
+            seen += [review.id for review in page]
+            pages += 1
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert seen == expected
+        assert pages == -(-len(expected) // per_page)
+
+
+def test_cursor_page_matches_offset_page(customer_user, menu):
+    add_reviews(customer_user, menu)
+    repo = ReviewRepository()
+
+    first = repo.find_by_food_item(menu[0].id, per_page=3)
+    second = repo.find_by_food_item(menu[0].id, per_page=3, cursor=first.next_cursor)
+
+    assert [review.id for review in second] == [
+        review.id for review in repo.find_by_food_item(menu[0].id, page=2, per_page=3)
+    ]
+
+
+def test_tampered_cursor_starts_from_the_first_page(customer_user, menu):
+    expected = [review.id for review in add_reviews(customer_user, menu)]
+    repo = ReviewRepository()
+
+    cursor = repo.find_by_food_item(menu[0].id, per_page=3).next_cursor
+    page = repo.find_by_food_item(menu[0].id, per_page=3, cursor=cursor[:-2] + "xx")
+
+    assert [review.id for review in page] == expected[:3]
+
+
+def test_item_reviews_follow_next_cursor(customer_user, menu):
+    expected = add_reviews(customer_user, menu)
+    service = MenuService()
+
+    first = service.get_item_reviews(menu[0].id, per_page=6)
+    last = service.get_item_reviews(menu[0].id, cursor=first['next_cursor'], per_page=6)
+
+    assert [review['comment'] for review in first['reviews'] + last['reviews']] == [
+        review.comment for review in expected
+    ]
+    assert first['reviews'][0]['user_name'] == "Ada Wanjiku"
+    assert last['next_cursor'] is None
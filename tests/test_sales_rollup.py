@@ -0,0 +1,93 @@
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+import pytest
+
+from database import db
+from website.models import DailySalesSummary, Order, OrderItem, OrderStatus, OrderType
+from website.repositories import AdminRepository, DateRange
+from website.services import AdminService
+
+
+@pytest.fixture
+def closed_day(app):
+    """A day before today, so reads come from daily_sales_summary"""
+    return DateRange.today() - timedelta(days=3)
+
+
+def place_order(menu, number, quantity=2):
+    order = Order(order_number=number, total_amount=0, order_type=OrderType.TAKEOUT)
+    order.order_items.append(OrderItem(food_item_id=menu[0].id, quantity=quantity, unit_price=Decimal("5.00")))
+    db.session.add(order)
+    db.session.commit()
+    return order
+
+
+def complete(order, day):
+    order.status = OrderStatus.COMPLETED
+    order.completed_at = datetime.combine(day, time(12, 0))
+    db.session.commit()
+
+
+def summary(day):
+    db.session.expire_all()
+    return db.session.query(DailySalesSummary).filter_by(date=day).one_or_none()
+
+
+def revenue(day):
+    return AdminRepository().get_revenue_stats(day, day)['total_revenue']
+
+
+def test_completing_an_order_rolls_up_its_day(menu, closed_day):
+    complete(place_order(menu, "BR-S1"), closed_day)
+    complete(place_order(menu, "BR-S2", quantity=1), closed_day)
+
+    row = summary(closed_day)
+    assert row.order_count == 2
+    assert row.total_revenue == Decimal("15.00")
+    assert revenue(closed_day) == 15.0
+
+
+def test_leaving_completed_removes_revenue(menu, closed_day):
+    order = place_order(menu, "BR-S1")
+    complete(order, closed_day)
+    assert revenue(closed_day) == 10.0
+
+    result = AdminService().update_order_status(order.id, OrderStatus.CANCELLED)
+
+    assert result.success
+    assert summary(closed_day).order_count == 0
+    assert revenue(closed_day) == 0.0
+    assert AdminRepository().get_daily_revenue(closed_day, closed_day) == []
+
+
+def test_deleting_a_completed_order_removes_revenue(menu, closed_day):
+    keep = place_order(menu, "BR-S1")
+    drop = place_order(menu, "BR-S2", quantity=1)
+    complete(keep, closed_day)
+    complete(drop, closed_day)
+
+    db.session.delete(drop)
+    db.session.commit()
+
+    assert summary(closed_day).order_count == 1
+    assert revenue(closed_day) == 10.0
+
+
+def test_rollup_sales_command_backfills_days(app, menu, closed_day, tmp_path, monkeypatch):
+    from website.commands import rollup_sales
+    from utils.log_dispatcher import LogDispatcher
+
+    # The rollup logs to logs/ under the working directory
+    monkeypatch.chdir(tmp_path)
+
+    complete(place_order(menu, "BR-S1"), closed_day)
+    db.session.query(DailySalesSummary).delete()
+    db.session.commit()
+
+    result = app.test_cli_runner().invoke(rollup_sales, ["--from", closed_day.isoformat()])
+
+    assert result.exit_code == 0, result.output
+    assert "Rolled up 1 day(s)" in result.output
+    assert summary(closed_day).total_revenue == Decimal("10.00")
+    LogDispatcher.flush()
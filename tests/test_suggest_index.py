@@ -0,0 +1,104 @@
+from database import db
+from website.modules.search.suggest_index import SuggestIndex
+from website.modules.search.suggester import Suggester
+from website.repositories import FoodItemRepository
+
+
+def build_index():
+    index = SuggestIndex()
+    index.add("item", 1, "Avocado Toast")
+    index.add("item", 2, "French Toast")
+    index.add("item", 3, "Toasted Sandwich")
+    index.add("item", 4, "Crème Brûlée")
+    index.add("category", 1, "Toasts")
+    return index
+
+
+def labels(suggestions):
+    return [suggestion['label'] for suggestion in suggestions]
+
+
+def test_lookup_matches_the_start_of_any_word():
+    index = build_index()
+
+    assert labels(index.lookup("avo")) == ["Avocado Toast"]
+    assert labels(index.lookup("french to")) == ["French Toast"]
+    assert index.lookup("oast") == []
+    assert index.lookup("  ") == []
+
+
+def test_lookup_ranks_whole_name_prefixes_then_items_then_shorter_names():
+    index = build_index()
+
+    assert index.lookup("toast") == [
+        {'type': 'item', 'id': 3, 'label': "Toasted Sandwich"},
+        {'type': 'category', 'id': 1, 'label': "Toasts"},
+        {'type': 'item', 'id': 2, 'label': "French Toast"},
+        {'type': 'item', 'id': 1, 'label': "Avocado Toast"}
+    ]
+    assert labels(index.lookup("toast", limit=2)) == ["Toasted Sandwich", "Toasts"]
+
+
+def test_lookup_folds_accents():
+    index = build_index()
+
+    assert labels(index.lookup("creme")) == ["Crème Brûlée"]
+    assert labels(index.lookup("BRÛ")) == ["Crème Brûlée"]
+
+
+def test_add_replaces_and_remove_drops_every_key():
+    index = build_index()
+
+    index.add("item", 2, "Egg Muffin")
+    assert labels(index.lookup("french")) == []
+    assert labels(index.lookup("muf")) == ["Egg Muffin"]
+
+    assert index.remove("item", 1) is True
+    assert index.remove("item", 1) is False
+    assert len(index) == 4
+    assert labels(index.lookup("avo")) == []
+    assert not any(key[2:] == ("item", 1) for key in index._keys)
+
+
+def test_suggester_refresh_swaps_in_a_patched_copy(menu):
+    version = {'value': 1}
+    suggester = Suggester(
+        items=lambda item_ids: FoodItemRepository().find_names(item_ids),
+        categories=lambda: [{'id': 1, 'name': "Category Items"}],
+        version=lambda: version['value']
+    )
+
+    assert labels(suggester.suggest("item 2")) == ["Item 2"]
+    before = suggester._index
+
+    menu[2].name = "Kenyan Tea"
+    menu[5].is_available = False
+    db.session.commit()
+    version['value'] = 2
+    suggester.refresh_items([menu[2].id, menu[5].id], previous_version=1, version=2)
+
+    assert suggester._index is not before
+    assert suggester.builds == 1
+    assert labels(suggester.suggest("ken")) == ["Kenyan Tea"]
+    assert labels(suggester.suggest("item")) == ["Item 0", "Item 1", "Item 3", "Item 4", "Category Items"]
+    # Lookups already holding the old index are unaffected
+    assert labels(before.lookup("item 2")) == ["Item 2"]
+    assert labels(before.lookup("ken")) == []
+
+
+def test_suggester_rebuilds_when_the_version_moves_elsewhere(menu):
+    version = {'value': 1}
+    suggester = Suggester(
+        items=lambda item_ids: FoodItemRepository().find_names(item_ids),
+        categories=lambda: [],
+        version=lambda: version['value']
+    )
+    suggester.warm()
+
+    menu[0].name = "Mandazi"
+    db.session.commit()
+    version['value'] = 3
+    suggester.refresh_items([menu[0].id], previous_version=2, version=3)
+
+    assert labels(suggester.suggest("mand")) == ["Mandazi"]
+    assert suggester.builds == 2
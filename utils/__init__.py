@@ -1,9 +1,13 @@
 from .terminal_messenger import TerminalMessenger
 from .time_utils import TimeUtils
 from .error_extractor import ErrorExtractor
+from .log_dispatcher import LogDispatcher
 from .error_handler import ErrorHandler
 from .sys_logger import SystemLogger
 from .mail_manager import MailManager
+from .smtp_pool import SMTPPool
+from .mail_queue import MailQueue
+from .fake_smtp_server import FakeSMTPServer
 from .file_zipper import FileZipper
 from .filename_manager import FilenameManager
 from .filing_manager import FilingManager
@@ -4,6 +4,7 @@ from .error_extractor import ErrorExtractor
 from .error_handler import ErrorHandler
 from .sys_logger import SystemLogger
 from .mail_manager import MailManager
+from .mail_queue import MailQueue
 from .file_zipper import FileZipper
 from .filename_manager import FilenameManager
 from .filing_manager import FilingManager
@@ -15,6 +16,8 @@ def error(e): return ErrorExtractor.error(e)
 def errhandler(e, log, **k): return ErrorHandler.errhandler(e, log, **k)
 def syshandler(m, log, **k): return SystemLogger.syshandler(m, log, **k)
 def mailer(r, s, **k): return MailManager.mailer(r, s, **k)
+def mailqueue(r, s, **k): return MailQueue.enqueue(r, s, **k)
+def bulkmailer(m): return MailManager.send_messages(m)
 def zipfilehandler(f, o, **k): return FileZipper.zipfilehandler(f, o, **k)
 def stripPrefix(f): return FilenameManager.stripPrefix(f)
 def cleanFilename(f): return FilenameManager.cleanFilename(f)
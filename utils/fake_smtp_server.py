@@ -0,0 +1,158 @@
+import threading
+import socketserver
+from email import message_from_bytes, policy
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Serves one SMTP session until QUIT or disconnect"""
+
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        server = self.server.owner
+        server._opened()
+
+        envelope = {"from": None, "to": []}
+        self.reply("220 localhost FakeSMTPServer ready")
+
+        while True:
+            raw = self.rfile.readline()
+            if not raw:
+                return
+
+            line = raw.decode("utf-8", "replace").rstrip("\r\n")
+            verb, _, arg = line.partition(" ")
+            verb = verb.upper()
+
+            if verb == "EHLO":
+                self.reply("250-localhost")
+                self.reply("250-AUTH PLAIN LOGIN")
+                self.reply("250 8BITMIME")
+            elif verb == "HELO":
+                self.reply("250 localhost")
+            elif verb == "AUTH":
+                mechanism = arg.split(" ")[0].upper()
+                if mechanism == "LOGIN":
+                    # Username (unless sent inline) then password prompts
+                    if " " not in arg:
+                        self.reply("334 VXNlcm5hbWU6")
+                        self.rfile.readline()
+                    self.reply("334 UGFzc3dvcmQ6")
+                    self.rfile.readline()
+                elif mechanism == "PLAIN" and " " not in arg:
+                    self.reply("334 ")
+                    self.rfile.readline()
+                self.reply("235 2.7.0 Authentication successful")
+            elif verb == "MAIL":
+                envelope = {"from": arg.partition(":")[2].strip(" <>"), "to": []}
+                self.reply("250 OK")
+            elif verb == "RCPT":
+                envelope["to"].append(arg.partition(":")[2].strip(" <>"))
+                self.reply("250 OK")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                data = self._read_data()
+
+                failure = server._next_failure()
+                if failure:
+                    self.reply(failure)
+                else:
+                    server._received(envelope, data)
+                    self.reply("250 OK: queued")
+                envelope = {"from": None, "to": []}
+            elif verb == "RSET":
+                envelope = {"from": None, "to": []}
+                self.reply("250 OK")
+            elif verb == "NOOP":
+                self.reply("250 OK")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+    def _read_data(self):
+        lines = []
+        while True:
+            raw = self.rfile.readline()
+            if not raw or raw in (b".\r\n", b".\n"):
+                break
+            # Undo dot-stuffing
+            lines.append(raw[1:] if raw.startswith(b"..") else raw)
+        return b"".join(lines)
+
+
+class _ThreadingServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class FakeSMTPServer:
+    """
+    Minimal in-process SMTP server (stand-in for smtpd/aiosmtpd) for
+    exercising MailManager and MailQueue locally. Accepts any login,
+    records every message, and can be told to reject the next N
+    deliveries to test retries.
+
+    Usage:
+        with FakeSMTPServer() as server:
+            os.environ["MAIL_SERVER"] = server.host
+            os.environ["MAIL_PORT"] = str(server.port)
+            ...
+            server.messages[0]["Subject"]
+    """
+
+    def __init__(self, host="127.0.0.1", port=0):
+        self.messages = []
+        self.envelopes = []
+        self.connections = 0
+
+        self._failures = []
+        self._lock = threading.Lock()
+        self._server = _ThreadingServer((host, port), _SMTPHandler)
+        self._server.owner = self
+        self._thread = None
+
+    @property
+    def host(self):
+        return self._server.server_address[0]
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def fail_next(self, count=1, reply="451 4.3.0 Temporary failure"):
+        """Reject the next `count` messages with an SMTP error reply"""
+        with self._lock:
+            self._failures.extend([reply] * count)
+
+    # Helper Methods
+
+    def _opened(self):
+        with self._lock:
+            self.connections += 1
+
+    def _next_failure(self):
+        with self._lock:
+            return self._failures.pop(0) if self._failures else None
+
+    def _received(self, envelope, data):
+        with self._lock:
+            self.envelopes.append(envelope)
+            self.messages.append(message_from_bytes(data, policy=policy.default))
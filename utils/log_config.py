@@ -1,10 +1,14 @@
+import os
+import json
+import time
 import logging
 from logging import FileHandler
 
 try:
-    from flask import request, has_request_context
+    from flask import request, g, has_request_context
 except Exception:
     request = None
+    g = None
     def has_request_context() -> bool:
         return False
 
@@ -13,17 +17,65 @@ logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
 
+def capture_request(record):
+    """Attach request details while still on the request thread"""
+    if has_request_context():
+        record.url = getattr(request, "url", None) if request else None
+        record.remote = getattr(request, "remote_addr", None) if request else None
+        record.method = getattr(request, "method", None)
+        record.route = getattr(request, "endpoint", None)
+
+        # Populated by website.modules.RequestTracker
+        record.request_id = getattr(g, "request_id", None)
+        started = getattr(g, "request_started", None)
+        record.latency_ms = round((time.perf_counter() - started) * 1000, 2) if started else None
+        record.db_queries = getattr(g, "db_query_count", None)
+    else:
+        record.url = None
+        record.remote = None
+        record.method = None
+        record.route = None
+        record.request_id = None
+        record.latency_ms = None
+        record.db_queries = None
+    return True
+
+
 class NewFormatter(logging.Formatter):
     def format(self, record):
-        if has_request_context():
-            record.url = getattr(request, "url", None) if request else None
-            record.remote = getattr(request, "remote_addr", None) if request else None
-        else:
-            record.url = None
-            record.remote = None
+        # Queued records were captured on the request thread already
+        if not hasattr(record, "url"):
+            capture_request(record)
         return super().format(record)
 
 
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line (LOG_FORMAT=json)"""
+
+    def format(self, record):
+        if not hasattr(record, "url"):
+            capture_request(record)
+
+        entry = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S%z"),
+            "level": record.levelname,
+            "log": getattr(record, "log_name", None),
+            "message": getattr(record, "log_message", record.getMessage()),
+            "request_id": record.request_id,
+            "method": record.method,
+            "route": record.route,
+            "url": record.url,
+            "remote": record.remote,
+            "latency_ms": record.latency_ms,
+            "db_queries": record.db_queries,
+        }
+        return json.dumps(entry, default=str)
+
+
+def json_logs() -> bool:
+    return os.getenv("LOG_FORMAT", "text").strip().lower() == "json"
+
+
 fileFormat = NewFormatter(
     "**********\nREMOTE: %(remote)s\nSOURCE: %(url)s\nTIME: %(asctime)s\nTYPE: %(levelname)s\nMESSAGE: %(message)s\n",
     datefmt="%Y-%m-%d %H:%M:%S",
@@ -33,3 +85,6 @@ consoleFormat = NewFormatter(
     "[%(asctime)s] || %(levelname)s || %(message)s",
     datefmt="%Y-%m-%d %H:%M:%S",
 )
+
+
+jsonFormat = JsonFormatter()
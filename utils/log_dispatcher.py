@@ -0,0 +1,189 @@
+import os
+import queue
+import atexit
+import logging
+import threading
+from collections import OrderedDict
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+    WatchedFileHandler,
+)
+
+from .log_config import fileFormat, jsonFormat, consoleFormat, capture_request, json_logs
+
+
+class _RoutingHandler(logging.Handler):
+    """
+    Runs on the listener thread: console records go to stderr, file
+    records to a cached handler for their log path.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.console = logging.StreamHandler()
+        self.console.setFormatter(consoleFormat)
+        self.files = OrderedDict()
+
+    def emit(self, record):
+        target = getattr(record, "log_file", None)
+        if target is None:
+            self.console.handle(record)
+            return
+
+        try:
+            self._file_handler(target).handle(record)
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        for handler in self.files.values():
+            handler.close()
+        self.files.clear()
+        self.console.close()
+        super().close()
+
+    def _file_handler(self, path):
+        handler = self.files.get(path)
+        if handler is not None:
+            self.files.move_to_end(path)
+            return handler
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        when = os.getenv("LOG_ROTATE_WHEN")
+        rotation = os.getenv("LOG_ROTATION", "time" if when else "external").lower()
+        backups = int(os.getenv("LOG_BACKUP_COUNT", 5))
+
+        if rotation == "external":
+            # Every worker appends to the shared file; reopened after logrotate moves it
+            handler = WatchedFileHandler(path, encoding="utf-8")
+        else:
+            # In-process rotation renames the file, so each worker rotates its own
+            root, ext = os.path.splitext(path)
+            worker_path = f"{root}.{os.getpid()}{ext}"
+
+            if rotation == "time":
+                handler = TimedRotatingFileHandler(
+                    worker_path,
+                    when=when or "midnight",
+                    backupCount=backups,
+                    encoding="utf-8"
+                )
+            else:
+                handler = RotatingFileHandler(
+                    worker_path,
+                    maxBytes=int(os.getenv("LOG_MAX_BYTES", 5 * 1024 * 1024)),
+                    backupCount=backups,
+                    encoding="utf-8"
+                )
+        handler.setFormatter(jsonFormat if json_logs() else fileFormat)
+        self.files[path] = handler
+
+        # Bound open file descriptors
+        while len(self.files) > int(os.getenv("LOG_MAX_OPEN_FILES", 64)):
+            _, oldest = self.files.popitem(last=False)
+            oldest.close()
+
+        return handler
+
+
+class LogDispatcher:
+    """
+    Non-blocking backend for errhandler/syshandler.
+
+    Callers only enqueue a record (request details are captured first);
+    a QueueListener thread writes it to the console or to a cached
+    per-path file handler. LOG_FORMAT=json writes JSON lines instead of
+    text blocks.
+
+    Rotation (LOG_ROTATION):
+        external   (default) all workers append to one file per path and
+                   logrotate (or similar) rotates it; each worker reopens
+                   the file once it has been moved
+        size       per-worker files (<name>.<pid>.log) rotated at
+                   LOG_MAX_BYTES, keeping LOG_BACKUP_COUNT
+        time       per-worker files rotated at LOG_ROTATE_WHEN
+                   (default "midnight"); implied when only
+                   LOG_ROTATE_WHEN is set
+
+    Rotating a shared file from several processes loses records, hence
+    the per-worker names when rotating in-process.
+    """
+
+    _lock = threading.Lock()
+    _logger = None
+    _listener = None
+    _pid = None
+
+    @staticmethod
+    def console(level, msg):
+        LogDispatcher._log(level, msg, None)
+
+    @staticmethod
+    def file(level, msg, path, name=None, raw=None):
+        """`name` and unwrapped `raw` text are used by the JSON format"""
+        LogDispatcher._log(level, msg, path, log_name=name, log_message=raw)
+
+    @staticmethod
+    def flush():
+        """Block until every queued record has been written"""
+        with LogDispatcher._lock:
+            listener = LogDispatcher._listener
+            if listener is None or LogDispatcher._pid != os.getpid():
+                return
+            listener.stop()
+            listener.start()
+
+    @staticmethod
+    def stop():
+        with LogDispatcher._lock:
+            listener, LogDispatcher._listener = LogDispatcher._listener, None
+            LogDispatcher._logger = None
+            if listener is None or LogDispatcher._pid != os.getpid():
+                return
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+
+    # Helper Methods
+
+    @staticmethod
+    def _log(level, msg, path, **extra):
+        extra = {key: value for key, value in extra.items() if value is not None}
+        LogDispatcher._get_logger().log(level, msg, extra={"log_file": path, **extra})
+
+    @staticmethod
+    def _get_logger():
+        logger = LogDispatcher._logger
+        if logger is not None and LogDispatcher._pid == os.getpid():
+            return logger
+
+        with LogDispatcher._lock:
+            if LogDispatcher._logger is not None and LogDispatcher._pid == os.getpid():
+                return LogDispatcher._logger
+
+            # After fork the parent's listener thread is gone; start our own
+            records = queue.SimpleQueue()
+
+            queue_handler = QueueHandler(records)
+            queue_handler.addFilter(capture_request)
+
+            logger = logging.getLogger(f"{__name__}.{os.getpid()}")
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            logger.handlers = [queue_handler]
+
+            listener = QueueListener(records, _RoutingHandler())
+            listener.start()
+
+            LogDispatcher._logger = logger
+            LogDispatcher._listener = listener
+            LogDispatcher._pid = os.getpid()
+
+            return logger
+
+
+atexit.register(LogDispatcher.stop)
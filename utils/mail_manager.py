@@ -3,6 +3,7 @@ from email.message import EmailMessage
 
 from .error_handler import ErrorHandler
 from .sys_logger import SystemLogger
+from .smtp_pool import SMTPPool
 
 
 class MailManager:
@@ -12,14 +13,16 @@ class MailManager:
         return val in {"1", "true", "yes", "on"}
 
     @staticmethod
-    def mailer(recipient, subject, **kwargs):
-        if not recipient or not subject:
-            return False
-
+    def _env():
         try:
             from settings import env
         except ImportError:
             env = None
+        return env
+
+    @staticmethod
+    def build_message(recipient, subject, **kwargs):
+        env = MailManager._env()
 
         sender = kwargs.get(
             "sender",
@@ -43,31 +46,53 @@ class MailManager:
         else:
             msg.set_content("")
 
-        host = os.getenv("MAIL_SERVER") or getattr(env, "MAIL_SERVER", "localhost")
-        port = int(os.getenv("MAIL_PORT") or getattr(env, "MAIL_PORT", 25))
-        username = os.getenv("MAIL_USERNAME") or getattr(env, "MAIL_USERNAME", None)
-        password = os.getenv("MAIL_PASSWORD") or getattr(env, "MAIL_PASSWORD", None)
+        return msg
+
+    @staticmethod
+    def smtp_settings():
+        """Connection settings; also the key pooled sessions are matched on"""
+        env = MailManager._env()
+
+        return (
+            os.getenv("MAIL_SERVER") or getattr(env, "MAIL_SERVER", "localhost"),
+            int(os.getenv("MAIL_PORT") or getattr(env, "MAIL_PORT", 25)),
+            os.getenv("MAIL_USERNAME") or getattr(env, "MAIL_USERNAME", None),
+            os.getenv("MAIL_PASSWORD") or getattr(env, "MAIL_PASSWORD", None),
+            MailManager._bool_env("MAIL_USE_TLS", getattr(env, "MAIL_USE_TLS", False)),
+            MailManager._bool_env("MAIL_USE_SSL", getattr(env, "MAIL_USE_SSL", False)),
+            float(os.getenv("MAIL_TIMEOUT") or getattr(env, "MAIL_TIMEOUT", 30)),
+        )
+
+    @staticmethod
+    def send_message(msg):
+        """Deliver one message over a pooled SMTP session; raises on failure"""
+        SMTPPool.send(msg, MailManager.smtp_settings())
 
-        use_tls = MailManager._bool_env("MAIL_USE_TLS", getattr(env, "MAIL_USE_TLS", False))
-        use_ssl = MailManager._bool_env("MAIL_USE_SSL", getattr(env, "MAIL_USE_SSL", False))
+    @staticmethod
+    def send_messages(messages):
+        """
+        Deliver a batch of EmailMessages over a few pooled sessions.
+        Returns [(message, error)] for the ones that failed.
+        """
+        failures = SMTPPool.send_many(messages, MailManager.smtp_settings())
+
+        for msg, e in failures:
+            ErrorHandler.errhandler(e, log="mailer", path="utils")
+
+        return failures
+
+    @staticmethod
+    def deliver(recipient, subject, **kwargs):
+        """Build and send; raises on failure (used by the mail queue)"""
+        MailManager.send_message(MailManager.build_message(recipient, subject, **kwargs))
+
+    @staticmethod
+    def mailer(recipient, subject, **kwargs):
+        if not recipient or not subject:
+            return False
 
         try:
-            import smtplib
-
-            if use_ssl:
-                with smtplib.SMTP_SSL(host, port) as smtp:
-                    if username and password:
-                        smtp.login(username, password)
-                    smtp.send_message(msg)
-            else:
-                with smtplib.SMTP(host, port) as smtp:
-                    smtp.ehlo()
-                    if use_tls:
-                        smtp.starttls()
-                        smtp.ehlo()
-                    if username and password:
-                        smtp.login(username, password)
-                    smtp.send_message(msg)
+            MailManager.deliver(recipient, subject, **kwargs)
 
         except Exception as e:
             ErrorHandler.errhandler(e, log="mailer", path="utils")
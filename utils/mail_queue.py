@@ -0,0 +1,354 @@
+import os
+import json
+import time
+import uuid
+import queue
+import tempfile
+import threading
+
+from .mail_manager import MailManager
+from .error_handler import ErrorHandler
+from .sys_logger import SystemLogger
+
+
+class MailQueue:
+    """
+    Background mail dispatch.
+
+    enqueue() writes the message to a spool directory and returns; a pool
+    of worker threads delivers it through MailManager.deliver. Failed
+    sends are retried with exponential backoff and moved to failed/ once
+    MAIL_MAX_RETRIES is reached. Spooled messages survive restarts and
+    are picked up by whichever process starts next.
+
+    Spool layout (MAIL_SPOOL_DIR):
+        pending/   waiting for (re)delivery
+        active/    claimed by a worker, named <pid>-<message>
+        failed/    gave up after MAIL_MAX_RETRIES attempts; deleted
+                   after MAIL_FAILED_RETENTION seconds
+
+    Messages (verification codes included) are plain JSON, so the spool
+    is owner-only: 0700 directories, 0600 files.
+
+    MAIL_QUEUE_WORKERS=0 sends synchronously instead.
+    """
+
+    _lock = threading.Lock()
+    _queue: "queue.Queue[str]" = None
+    _queued: set = set()
+    _threads: list = []
+    _pid: int = None
+    _stopping: threading.Event = None
+
+    # How often the scanner looks for expired failed/ messages (seconds)
+    EXPIRE_INTERVAL = 3600
+
+    # Settings
+
+    @staticmethod
+    def spool_dir():
+        return os.getenv("MAIL_SPOOL_DIR", os.path.join("spool", "mail"))
+
+    @staticmethod
+    def worker_count():
+        return int(os.getenv("MAIL_QUEUE_WORKERS", 2))
+
+    @staticmethod
+    def max_retries():
+        return int(os.getenv("MAIL_MAX_RETRIES", 5))
+
+    @staticmethod
+    def retry_backoff():
+        """Base delay in seconds; attempt n waits backoff * 2 ** (n - 1)"""
+        return float(os.getenv("MAIL_RETRY_BACKOFF", 5))
+
+    @staticmethod
+    def poll_interval():
+        return float(os.getenv("MAIL_QUEUE_POLL_INTERVAL", 1))
+
+    @staticmethod
+    def failed_retention():
+        """Seconds a failed message is kept for inspection (default 7 days)"""
+        return float(os.getenv("MAIL_FAILED_RETENTION", 7 * 24 * 3600))
+
+    # Public API
+
+    @staticmethod
+    def enqueue(recipient, subject, **kwargs):
+        """Spool a message for background delivery; True once it is on disk"""
+        if not recipient or not subject:
+            return False
+
+        if MailQueue.worker_count() <= 0:
+            return MailManager.mailer(recipient, subject, **kwargs)
+
+        message = {
+            "id": f"{time.time_ns()}-{uuid.uuid4().hex}",
+            "recipient": recipient,
+            "subject": subject,
+            "kwargs": {k: kwargs[k] for k in ("sender", "body", "html") if k in kwargs},
+            "attempts": 0,
+            "next_attempt_at": 0,
+            "last_error": None
+        }
+
+        try:
+            MailQueue._write(MailQueue._path("pending", message["id"]), message)
+        except Exception as e:
+            ErrorHandler.errhandler(e, log="mail-queue", path="utils")
+            return False
+
+        MailQueue.start()
+        MailQueue._submit(message["id"])
+        return True
+
+    @staticmethod
+    def start():
+        """Start the worker pool and spool scanner (once per process)"""
+        if MailQueue.worker_count() <= 0:
+            return
+
+        with MailQueue._lock:
+            if MailQueue._pid == os.getpid() and MailQueue._threads:
+                return
+
+            # Fresh state after fork: parent threads do not exist here
+            MailQueue._pid = os.getpid()
+            MailQueue._queue = queue.Queue()
+            MailQueue._queued = set()
+            MailQueue._stopping = threading.Event()
+
+            MailQueue._make_spool()
+            MailQueue._recover()
+            MailQueue._expire_failed()
+
+            MailQueue._threads = [
+                threading.Thread(target=MailQueue._work, name=f"mail-worker-{i}", daemon=True)
+                for i in range(MailQueue.worker_count())
+            ]
+            MailQueue._threads.append(
+                threading.Thread(target=MailQueue._scan, name="mail-scanner", daemon=True)
+            )
+            for thread in MailQueue._threads:
+                thread.start()
+
+    @staticmethod
+    def stop(timeout=5.0):
+        """Stop this process's workers; unsent messages stay spooled"""
+        with MailQueue._lock:
+            if not MailQueue._threads or MailQueue._pid != os.getpid():
+                return
+            threads, MailQueue._threads = MailQueue._threads, []
+            MailQueue._stopping.set()
+
+        for _ in threads:
+            MailQueue._queue.put(None)
+        for thread in threads:
+            thread.join(timeout)
+
+    @staticmethod
+    def join(timeout=10.0):
+        """Wait until every message handed to the workers was processed"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with MailQueue._lock:
+                if not MailQueue._queued:
+                    return True
+            time.sleep(0.05)
+        return False
+
+    @staticmethod
+    def depth():
+        """Messages waiting in (or being sent from) the spool"""
+        counts = {}
+        for folder in ("pending", "active", "failed"):
+            try:
+                counts[folder] = len(os.listdir(os.path.join(MailQueue.spool_dir(), folder)))
+            except FileNotFoundError:
+                counts[folder] = 0
+        return counts
+
+    # Workers
+
+    @staticmethod
+    def _work():
+        while True:
+            message_id = MailQueue._queue.get()
+            if message_id is None:
+                return
+            try:
+                MailQueue._process(message_id)
+            except Exception as e:
+                ErrorHandler.errhandler(e, log="mail-queue", path="utils")
+            finally:
+                with MailQueue._lock:
+                    MailQueue._queued.discard(message_id)
+
+    @staticmethod
+    def _process(message_id):
+        pending = MailQueue._path("pending", message_id)
+        active = MailQueue._path("active", f"{os.getpid()}-{message_id}")
+
+        if not MailQueue._due(pending):
+            return
+
+        # Atomic claim; another process may have taken it
+        try:
+            os.replace(pending, active)
+        except FileNotFoundError:
+            return
+
+        message = MailQueue._read(active)
+
+        try:
+            MailManager.deliver(message["recipient"], message["subject"], **message["kwargs"])
+        except Exception as e:
+            MailQueue._retry(active, message, e)
+            return
+
+        os.remove(active)
+        SystemLogger.syshandler(
+            f"System-generated mail to '{message['recipient']}'",
+            log="mailer",
+            path="utils"
+        )
+
+    @staticmethod
+    def _retry(active, message, error):
+        message["attempts"] += 1
+        message["last_error"] = f"{type(error).__name__}: {error}"
+
+        if message["attempts"] >= MailQueue.max_retries():
+            MailQueue._write(MailQueue._path("failed", message["id"]), message)
+            os.remove(active)
+            ErrorHandler.errhandler(error, log="mail-queue", path="utils")
+            return
+
+        delay = MailQueue.retry_backoff() * 2 ** (message["attempts"] - 1)
+        message["next_attempt_at"] = time.time() + delay
+
+        MailQueue._write(MailQueue._path("pending", message["id"]), message)
+        os.remove(active)
+
+    @staticmethod
+    def _scan():
+        """Queue due retries and messages spooled by earlier/other processes"""
+        expired_at = time.monotonic()
+        while not MailQueue._stopping.wait(MailQueue.poll_interval()):
+            try:
+                for name in sorted(os.listdir(os.path.join(MailQueue.spool_dir(), "pending"))):
+                    if name.endswith(".json") and MailQueue._due(MailQueue._path("pending", name[:-5])):
+                        MailQueue._submit(name[:-5])
+
+                if time.monotonic() - expired_at >= MailQueue.EXPIRE_INTERVAL:
+                    expired_at = time.monotonic()
+                    MailQueue._expire_failed()
+            except Exception as e:
+                ErrorHandler.errhandler(e, log="mail-queue", path="utils")
+
+    @staticmethod
+    def _submit(message_id):
+        with MailQueue._lock:
+            if message_id in MailQueue._queued:
+                return
+            MailQueue._queued.add(message_id)
+        MailQueue._queue.put(message_id)
+
+    @staticmethod
+    def _recover():
+        """Return messages claimed by dead processes to pending/"""
+        active_dir = os.path.join(MailQueue.spool_dir(), "active")
+        for name in os.listdir(active_dir):
+            pid, _, message_file = name.partition("-")
+            if not pid.isdigit() or not MailQueue._abandoned(os.path.join(active_dir, name), int(pid)):
+                continue
+            try:
+                os.replace(
+                    os.path.join(active_dir, name),
+                    os.path.join(MailQueue.spool_dir(), "pending", message_file)
+                )
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _expire_failed():
+        """Delete failed messages older than MAIL_FAILED_RETENTION"""
+        failed_dir = os.path.join(MailQueue.spool_dir(), "failed")
+        cutoff = time.time() - MailQueue.failed_retention()
+        for name in os.listdir(failed_dir):
+            path = os.path.join(failed_dir, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    # Helper Methods
+
+    @staticmethod
+    def _make_spool():
+        """Create the spool folders owner-only (existing ones are tightened too)"""
+        root = MailQueue.spool_dir()
+        for folder in ("pending", "active", "failed"):
+            os.makedirs(os.path.join(root, folder), mode=0o700, exist_ok=True)
+
+        # makedirs skips existing folders and applies the umask
+        for path in [root] + [os.path.join(root, folder) for folder in ("pending", "active", "failed")]:
+            os.chmod(path, 0o700)
+
+    @staticmethod
+    def _path(folder, message_id):
+        return os.path.join(MailQueue.spool_dir(), folder, f"{message_id}.json")
+
+    @staticmethod
+    def _due(path):
+        try:
+            return MailQueue._read(path).get("next_attempt_at", 0) <= time.time()
+        except (FileNotFoundError, ValueError):
+            return False
+
+    @staticmethod
+    def _abandoned(path, pid):
+        """Claimed by a process that is gone (or stuck past MAIL_ACTIVE_TIMEOUT)"""
+        if pid == os.getpid():
+            return False
+
+        try:
+            if time.time() - os.path.getmtime(path) > float(os.getenv("MAIL_ACTIVE_TIMEOUT", 600)):
+                return True
+        except FileNotFoundError:
+            return False
+
+        # Signal 0 only probes on POSIX (on Windows it would send CTRL_C_EVENT)
+        if os.name != "posix":
+            return False
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            return False
+        return False
+
+    @staticmethod
+    def _read(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def _write(path, message):
+        """Atomic write so workers never read a half-written message"""
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            MailQueue._make_spool()
+
+        # mkstemp creates the file 0600; os.replace keeps that mode
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(message, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
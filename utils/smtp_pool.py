@@ -0,0 +1,264 @@
+import os
+import time
+import smtplib
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+
+class SMTPPool:
+    """
+    Pool of authenticated SMTP sessions shared by MailManager.
+
+    Sessions are kept open between messages (no repeated TLS handshake
+    or AUTH), probed with NOOP when they have been idle for a while,
+    recycled after MAIL_POOL_MAX_MESSAGES sends or MAIL_POOL_IDLE_TIMEOUT
+    seconds, and transparently reopened when the server drops them.
+    At most MAIL_POOL_SIZE sessions exist per process; callers beyond
+    that wait for a free one.
+    """
+
+    # Idle sessions younger than this are used without a NOOP probe
+    PROBE_AFTER = 5.0
+
+    _lock = threading.Lock()
+    _idle = []  # [(settings, smtp, last_used, sent)]
+    _slots = None
+    _size = None
+    _pid = None
+
+    # Settings
+
+    @staticmethod
+    def pool_size():
+        return max(int(os.getenv("MAIL_POOL_SIZE", 4)), 1)
+
+    @staticmethod
+    def idle_timeout():
+        return float(os.getenv("MAIL_POOL_IDLE_TIMEOUT", 60))
+
+    @staticmethod
+    def max_messages():
+        return int(os.getenv("MAIL_POOL_MAX_MESSAGES", 100))
+
+    @staticmethod
+    def acquire_timeout():
+        return float(os.getenv("MAIL_POOL_TIMEOUT", 30))
+
+    # Public API
+
+    @staticmethod
+    def send(msg, settings):
+        """Send one message on a pooled session; raises on failure"""
+        with SMTPPool.session(settings) as session:
+            SMTPPool._send(session, msg)
+
+    @staticmethod
+    def send_many(messages, settings):
+        """
+        Send a batch over up to MAIL_POOL_SIZE sessions.
+        Returns [(message, error)] for the messages that failed.
+        """
+        messages = list(messages)
+        if not messages:
+            return []
+
+        workers = min(SMTPPool.pool_size(), len(messages))
+        chunks = [messages[i::workers] for i in range(workers)]
+
+        def send_chunk(chunk):
+            failures = []
+            with SMTPPool.session(settings) as session:
+                for msg in chunk:
+                    try:
+                        SMTPPool._send(session, msg)
+                    except Exception as e:
+                        SMTPPool._reset(session.smtp, e)
+                        failures.append((msg, e))
+            return failures
+
+        if workers == 1:
+            return send_chunk(chunks[0])
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="smtp-batch") as executor:
+            return [failure for result in executor.map(send_chunk, chunks) for failure in result]
+
+    @staticmethod
+    @contextmanager
+    def session(settings):
+        """Borrow a live session for the given connection settings"""
+        slots = SMTPPool._slots_for_process()
+        if not slots.acquire(timeout=SMTPPool.acquire_timeout()):
+            raise TimeoutError("No SMTP connection available")
+
+        holder = {"smtp": None, "sent": 0}
+        try:
+            holder["smtp"], holder["sent"] = SMTPPool._checkout(settings)
+            yield _PooledSession(holder, settings)
+        except BaseException as e:
+            # A rejected message leaves the session usable; anything else may not
+            if not SMTPPool._reset(holder["smtp"], e):
+                SMTPPool._close(holder["smtp"])
+                holder["smtp"] = None
+            raise
+        finally:
+            if holder["smtp"] is not None:
+                SMTPPool._checkin(settings, holder["smtp"], holder["sent"])
+            slots.release()
+
+    @staticmethod
+    def close_all():
+        """Close every idle session (e.g. at shutdown or after config changes)"""
+        with SMTPPool._lock:
+            idle, SMTPPool._idle = SMTPPool._idle, []
+        for _, smtp, _, _ in idle:
+            SMTPPool._close(smtp)
+
+    @staticmethod
+    def stats():
+        with SMTPPool._lock:
+            return {"idle": len(SMTPPool._idle), "size": SMTPPool._size or SMTPPool.pool_size()}
+
+    # Helper Methods
+
+    @staticmethod
+    def _send(session, msg):
+        """Send with one reconnect when the server dropped the session"""
+        try:
+            session.send_message(msg)
+        except Exception as e:
+            if not SMTPPool._disconnected(e):
+                raise
+            session.reconnect()
+            session.send_message(msg)
+
+    @staticmethod
+    def _disconnected(error):
+        if isinstance(error, smtplib.SMTPServerDisconnected):
+            return True
+        # SMTPException subclasses OSError; only socket-level errors count
+        return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+    @staticmethod
+    def _reset(smtp, error):
+        """RSET after a rejected message; False when the session is unusable"""
+        if smtp is None or not isinstance(error, smtplib.SMTPException) or SMTPPool._disconnected(error):
+            return False
+        try:
+            return smtp.rset()[0] == 250
+        except Exception:
+            return False
+
+    @staticmethod
+    def _slots_for_process():
+        with SMTPPool._lock:
+            # Sessions opened before fork belong to the parent
+            if SMTPPool._pid != os.getpid() or SMTPPool._size != SMTPPool.pool_size():
+                SMTPPool._pid = os.getpid()
+                SMTPPool._size = SMTPPool.pool_size()
+                SMTPPool._slots = threading.BoundedSemaphore(SMTPPool._size)
+                SMTPPool._idle = []
+            return SMTPPool._slots
+
+    @staticmethod
+    def _checkout(settings):
+        now = time.monotonic()
+        while True:
+            with SMTPPool._lock:
+                entry = None
+                for i in range(len(SMTPPool._idle) - 1, -1, -1):
+                    if SMTPPool._idle[i][0] == settings:
+                        entry = SMTPPool._idle.pop(i)
+                        break
+                # Drop sessions opened with stale settings
+                stale = [e for e in SMTPPool._idle if e[0] != settings]
+                SMTPPool._idle = [e for e in SMTPPool._idle if e[0] == settings]
+
+            for _, smtp, _, _ in stale:
+                SMTPPool._close(smtp)
+
+            if entry is None:
+                return SMTPPool._open(settings), 0
+
+            _, smtp, last_used, sent = entry
+            idle_for = now - last_used
+            if idle_for > SMTPPool.idle_timeout() or sent >= SMTPPool.max_messages():
+                SMTPPool._close(smtp)
+                continue
+            if idle_for > SMTPPool.PROBE_AFTER and not SMTPPool._alive(smtp):
+                SMTPPool._close(smtp)
+                continue
+            return smtp, sent
+
+    @staticmethod
+    def _checkin(settings, smtp, sent):
+        if sent >= SMTPPool.max_messages():
+            SMTPPool._close(smtp)
+            return
+        with SMTPPool._lock:
+            SMTPPool._idle.append((settings, smtp, time.monotonic(), sent))
+
+    @staticmethod
+    def _open(settings):
+        host, port, username, password, use_tls, use_ssl, timeout = settings
+
+        if use_ssl:
+            smtp = smtplib.SMTP_SSL(host, port, timeout=timeout)
+        else:
+            smtp = smtplib.SMTP(host, port, timeout=timeout)
+            smtp.ehlo()
+            if use_tls:
+                smtp.starttls()
+                smtp.ehlo()
+
+        if username and password:
+            smtp.login(username, password)
+        return smtp
+
+    @staticmethod
+    def _alive(smtp):
+        try:
+            return smtp.noop()[0] == 250
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close(smtp):
+        if smtp is None:
+            return
+        try:
+            smtp.quit()
+        except Exception:
+            try:
+                smtp.close()
+            except Exception:
+                pass
+
+
+class _PooledSession:
+    """Borrowed session handle; reconnect() swaps in a fresh session"""
+
+    def __init__(self, holder, settings):
+        self._holder = holder
+        self._settings = settings
+
+    @property
+    def smtp(self):
+        return self._holder["smtp"]
+
+    def send_message(self, msg):
+        if self._holder["smtp"] is None:
+            self.reconnect()
+
+        self._holder["smtp"].send_message(msg)
+        self._holder["sent"] += 1
+
+        # Recycle long-lived sessions mid-batch
+        if self._holder["sent"] >= SMTPPool.max_messages():
+            self.reconnect()
+
+    def reconnect(self):
+        SMTPPool._close(self._holder["smtp"])
+        self._holder["smtp"] = None
+        self._holder["smtp"] = SMTPPool._open(self._settings)
+        self._holder["sent"] = 0
@@ -1,8 +1,6 @@
-import os
 import logging
-from logging import FileHandler
 
-from .log_config import logger, fileFormat, consoleFormat
+from .log_dispatcher import LogDispatcher
 from .time_utils import TimeUtils
 
 
@@ -10,28 +8,14 @@ class SystemLogger:
     @staticmethod
     def syshandler(msg=None, log=None, path=None):
         if path:
-            os.makedirs(f"logs/system/{path}", exist_ok=True)
             logFile = f"{path}/{log}"
         else:
-            os.makedirs("logs/system", exist_ok=True)
             logFile = log
 
         file_path = f"logs/system/{logFile}.log"
 
         header = f"SYSTEM INFORMATION @ {TimeUtils.timestp()}. CHECK *{logFile.upper()}*\n\n"
 
-        console = logging.StreamHandler()
-        console.setFormatter(consoleFormat)
-        logger.addHandler(console)
-        try:
-            logger.info(header)
-        finally:
-            logger.removeHandler(console)
-
-        file_handler = FileHandler(file_path, mode="a")
-        file_handler.setFormatter(fileFormat)
-        logger.addHandler(file_handler)
-        try:
-            logger.info(f"\n---\n{msg}\n---\n")
-        finally:
-            logger.removeHandler(file_handler)
+        # Queued; directories, files and rotation are handled off-thread
+        LogDispatcher.console(logging.INFO, header)
+        LogDispatcher.file(logging.INFO, f"\n---\n{msg}\n---\n", file_path, name=logFile, raw=msg)
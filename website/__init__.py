@@ -5,12 +5,13 @@ from flask import Flask
 from flask_migrate import Migrate
 from flask_login import LoginManager
 from database import db
+from website.modules import Cache, RequestTracker, QueryProfiler, Metrics, MenuSearch, Recommender
 
 # Config Files
 from config import Default, Development, Production
 
 # Other Packages
-from utils import errhandler, syshandler
+from utils import errhandler, syshandler, MailQueue
 from datetime import datetime
 from dotenv import load_dotenv
 import os
@@ -54,6 +55,15 @@ def create_app(FLASK_MODE: str | None = None) -> Flask:
     # Bindings
     db.init_app(app)
     migrate.init_app(app, db, compare_type=True)
+    Cache.init_app(app)
+    RequestTracker.init_app(app)
+    QueryProfiler.init_app(app)
+
+    if app.config.get("METRICS_ENABLED"):
+        Metrics.init_app(app)
+
+    # Mail Workers (also resumes mail spooled before a restart)
+    MailQueue.start()
 
     # Login Manager Settings
     login_manager.login_view = ""
@@ -79,12 +89,29 @@ def create_app(FLASK_MODE: str | None = None) -> Flask:
     with app.app_context():
         from . import models
 
+    # Menu Search Index (warmed on each worker's first request with SEARCH_WARM_ON_START, else on first search)
+    MenuSearch.init_app(app)
+
+    # Related Items / Upsells (matrix built by a background thread on first use)
+    Recommender.init_app(app)
+
     # Importing Blueprints
     from website.routes import routes
 
     # Registering Blueprints
     app.register_blueprint(routes, url_prefix="/")
 
+    if app.config.get("METRICS_ENABLED"):
+        from website.routes.metrics import metrics
+        app.register_blueprint(metrics)
+
+        if not app.config.get("METRICS_TOKEN") and not app.debug:
+            syshandler("/metrics enabled without METRICS_TOKEN; scrapes will get 404", log="metrics", path="routes")
+
+    # CLI Commands
+    from website.commands import register_commands
+    register_commands(app)
+
 
     try:
         # Critical Config Keys
@@ -0,0 +1,79 @@
+from datetime import timedelta
+
+import click
+from flask import Flask
+
+
+# CLI Commands
+def register_commands(app: Flask) -> None:
+    """Attach custom `flask` CLI commands to the app"""
+    app.cli.add_command(rollup_sales)
+    app.cli.add_command(benchmark_recommendations)
+    app.cli.add_command(benchmark_order_events)
+
+
+@click.command("rollup-sales")
+@click.option(
+    "--from", "start",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    help="First day to rebuild (YYYY-MM-DD). Defaults to yesterday."
+)
+@click.option(
+    "--to", "end",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    help="Last day to rebuild (YYYY-MM-DD). Defaults to --from."
+)
+def rollup_sales(start, end):
+    """Rebuild daily_sales_summary rows from completed orders."""
+    from website.services import SalesRollupService
+
+    service = SalesRollupService()
+
+    start_date = start.date() if start else service.today() - timedelta(days=1)
+    end_date = end.date() if end else start_date
+
+    if end_date < start_date:
+        raise click.BadParameter("--to must not be before --from")
+
+    updated = service.rollup_range(start_date, end_date)
+    click.echo(f"Rolled up {updated} day(s) from {start_date} to {end_date}")
+
+
+@click.command("benchmark-recommendations")
+@click.option("--items", "n_items", type=int, default=200, show_default=True, help="Synthetic menu size.")
+@click.option("--orders", "n_orders", type=int, default=50000, show_default=True, help="Synthetic order count.")
+@click.option("--increment", type=int, default=1000, show_default=True, help="New orders folded in by one refresh.")
+@click.option("--seed", type=int, default=7, show_default=True, help="Random seed.")
+def benchmark_recommendations(n_items, n_orders, increment, seed):
+    """Benchmark the co-occurrence recommender on synthetic orders (no database)."""
+    from website.modules.recommendations import benchmark
+
+    if not 0 < increment < n_orders:
+        raise click.BadParameter("--increment must be between 1 and --orders")
+
+    results = benchmark.run(n_items=n_items, n_orders=n_orders, increment=increment, seed=seed)
+    for key, value in results.items():
+        click.echo(f"{key}: {value}")
+
+
+@click.command("benchmark-order-events")
+@click.option(
+    "--sizes", default="10,100,1000,5000", show_default=True,
+    help="Comma-separated order line counts."
+)
+@click.option("--rounds", type=int, default=3, show_default=True, help="Runs per size (best is kept).")
+def benchmark_order_events(sizes, rounds):
+    """Time order-total reconciliation per flush at growing line counts (in-memory SQLite)."""
+    from website.models import events_benchmark
+
+    try:
+        line_counts = [int(size) for size in sizes.split(",") if size.strip()]
+    except ValueError:
+        raise click.BadParameter("--sizes must be comma-separated integers")
+    if not line_counts or min(line_counts) < 1 or rounds < 1:
+        raise click.BadParameter("--sizes and --rounds must be positive")
+
+    columns = ("lines", "scenario", "flush_ms", "events_ms", "events_us_per_line", "event_statements")
+    click.echo("  ".join(f"{column:>18}" for column in columns))
+    for row in events_benchmark.run(sizes=line_counts, rounds=rounds):
+        click.echo("  ".join(f"{row[column]!s:>18}" for column in columns))
@@ -1,4 +1,4 @@
-from utils import mailer, errhandler
+from utils import mailqueue, errhandler
 from typing import Optional, Dict, Union
 
 # Mail Modes
@@ -76,7 +76,8 @@ class MailManager:
             else:
                 return False
 
-            sent = mailer(
+            # Spooled for the background mail workers; returns once queued
+            sent = mailqueue(
                 r=recipient,
                 s=subject,
                 body=body
@@ -9,6 +9,7 @@ from .food_item import FoodItem
 from .ingredient import Ingredient
 from .customer import Customer
 from .order import Order, OrderType, OrderStatus
+from .order_sequence import OrderSequence
 from .order_item import OrderItem
 from .payment import Payment, PaymentMethod, PaymentStatus
 from .favorite import Favorite
@@ -28,6 +29,7 @@ __all__ = [
     'Order',
     'OrderType',
     'OrderStatus',
+    'OrderSequence',
     'OrderItem',
     'Payment',
     'PaymentMethod',
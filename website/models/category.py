@@ -1,5 +1,5 @@
 # models/category.py
-from sqlalchemy import String
+from sqlalchemy import String, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from database import db
 from .base import TimestampMixin
@@ -16,5 +16,10 @@ class Category(db.Model, TimestampMixin):
     # Relationships
     food_items = relationship('FoodItem', back_populates='category')
 
+    # Menu search (SEARCH_BACKEND=fulltext, MySQL)
+    __table_args__ = (
+        Index('ft_category_name', 'name', mysql_prefix='FULLTEXT'),
+    )
+
     def __repr__(self):
         return f'<Category {self.name}>'
\ No newline at end of file
@@ -14,6 +14,7 @@ class DailySalesSummary(db.Model, TimestampMixin):
     total_revenue: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False, default=0)
     order_count: Mapped[int] = mapped_column(nullable=False, default=0)
     average_order_value: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False, default=0)
+    total_discounts: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False, default=0, server_default='0')
     top_selling_item_id: Mapped[int | None] = mapped_column(ForeignKey('food_items.id'))
 
     # Relationships
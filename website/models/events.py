@@ -1,8 +1,11 @@
 # models/events.py
-from sqlalchemy import event
+from sqlalchemy import event, inspect, select, func
 from sqlalchemy.orm import Session
-from . import Order, OrderItem
+from sqlalchemy.orm.attributes import set_committed_value
+from . import Order, OrderItem, OrderStatus
 from . import Payment, PaymentStatus
+from . import FoodItem, Review
+from . import Favorite, PointsTransaction, User
 from datetime import datetime, timezone
 
 # Automatically calculate order item subtotal
@@ -12,17 +15,76 @@ def calculate_order_item_subtotal(mapper, connection, target):
     """Automation: Calculate subtotal before save"""
     target.calculate_subtotal()
 
-# Automatically recalculate order total when items change
-@event.listens_for(OrderItem, 'after_insert')
-@event.listens_for(OrderItem, 'after_update')
-@event.listens_for(OrderItem, 'after_delete')
-def update_order_total(mapper, connection, target):
-    """Automation: Update order total when items change"""
-    session = Session.object_session(target)
-    if session:
-        order = session.get(Order, target.order_id)
-        if order:
-            order.calculate_total()
+# Automatically recalculate order totals when items change (once per flush)
+@event.listens_for(Session, 'before_flush')
+def track_order_item_changes(session, flush_context, instances):
+    """Automation: Remember items and orders whose total needs reconciling"""
+    pending = session.info.setdefault('reconcile_orders', [])
+
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, OrderItem):
+            pending.append(obj)
+        elif isinstance(obj, Order) and inspect(obj).attrs.order_items.history.has_changes():
+            pending.append(obj)
+
+@event.listens_for(Session, 'after_flush')
+def reconcile_order_totals(session, flush_context):
+    """Automation: Recompute each touched order's total in one statement"""
+    pending = session.info.pop('reconcile_orders', None)
+    if not pending:
+        return
+
+    order_ids = set()
+    for obj in pending:
+        if isinstance(obj, Order):
+            order_ids.add(obj.id)
+            continue
+        # Items moved between orders affect both totals
+        history = inspect(obj).attrs.order_id.history
+        order_ids.update(history.deleted)
+        order_ids.add(obj.order_id)
+    order_ids.discard(None)
+
+    if not order_ids:
+        return
+
+    orders = Order.__table__
+    items = OrderItem.__table__
+    connection = session.connection()
+
+    connection.execute(
+        orders.update()
+        .where(orders.c.id.in_(order_ids))
+        .values(total_amount=(
+            select(func.coalesce(func.sum(items.c.subtotal), 0))
+            .where(items.c.order_id == orders.c.id)
+            .scalar_subquery()
+        ))
+    )
+
+    # Mirror new totals onto orders in this session: loaded ones, and new
+    # ones (not in the identity map until the flush finishes)
+    loaded = {
+        order_id: order
+        for order_id in order_ids
+        if (order := session.identity_map.get(session.identity_key(Order, order_id))) is not None
+    }
+    loaded.update({
+        obj.id: obj
+        for obj in session.new
+        if isinstance(obj, Order) and obj.id in order_ids
+    })
+    if loaded:
+        totals = connection.execute(
+            select(orders.c.id, orders.c.total_amount).where(orders.c.id.in_(loaded))
+        )
+        for order_id, total in totals:
+            set_committed_value(loaded[order_id], 'total_amount', total)
+
+@event.listens_for(Session, 'after_rollback')
+def discard_order_item_changes(session):
+    """Automation: Forget pending reconciliation when the flush fails"""
+    session.info.pop('reconcile_orders', None)
 
 # Automatically mark order as completed when payment is completed
 @event.listens_for(Payment, 'after_update')
@@ -33,4 +95,145 @@ def complete_order_on_payment(mapper, connection, target):
         if session:
             order = session.get(Order, target.order_id)
             if order and order.status != OrderStatus.COMPLETED:
-                order.mark_completed()
\ No newline at end of file
+                order.mark_completed()
+
+# Keep denormalized rating counters on food_items in step with reviews
+def _apply_rating_delta(connection, target, food_item_id, rating, sign):
+    """Shift a food item's rating counters by one review (sign: +1 / -1)"""
+    if food_item_id is None or rating not in (1, 2, 3, 4, 5):
+        return
+
+    table = FoodItem.__table__
+    star_key = f'rating_{rating}_count'
+
+    connection.execute(
+        table.update()
+        .where(table.c.id == food_item_id)
+        .values({
+            table.c.rating_sum: table.c.rating_sum + sign * rating,
+            table.c.rating_count: table.c.rating_count + sign,
+            table.c[star_key]: table.c[star_key] + sign,
+            # Review activity is not a catalog edit
+            table.c.updated_at: table.c.updated_at
+        })
+    )
+
+    # Mirror the change onto an already-loaded FoodItem in this session
+    session = Session.object_session(target)
+    if session is None:
+        return
+
+    item = session.identity_map.get(session.identity_key(FoodItem, food_item_id))
+    if item is None:
+        return
+
+    loaded = inspect(item).dict
+    for key, delta in (('rating_sum', sign * rating), ('rating_count', sign), (star_key, sign)):
+        if loaded.get(key) is not None:
+            set_committed_value(item, key, loaded[key] + delta)
+
+@event.listens_for(Review, 'before_insert')
+def add_review_rating(mapper, connection, target):
+    """Automation: Count new review in food item rating counters"""
+    _apply_rating_delta(connection, target, target.food_item_id, target.rating, 1)
+
+@event.listens_for(Review, 'after_delete')
+def remove_review_rating(mapper, connection, target):
+    """Automation: Drop deleted review from food item rating counters"""
+    _apply_rating_delta(connection, target, target.food_item_id, target.rating, -1)
+
+@event.listens_for(Review, 'after_update')
+def update_review_rating(mapper, connection, target):
+    """Automation: Move counters when a review's rating or item changes"""
+    state = inspect(target)
+    rating_history = state.attrs.rating.history
+    item_history = state.attrs.food_item_id.history
+
+    if not (rating_history.deleted or item_history.deleted):
+        return
+
+    old_rating = rating_history.deleted[0] if rating_history.deleted else target.rating
+    old_item_id = item_history.deleted[0] if item_history.deleted else target.food_item_id
+
+    _apply_rating_delta(connection, target, old_item_id, old_rating, -1)
+    _apply_rating_delta(connection, target, target.food_item_id, target.rating, 1)
+
+# Roll up daily sales when orders complete (or stop counting as completed)
+@event.listens_for(Session, 'after_flush')
+def track_completed_orders(session, flush_context):
+    """Automation: Remember days whose completed orders changed"""
+    from website.repositories import DateRange
+
+    days = set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if not isinstance(obj, Order):
+            continue
+
+        state = inspect(obj)
+        status = state.attrs.status.history
+        completed_at = state.attrs.completed_at.history
+        was_completed_at = completed_at.deleted[0] if completed_at.deleted else obj.completed_at
+
+        if obj in session.deleted:
+            # Deleted while completed: its day loses the revenue
+            if OrderStatus.COMPLETED in (obj.status, *status.deleted) and was_completed_at is not None:
+                days.add(DateRange.local_date(was_completed_at))
+            continue
+
+        # Became COMPLETED
+        if obj.status == OrderStatus.COMPLETED and status.added and obj.completed_at is not None:
+            days.add(DateRange.local_date(obj.completed_at))
+
+        # Left COMPLETED (e.g. cancelled afterwards): the day it was counted on
+        if OrderStatus.COMPLETED in status.deleted and was_completed_at is not None:
+            days.add(DateRange.local_date(was_completed_at))
+
+    if days:
+        session.info.setdefault('rollup_days', set()).update(days)
+
+@event.listens_for(Session, 'after_commit')
+def rollup_completed_orders(session):
+    """Automation: Refresh summary rows for days touched by the commit"""
+    days = session.info.pop('rollup_days', None)
+    if days:
+        from website.services import SalesRollupService
+        SalesRollupService().rollup_days(days)
+
+@event.listens_for(Session, 'after_rollback')
+def discard_completed_orders(session):
+    """Automation: Forget pending rollups when the transaction fails"""
+    session.info.pop('rollup_days', None)
+
+# Drop stale customer dashboard sections once changes are committed
+@event.listens_for(Session, 'after_flush')
+def track_dashboard_changes(session, flush_context):
+    """Automation: Remember which users' dashboard data a flush touched"""
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, Order):
+            # Dashboards look orders up by customer_id (see DashboardService)
+            owners = set(inspect(obj).attrs.customer_id.history.deleted) | {obj.customer_id}
+        elif isinstance(obj, User):
+            # Profile and points balance live on the user row
+            owners = {obj.id}
+        elif isinstance(obj, (Favorite, Review, PointsTransaction)):
+            owners = {obj.user_id}
+        else:
+            continue
+
+        changes = session.info.setdefault('dashboard_changes', {})
+        for user_id in owners - {None}:
+            changes.setdefault(user_id, set()).add(obj.__tablename__)
+
+@event.listens_for(Session, 'after_commit')
+def invalidate_dashboards(session):
+    """Automation: Invalidate dashboard sections for users touched by the commit"""
+    changes = session.info.pop('dashboard_changes', None)
+    if changes:
+        from website.services import DashboardService
+        for user_id, tables in changes.items():
+            DashboardService.invalidate_for_tables(user_id, tables)
+
+@event.listens_for(Session, 'after_rollback')
+def discard_dashboard_changes(session):
+    """Automation: Forget pending invalidations when the transaction fails"""
+    session.info.pop('dashboard_changes', None)
@@ -0,0 +1,155 @@
+# models/events_benchmark.py
+import time
+from contextlib import contextmanager
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator, List, Sequence
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from database import db
+from . import Category, FoodItem, Order, OrderItem, OrderType
+from . import events
+
+
+# Order Total Reconciliation Benchmark
+class _HookTimer:
+    """
+    Swaps track_order_item_changes / reconcile_order_totals for timed
+    wrappers (process-wide, so only for offline runs) and counts the
+    statements they issue.
+    """
+
+    HOOKS = (
+        ('before_flush', events.track_order_item_changes),
+        ('after_flush', events.reconcile_order_totals)
+    )
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.statements = 0
+        self._active = False
+        self._wrappers = [(name, hook, self._wrap(hook)) for name, hook in self.HOOKS]
+
+    def _wrap(self, hook: Callable) -> Callable:
+        def timed(*args):
+            self._active = True
+            started = time.perf_counter()
+            try:
+                return hook(*args)
+            finally:
+                self.seconds += time.perf_counter() - started
+                self._active = False
+        return timed
+
+    def record(self, conn, cursor, statement, parameters, context, executemany):
+        if self._active:
+            self.statements += 1
+
+    def reset(self) -> None:
+        self.seconds = 0.0
+        self.statements = 0
+
+    @contextmanager
+    def installed(self, engine) -> Iterator["_HookTimer"]:
+        for name, hook, timed in self._wrappers:
+            event.remove(Session, name, hook)
+            event.listen(Session, name, timed)
+        event.listen(engine, "before_cursor_execute", self.record)
+        try:
+            yield self
+        finally:
+            event.remove(engine, "before_cursor_execute", self.record)
+            for name, hook, timed in self._wrappers:
+                event.remove(Session, name, timed)
+                event.listen(Session, name, hook)
+
+
+def _timed_flush(session: Session, timer: _HookTimer, prepare: Callable[[], Any]) -> Dict[str, float]:
+    """Run `prepare`, then time one flush and the order events inside it"""
+    prepare()
+    timer.reset()
+
+    started = time.perf_counter()
+    session.flush()
+    seconds = time.perf_counter() - started
+
+    result = {'seconds': seconds, 'events_seconds': timer.seconds, 'event_statements': timer.statements}
+    session.commit()
+    return result
+
+
+def _measure(session: Session, timer: _HookTimer, food_item_id: int, n_items: int, rounds: int) -> Dict[str, Dict[str, float]]:
+    """Best of `rounds` for each scenario on an order with n_items lines"""
+    best: Dict[str, Dict[str, float]] = {}
+
+    for _ in range(rounds):
+        order = Order(order_number=f"BR-BENCH-{time.perf_counter_ns()}", total_amount=0, order_type=OrderType.TAKEOUT)
+        lines = [
+            OrderItem(food_item_id=food_item_id, quantity=1, unit_price=Decimal("100.00"), vat=0)
+            for _ in range(n_items)
+        ]
+
+        def insert():
+            order.order_items = lines
+            session.add(order)
+
+        def update_all():
+            for line in lines:
+                line.quantity += 1
+
+        def update_one():
+            lines[-1].quantity += 1
+
+        for scenario, prepare in (('insert', insert), ('update_all', update_all), ('update_one', update_one)):
+            result = _timed_flush(session, timer, prepare)
+            if scenario not in best or result['seconds'] < best[scenario]['seconds']:
+                best[scenario] = result
+
+        # Keep the table from growing between sizes
+        session.delete(order)
+        session.commit()
+
+    return best
+
+
+def run(sizes: Sequence[int] = (10, 100, 1000, 5000), rounds: int = 3) -> List[Dict[str, Any]]:
+    """
+    Time flushes of one order with increasing line counts, and the share
+    spent in the order-total events, on a throwaway in-memory SQLite
+    database. Per scenario:
+
+    - insert: a new order and all its lines
+    - update_all: every line's quantity changed
+    - update_one: one line changed on an n-line order
+
+    The events should issue a constant number of statements per flush
+    and take time linear in the order's lines (update_one still sums
+    them all in SQL), i.e. a flat events_us_per_line as lines grow.
+    """
+    engine = create_engine("sqlite://")
+    db.metadata.create_all(engine)
+
+    rows = []
+    with Session(engine, expire_on_commit=False) as session:
+        category = Category(name="Benchmark", is_active=True)
+        session.add(category)
+        session.flush()
+        item = FoodItem(name="Benchmark", description="", price=Decimal("100.00"), category_id=category.id)
+        session.add(item)
+        session.commit()
+
+        with _HookTimer().installed(engine) as timer:
+            for n_items in sizes:
+                for scenario, result in _measure(session, timer, item.id, n_items, rounds).items():
+                    rows.append({
+                        'lines': n_items,
+                        'scenario': scenario,
+                        'flush_ms': round(result['seconds'] * 1000, 2),
+                        'events_ms': round(result['events_seconds'] * 1000, 3),
+                        'events_us_per_line': round(result['events_seconds'] / n_items * 1e6, 2),
+                        'event_statements': result['event_statements']
+                    })
+
+    engine.dispose()
+    return rows
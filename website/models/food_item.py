@@ -20,6 +20,15 @@ class FoodItem(db.Model, TimestampMixin):
     is_available: Mapped[bool] = mapped_column(default=True, nullable=False)
     image_url: Mapped[str | None] = mapped_column(Text)
 
+    # Denormalized rating counters (maintained by Review events)
+    rating_sum: Mapped[int] = mapped_column(default=0, server_default='0', nullable=False)
+    rating_count: Mapped[int] = mapped_column(default=0, server_default='0', nullable=False)
+    rating_1_count: Mapped[int] = mapped_column(default=0, server_default='0', nullable=False)
+    rating_2_count: Mapped[int] = mapped_column(default=0, server_default='0', nullable=False)
+    rating_3_count: Mapped[int] = mapped_column(default=0, server_default='0', nullable=False)
+    rating_4_count: Mapped[int] = mapped_column(default=0, server_default='0', nullable=False)
+    rating_5_count: Mapped[int] = mapped_column(default=0, server_default='0', nullable=False)
+
     # Relationships
     category = relationship('Category', back_populates='food_items')
     ingredients = relationship('Ingredient', back_populates='food_item', cascade='all, delete-orphan')
@@ -31,14 +40,24 @@ class FoodItem(db.Model, TimestampMixin):
     __table_args__ = (
         CheckConstraint('price >= 0', name='check_price_positive'),
         Index('idx_food_item_category_available', 'category_id', 'is_available'),
+        # Menu search (SEARCH_BACKEND=fulltext, MySQL)
+        Index('ft_food_item_text', 'name', 'description', mysql_prefix='FULLTEXT'),
     )
 
     @property
     def average_rating(self) -> float | None:
-        """Calculate average rating from reviews"""
-        if not self.reviews:
+        """Average rating from denormalized counters"""
+        if not self.rating_count:
             return None
-        return sum(r.rating for r in self.reviews) / len(self.reviews)
+        return self.rating_sum / self.rating_count
+
+    @property
+    def rating_distribution(self) -> dict[int, int]:
+        """Number of reviews for each star rating"""
+        return {
+            star: getattr(self, f'rating_{star}_count') or 0
+            for star in (5, 4, 3, 2, 1)
+        }
 
     def __repr__(self):
         return f'<FoodItem {self.name}>'
\ No newline at end of file
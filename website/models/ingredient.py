@@ -1,5 +1,5 @@
 # models/ingredient.py
-from sqlalchemy import String, ForeignKey
+from sqlalchemy import String, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from database import db
 
@@ -14,5 +14,10 @@ class Ingredient(db.Model):
     # Relationships
     food_item = relationship('FoodItem', back_populates='ingredients')
 
+    # Menu search (SEARCH_BACKEND=fulltext, MySQL)
+    __table_args__ = (
+        Index('ft_ingredient_name', 'name', mysql_prefix='FULLTEXT'),
+    )
+
     def __repr__(self):
         return f'<Ingredient {self.name}>'
\ No newline at end of file
@@ -1,6 +1,6 @@
 # models/order.py
 from decimal import Decimal
-from datetime import datetime
+from datetime import datetime, timezone
 from sqlalchemy import String, Numeric, ForeignKey, Index, CheckConstraint, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from database import db
@@ -50,20 +50,16 @@ class Order(db.Model, TimestampMixin):
         CheckConstraint('total_amount >= 0', name='check_total_amount_positive'),
         Index('idx_order_status_created', 'status', 'created_at'),
         Index('idx_order_completed_at', 'completed_at'),
+        # Keyset pagination (newest first)
+        Index('idx_order_created', 'created_at', 'id'),
+        Index('idx_order_customer_created', 'customer_id', 'created_at'),
     )
 
     @staticmethod
     def generate_order_number() -> str:
         """Generate unique order number: BR-YYYYMMDD-XXX"""
-        from datetime import datetime
-        today = datetime.now().strftime('%Y%m%d')
-
-        # Get today's order count
-        count = db.session.query(Order).filter(
-            Order.order_number.like(f'BR-{today}-%')
-        ).count()
-
-        return f'BR-{today}-{count + 1:03d}'
+        from website.modules import OrderNumberAllocator
+        return OrderNumberAllocator.next_number()
 
     def calculate_total(self):
         """Recalculate total from order items"""
@@ -27,10 +27,16 @@ class OrderItem(db.Model):
         CheckConstraint('subtotal >= 0', name='check_subtotal_positive'),
     )
 
+    @staticmethod
+    def compute_subtotal(quantity: int, unit_price: Decimal, vat=0) -> Decimal:
+        """Line subtotal including VAT"""
+        subtotal = quantity * unit_price
+        return subtotal + (subtotal * (vat or 0))
+
     def calculate_subtotal(self):
         """Calculate subtotal from quantity and unit price"""
-        subtotal = self.quantity * self.unit_price
-        self.subtotal = subtotal + (subtotal * self.vat)
+        # Column default for vat is only applied at INSERT, after this runs
+        self.subtotal = self.compute_subtotal(self.quantity, self.unit_price, self.vat)
 
     def __repr__(self):
         return f'<OrderItem order_id={self.order_id} item_id={self.food_item_id}>'
\ No newline at end of file
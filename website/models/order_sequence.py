@@ -0,0 +1,15 @@
+# models/order_sequence.py
+from datetime import date
+from sqlalchemy import Date
+from sqlalchemy.orm import Mapped, mapped_column
+from database import db
+
+class OrderSequence(db.Model):
+    """Per-day order number counter (last number handed out)"""
+    __tablename__ = 'order_sequences'
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    last_value: Mapped[int] = mapped_column(nullable=False, default=0, server_default='0')
+
+    def __repr__(self):
+        return f'<OrderSequence {self.day} {self.last_value}>'
@@ -1,6 +1,7 @@
 # services/order_service.py
 from typing import List, Dict
 from decimal import Decimal
+from sqlalchemy import insert
 from . import Order, OrderType, OrderStatus, OrderItem, FoodItem
 from website.repositories import OrderRepository
 from database import db
@@ -21,8 +22,12 @@ class OrderService:
         Create a new order with validation
         items: [{'food_item_id': 1, 'quantity': 2}, ...]
         """
+        # Nothing to order: fail before a number is allocated or a row written
+        if not items:
+            raise ValueError("Order must contain at least one item")
+
         # Validate items availability
-        food_item_ids = [item['food_item_id'] for item in items]
+        food_item_ids = {item['food_item_id'] for item in items}
         food_items = db.session.query(FoodItem).filter(
             FoodItem.id.in_(food_item_ids),
             FoodItem.is_available == True
@@ -34,11 +39,25 @@ class OrderService:
         # Create food items lookup
         food_items_map = {item.id: item for item in food_items}
 
-        # Create order
+        # Price every line up front so items can be inserted in one statement
+        item_rows = []
+        for item_data in items:
+            food_item = food_items_map[item_data['food_item_id']]
+            item_rows.append({
+                'food_item_id': food_item.id,
+                'quantity': item_data['quantity'],
+                'unit_price': food_item.price,
+                'vat': 0,
+                'subtotal': OrderItem.compute_subtotal(
+                    item_data['quantity'], food_item.price
+                ).quantize(Decimal('0.01'))
+            })
+
+        # Create order (total written with the INSERT)
         order = Order(
             customer_id=customer_id,
             order_number=Order.generate_order_number(),
-            total_amount=Decimal('0.00'),
+            total_amount=sum((row['subtotal'] for row in item_rows), Decimal('0.00')),
             order_type=order_type,
             status=OrderStatus.PENDING,
             notes=notes
@@ -46,20 +65,13 @@ class OrderService:
         db.session.add(order)
         db.session.flush()  # Get order ID
 
-        # Create order items
-        for item_data in items:
-            food_item = food_items_map[item_data['food_item_id']]
-            order_item = OrderItem(
-                order_id=order.id,
-                food_item_id=food_item.id,
-                quantity=item_data['quantity'],
-                unit_price=food_item.price,
-                subtotal=Decimal('0.00')  # Will be calculated by event
-            )
-            db.session.add(order_item)
+        # Create order items: one multi-row INSERT, no per-item events
+        for row in item_rows:
+            row['order_id'] = order.id
+        if item_rows:
+            db.session.execute(insert(OrderItem.__table__).values(item_rows))
 
         db.session.commit()
-        db.session.refresh(order)  # Refresh to get calculated total
 
         return order
 
@@ -9,9 +9,13 @@ class Review(db.Model, TimestampMixin):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey('users.id'), nullable=False)
-    food_item_id: Mapped[int] = mapped_column(ForeignKey('food_items.id'), nullable=False)
+    food_item_id: Mapped[int] = mapped_column(
+        ForeignKey('food_items.id'),
+        nullable=False,
+        active_history=True
+    )
     order_id: Mapped[int] = mapped_column(ForeignKey('orders.id'), nullable=False)
-    rating: Mapped[int] = mapped_column(nullable=False)
+    rating: Mapped[int] = mapped_column(nullable=False, active_history=True)  # Old value kept for rating counters
     comment: Mapped[str | None] = mapped_column(String(1000))
 
     # Relationships
@@ -23,6 +27,8 @@ class Review(db.Model, TimestampMixin):
     __table_args__ = (
         CheckConstraint('rating >= 1 AND rating <= 5', name='check_rating_range'),
         Index('idx_review_food_item_rating', 'food_item_id', 'rating'),
+        # Latest reviews of an item, one page at a time
+        Index('idx_review_food_item_created', 'food_item_id', 'created_at', 'id'),
     )
 
     def __repr__(self):
@@ -40,6 +40,9 @@ class User(db.Model, TimestampMixin, UserMixin):
     # Indexes for performance
     __table_args__ = (
         Index('idx_user_role_active', 'role', 'is_verified'),
+        # Keyset pagination (newest first)
+        Index('idx_user_created', 'created_at', 'id'),
+        Index('idx_user_role_created', 'role', 'created_at'),
     )
 
     def set_password(self, password: str):
@@ -0,0 +1,20 @@
+from .cache import Cache
+from .catalog_cache import CatalogCache
+from .order_numbers import OrderNumberAllocator
+from .request_tracker import RequestTracker
+from .query_profiler import QueryProfiler
+from .metrics import Metrics
+from .search import MenuSearch, FacetIndex
+from .recommendations import Recommender
+
+__all__ = [
+    "Cache",
+    "CatalogCache",
+    "OrderNumberAllocator",
+    "RequestTracker",
+    "QueryProfiler",
+    "Metrics",
+    "MenuSearch",
+    "FacetIndex",
+    "Recommender"
+]
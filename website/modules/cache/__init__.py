@@ -0,0 +1,16 @@
+from .cache_backend import CacheBackend
+from .memory_backend import MemoryCache
+from .filesystem_backend import FileSystemCache
+from .redis_backend import RedisCache, RedisError
+from .fake_redis_server import FakeRedisServer
+from .cache_manager import Cache
+
+__all__ = [
+    "Cache",
+    "CacheBackend",
+    "MemoryCache",
+    "FileSystemCache",
+    "RedisCache",
+    "RedisError",
+    "FakeRedisServer"
+]
@@ -0,0 +1,71 @@
+import pickle
+from typing import Any, Callable, Optional
+
+
+# Cache Backend Interface
+class CacheBackend:
+    """
+    Base class for cache backends.
+    Values are pickled so any backend can hold service payloads.
+    Timeouts are in seconds; None/0 means no expiry.
+    """
+
+    def __init__(self, key_prefix: str = "", default_timeout: int = 300):
+        self.key_prefix = key_prefix
+        self.default_timeout = default_timeout
+
+        # get_or_set outcomes (process-local, for metrics)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Any:
+        """Get value for key, or None if missing/expired"""
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        """Store value for key"""
+        raise NotImplementedError
+
+    def delete(self, key: str) -> bool:
+        """Remove key"""
+        raise NotImplementedError
+
+    def clear(self) -> bool:
+        """Remove every key owned by this backend"""
+        raise NotImplementedError
+
+    def get_or_set(
+        self,
+        key: str,
+        builder: Callable[[], Any],
+        timeout: Optional[int] = None
+    ) -> Any:
+        """Get cached value, building and storing it on a miss"""
+        value = self.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = builder()
+        if value is not None:
+            self.set(key, value, timeout)
+        return value
+
+    # Helper Methods
+
+    def _key(self, key: str) -> str:
+        """Namespace key with the configured prefix"""
+        return f"{self.key_prefix}{key}"
+
+    def _timeout(self, timeout: Optional[int]) -> int:
+        """Resolve timeout, falling back to the backend default"""
+        return self.default_timeout if timeout is None else int(timeout)
+
+    @staticmethod
+    def _dumps(value: Any) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _loads(data) -> Any:
+        return pickle.loads(data)
@@ -0,0 +1,102 @@
+from typing import Any, Callable, Optional
+
+from flask import Flask, current_app, has_app_context
+
+from .cache_backend import CacheBackend
+from .memory_backend import MemoryCache
+from .filesystem_backend import FileSystemCache
+from .redis_backend import RedisCache
+
+
+# Cache Access Point
+class Cache:
+    """
+    Builds the configured cache backend and exposes it to services.
+    Backend is chosen by CACHE_BACKEND: "memory", "filesystem" or "redis".
+    """
+
+    EXTENSION_KEY = "cache"
+
+    # Used outside an app context (CLI scripts, tests)
+    _fallback: Optional[CacheBackend] = None
+
+    @classmethod
+    def init_app(cls, app: Flask) -> CacheBackend:
+        """Create the backend from app config and register it on the app"""
+        backend = cls.create_backend(app.config)
+        app.extensions[cls.EXTENSION_KEY] = backend
+        return backend
+
+    @staticmethod
+    def create_backend(config) -> CacheBackend:
+        """Instantiate a backend from a config mapping"""
+        kind = str(config.get("CACHE_BACKEND", "memory")).strip().lower()
+        prefix = config.get("CACHE_KEY_PREFIX", "")
+        timeout = int(config.get("CACHE_DEFAULT_TIMEOUT", 300))
+
+        if kind == "redis":
+            return RedisCache(
+                url=config.get("CACHE_REDIS_URL", "redis://localhost:6379/0"),
+                key_prefix=prefix,
+                default_timeout=timeout,
+                socket_timeout=float(config.get("CACHE_REDIS_TIMEOUT", 0.5))
+            )
+
+        if kind == "filesystem":
+            return FileSystemCache(
+                cache_dir=config.get("CACHE_DIR", "cache"),
+                key_prefix=prefix,
+                default_timeout=timeout
+            )
+
+        if kind == "memory":
+            return MemoryCache(
+                key_prefix=prefix,
+                default_timeout=timeout,
+                max_entries=int(config.get("CACHE_MAX_ENTRIES", 1024))
+            )
+
+        raise ValueError(f"Unknown CACHE_BACKEND '{kind}'")
+
+    @classmethod
+    def backend(cls) -> CacheBackend:
+        """Backend for the current app (process-local LRU without one)"""
+        if has_app_context():
+            backend = current_app.extensions.get(cls.EXTENSION_KEY)
+            if backend is None:
+                backend = cls.init_app(current_app)
+            return backend
+
+        if cls._fallback is None:
+            cls._fallback = MemoryCache()
+        return cls._fallback
+
+    @staticmethod
+    def timeout(config_key: str, default: int = 300) -> int:
+        """Read a per-feature timeout (seconds) from app config"""
+        if has_app_context():
+            return int(current_app.config.get(config_key, default))
+        return default
+
+    # Shortcuts
+
+    @classmethod
+    def get(cls, key: str) -> Any:
+        return cls.backend().get(key)
+
+    @classmethod
+    def set(cls, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        return cls.backend().set(key, value, timeout)
+
+    @classmethod
+    def delete(cls, key: str) -> bool:
+        return cls.backend().delete(key)
+
+    @classmethod
+    def get_or_set(
+        cls,
+        key: str,
+        builder: Callable[[], Any],
+        timeout: Optional[int] = None
+    ) -> Any:
+        return cls.backend().get_or_set(key, builder, timeout)
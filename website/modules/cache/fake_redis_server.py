@@ -0,0 +1,235 @@
+import time
+import socket
+import fnmatch
+import threading
+import socketserver
+from typing import Dict, Optional, Set, Tuple
+
+from .redis_backend import RedisConnection
+
+
+class _RESPHandler(socketserver.StreamRequestHandler):
+    """Serves one client connection until it disconnects"""
+
+    def handle(self):
+        server: "FakeRedisServer" = self.server.owner
+        server._connected(self.connection)
+        try:
+            while True:
+                try:
+                    command = RedisConnection.read_reply(self.rfile)
+                except (ConnectionError, OSError, ValueError):
+                    return
+
+                if not isinstance(command, list) or not command:
+                    self.wfile.write(b"-ERR Protocol error\r\n")
+                    continue
+
+                self.wfile.write(server.dispatch(command))
+        finally:
+            server._disconnected(self.connection)
+
+
+class _ThreadingServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+# Fake Redis Server
+class FakeRedisServer:
+    """
+    Pure-Python, in-memory server speaking the RESP subset used by
+    RedisCache (PING, AUTH, SELECT, GET, SET [EX|PX|NX], DEL, EXISTS,
+    INCR, EXPIRE, TTL, KEYS, FLUSHDB, DBSIZE). For local runs and tests.
+
+    Usage:
+        with FakeRedisServer() as server:
+            cache = RedisCache(url=server.url)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self._data: Dict[bytes, Tuple[bytes, Optional[float]]] = {}
+        self._lock = threading.Lock()
+        self._clients: Set[socket.socket] = set()
+        self._server = _ThreadingServer((host, port), _RESPHandler)
+        self._server.owner = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def host(self) -> str:
+        return self._server.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def url(self) -> str:
+        return f"redis://{self.host}:{self.port}/0"
+
+    def start(self) -> "FakeRedisServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def disconnect_clients(self) -> int:
+        """Drop every open client connection (simulates a server restart); returns how many"""
+        with self._lock:
+            clients = list(self._clients)
+        for client in clients:
+            try:
+                client.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        return len(clients)
+
+    def __enter__(self) -> "FakeRedisServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # Command Handling
+
+    def dispatch(self, command) -> bytes:
+        name = command[0].decode("utf-8").upper()
+        args = command[1:]
+
+        handler = getattr(self, f"_cmd_{name.lower()}", None)
+        if handler is None:
+            return self._error(f"unknown command '{name}'")
+
+        try:
+            with self._lock:
+                return handler(*args)
+        except (TypeError, ValueError, IndexError):
+            return self._error(f"wrong arguments for '{name}' command")
+
+    def _cmd_ping(self, *args):
+        return self._simple("PONG")
+
+    def _cmd_auth(self, *args):
+        return self._simple("OK")
+
+    def _cmd_select(self, db):
+        return self._simple("OK")
+
+    def _cmd_get(self, key):
+        return self._bulk(self._value(key))
+
+    def _cmd_set(self, key, value, *options):
+        expires_at = None
+        only_new = False
+
+        options = [opt.decode("utf-8").upper() for opt in options]
+        i = 0
+        while i < len(options):
+            if options[i] == "EX":
+                expires_at = time.monotonic() + int(options[i + 1])
+                i += 2
+            elif options[i] == "PX":
+                expires_at = time.monotonic() + int(options[i + 1]) / 1000
+                i += 2
+            elif options[i] == "NX":
+                only_new = True
+                i += 1
+            else:
+                return self._error("syntax error")
+
+        if only_new and self._value(key) is not None:
+            return self._bulk(None)
+
+        self._data[key] = (value, expires_at)
+        return self._simple("OK")
+
+    def _cmd_del(self, *keys):
+        removed = sum(1 for key in keys if self._value(key) is not None and self._data.pop(key, None))
+        return self._integer(removed)
+
+    def _cmd_exists(self, *keys):
+        return self._integer(sum(1 for key in keys if self._value(key) is not None))
+
+    def _cmd_incr(self, key):
+        current = self._value(key)
+        number = int(current or 0) + 1
+        expires_at = self._data[key][1] if current is not None else None
+        self._data[key] = (str(number).encode("utf-8"), expires_at)
+        return self._integer(number)
+
+    def _cmd_expire(self, key, seconds):
+        current = self._value(key)
+        if current is None:
+            return self._integer(0)
+        self._data[key] = (current, time.monotonic() + int(seconds))
+        return self._integer(1)
+
+    def _cmd_ttl(self, key):
+        if self._value(key) is None:
+            return self._integer(-2)
+        expires_at = self._data[key][1]
+        if expires_at is None:
+            return self._integer(-1)
+        return self._integer(max(0, int(expires_at - time.monotonic())))
+
+    def _cmd_keys(self, pattern):
+        pattern = pattern.decode("utf-8")
+        keys = [
+            key for key in list(self._data)
+            if self._value(key) is not None and fnmatch.fnmatchcase(key.decode("utf-8"), pattern)
+        ]
+        return self._array(keys)
+
+    def _cmd_flushdb(self, *args):
+        self._data.clear()
+        return self._simple("OK")
+
+    def _cmd_dbsize(self):
+        return self._integer(sum(1 for key in list(self._data) if self._value(key) is not None))
+
+    # Helper Methods
+
+    def _connected(self, client: socket.socket) -> None:
+        with self._lock:
+            self._clients.add(client)
+
+    def _disconnected(self, client: socket.socket) -> None:
+        with self._lock:
+            self._clients.discard(client)
+
+    def _value(self, key) -> Optional[bytes]:
+        """Current value for key, dropping it if expired"""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    @staticmethod
+    def _simple(text: str) -> bytes:
+        return f"+{text}\r\n".encode("utf-8")
+
+    @staticmethod
+    def _error(text: str) -> bytes:
+        return f"-ERR {text}\r\n".encode("utf-8")
+
+    @staticmethod
+    def _integer(number: int) -> bytes:
+        return b":%d\r\n" % number
+
+    @staticmethod
+    def _bulk(value: Optional[bytes]) -> bytes:
+        if value is None:
+            return b"$-1\r\n"
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+
+    @classmethod
+    def _array(cls, values) -> bytes:
+        return b"*%d\r\n" % len(values) + b"".join(cls._bulk(v) for v in values)
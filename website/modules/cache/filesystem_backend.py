@@ -0,0 +1,88 @@
+import os
+import mmap
+import time
+import struct
+import hashlib
+import tempfile
+from typing import Any, Optional
+
+from .cache_backend import CacheBackend
+
+# Entry header: expiry as unix timestamp (0 = never)
+HEADER = struct.Struct("<d")
+
+
+# Filesystem Backend
+class FileSystemCache(CacheBackend):
+    """
+    Cache shared by every worker on the same host.
+    One file per key; reads are memory-mapped and writes are atomic
+    (temp file + rename), so workers never see partial entries.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = "cache",
+        key_prefix: str = "",
+        default_timeout: int = 300
+    ):
+        super().__init__(key_prefix, default_timeout)
+        self.cache_dir = cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def get(self, key: str) -> Any:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size <= HEADER.size:
+                    return None
+
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    (expires_at,) = HEADER.unpack_from(mm, 0)
+                    if expires_at and expires_at <= time.time():
+                        self._remove(path)
+                        return None
+
+                    return self._loads(memoryview(mm)[HEADER.size:])
+        except FileNotFoundError:
+            return None
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        timeout = self._timeout(timeout)
+        expires_at = time.time() + timeout if timeout else 0.0
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(HEADER.pack(expires_at))
+                f.write(self._dumps(value))
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            self._remove(tmp_path)
+            raise
+        return True
+
+    def delete(self, key: str) -> bool:
+        return self._remove(self._path(key))
+
+    def clear(self) -> bool:
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".cache"):
+                self._remove(os.path.join(self.cache_dir, name))
+        return True
+
+    # Helper Methods
+
+    def _path(self, key: str) -> str:
+        """Hash key into a safe filename"""
+        digest = hashlib.sha1(self._key(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.cache")
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
@@ -0,0 +1,63 @@
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+from .cache_backend import CacheBackend
+
+
+# In-Process LRU Backend
+class MemoryCache(CacheBackend):
+    """
+    Thread-safe LRU cache local to one process.
+    Stores live objects (no pickling); evicts least recently used
+    entries once max_entries is reached.
+    """
+
+    def __init__(
+        self,
+        key_prefix: str = "",
+        default_timeout: int = 300,
+        max_entries: int = 1024
+    ):
+        super().__init__(key_prefix, default_timeout)
+        self.max_entries = max_entries
+        self._store: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        key = self._key(key)
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at and expires_at <= time.monotonic():
+                del self._store[key]
+                return None
+
+            self._store.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        timeout = self._timeout(timeout)
+        expires_at = time.monotonic() + timeout if timeout else 0
+
+        with self._lock:
+            key = self._key(key)
+            self._store[key] = (expires_at, value)
+            self._store.move_to_end(key)
+
+            while len(self._store) > self.max_entries:
+                self._store.popitem(last=False)
+        return True
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._store.pop(self._key(key), None) is not None
+
+    def clear(self) -> bool:
+        with self._lock:
+            self._store.clear()
+        return True
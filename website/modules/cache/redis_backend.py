@@ -0,0 +1,186 @@
+import os
+import socket
+import threading
+from typing import Any, List, Optional
+from urllib.parse import urlparse, unquote
+
+from .cache_backend import CacheBackend
+
+
+class RedisError(Exception):
+    """Error reply or protocol failure from a Redis-compatible server"""
+
+
+# RESP Connection
+class RedisConnection:
+    """Minimal RESP2 client connection (no external dependency)"""
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: str = None,
+        timeout: float = 0.5
+    ):
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._reader = None
+
+    def connect(self) -> None:
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock = sock
+        self._reader = sock.makefile("rb")
+
+        if self.password:
+            self.execute("AUTH", self.password)
+        if self.db:
+            self.execute("SELECT", self.db)
+
+    def close(self) -> None:
+        for resource in (self._reader, self._sock):
+            try:
+                if resource:
+                    resource.close()
+            except OSError:
+                pass
+        self._sock = None
+        self._reader = None
+
+    def execute(self, *args) -> Any:
+        """Send one command and read its reply"""
+        if self._sock is None:
+            self.connect()
+
+        self._sock.sendall(self.encode(args))
+        return self.read_reply(self._reader)
+
+    # Protocol
+
+    @staticmethod
+    def encode(args) -> bytes:
+        parts: List[bytes] = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if isinstance(arg, bytes):
+                data = arg
+            else:
+                data = str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        return b"".join(parts)
+
+    @classmethod
+    def read_reply(cls, reader) -> Any:
+        line = reader.readline()
+        if not line:
+            raise ConnectionError("Connection closed by server")
+
+        kind, payload = line[:1], line[1:-2]
+
+        if kind == b"+":
+            return payload.decode("utf-8")
+        if kind == b"-":
+            raise RedisError(payload.decode("utf-8"))
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length == -1:
+                return None
+            data = reader.read(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            count = int(payload)
+            if count == -1:
+                return None
+            return [cls.read_reply(reader) for _ in range(count)]
+
+        raise RedisError(f"Unknown reply type: {line!r}")
+
+
+# Redis Backend
+class RedisCache(CacheBackend):
+    """
+    Cache on a Redis-compatible server, shared across workers and hosts.
+    One connection per thread; connections are rebuilt after a fork
+    or a network failure. Failures degrade to cache misses.
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        key_prefix: str = "",
+        default_timeout: int = 300,
+        socket_timeout: float = 0.5
+    ):
+        super().__init__(key_prefix, default_timeout)
+
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.db = int((parsed.path or "/0").lstrip("/") or 0)
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.socket_timeout = socket_timeout
+
+        self._local = threading.local()
+
+    def get(self, key: str) -> Any:
+        data = self._execute("GET", self._key(key))
+        return self._loads(data) if data is not None else None
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        timeout = self._timeout(timeout)
+        args = ["SET", self._key(key), self._dumps(value)]
+        if timeout:
+            args += ["EX", timeout]
+        return self._execute(*args) == "OK"
+
+    def delete(self, key: str) -> bool:
+        return bool(self._execute("DEL", self._key(key)))
+
+    def clear(self) -> bool:
+        # Only flush everything when not sharing the server via a prefix
+        if not self.key_prefix:
+            return self._execute("FLUSHDB") == "OK"
+
+        keys = self._execute("KEYS", f"{self.key_prefix}*") or []
+        if keys:
+            self._execute("DEL", *keys)
+        return True
+
+    def ping(self) -> bool:
+        return self._execute("PING") == "PONG"
+
+    # Helper Methods
+
+    def _connection(self) -> RedisConnection:
+        """Per-thread connection, recreated in forked workers"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = RedisConnection(
+                host=self.host,
+                port=self.port,
+                db=self.db,
+                password=self.password,
+                timeout=self.socket_timeout
+            )
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _execute(self, *args) -> Any:
+        conn = self._connection()
+        try:
+            return conn.execute(*args)
+        except (OSError, ConnectionError):
+            # One retry on a fresh connection (server restart, idle timeout)
+            conn.close()
+            try:
+                return conn.execute(*args)
+            except (OSError, ConnectionError):
+                conn.close()
+                return None
@@ -0,0 +1,161 @@
+import time
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .cache import Cache
+
+
+# Catalog Snapshot Cache
+class CatalogCache:
+    """
+    Snapshot of the public menu catalog.
+    Holds categories and menu items (prices, images, rating stats)
+    with a TTL and a version stamp bumped on every invalidation.
+
+    The version stamp and snapshot live in the shared cache backend so
+    all workers see the same catalog; each process also keeps the last
+    snapshot in memory and reuses it while the shared version matches.
+    """
+
+    DEFAULT_TTL = 300
+
+    VERSION_KEY = "catalog:version"
+    SNAPSHOT_KEY = "catalog:snapshot:{version}"
+
+    _lock = threading.Lock()
+    _snapshot: Optional[Dict[str, Any]] = None
+    _expires_at: float = 0.0
+
+    _hits: int = 0
+    _shared_hits: int = 0
+    _misses: int = 0
+    _invalidations: int = 0
+
+    @classmethod
+    def ttl(cls) -> int:
+        """Snapshot lifetime in seconds (CATALOG_CACHE_TTL)"""
+        return Cache.timeout("CATALOG_CACHE_TTL", cls.DEFAULT_TTL)
+
+    @classmethod
+    def get_snapshot(cls, builder: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Return the cached snapshot, rebuilding it with `builder` when
+        missing, expired or superseded by another worker's invalidation.
+        Builder returns {'categories': [...], 'items': [...]}.
+        """
+        version = cls.version()
+
+        snapshot = cls._snapshot
+        if cls._is_current(snapshot, version):
+            cls._hits += 1
+            return snapshot
+
+        with cls._lock:
+            # Another thread may have refreshed while we waited
+            if cls._is_current(cls._snapshot, version):
+                cls._hits += 1
+                return cls._snapshot
+
+            backend = Cache.backend()
+            snapshot_key = cls.SNAPSHOT_KEY.format(version=version)
+            ttl = cls.ttl()
+
+            # Built by another worker
+            snapshot = backend.get(snapshot_key)
+            if snapshot is not None:
+                cls._hits += 1
+                cls._shared_hits += 1
+            else:
+                # Build under the lock so concurrent misses query the DB once
+                cls._misses += 1
+                snapshot = cls._index(builder(), version)
+                backend.set(snapshot_key, snapshot, ttl)
+
+            cls._snapshot = snapshot
+            cls._expires_at = time.monotonic() + ttl
+
+            return snapshot
+
+    @classmethod
+    def invalidate(cls) -> Tuple[Optional[int], int]:
+        """
+        Publish a new version stamp (call after committing catalog edits).
+        Returns the (previous, new) stamps for derived in-process indexes.
+        """
+        with cls._lock:
+            previous = Cache.get(cls.VERSION_KEY)
+            version = time.time_ns()
+            Cache.set(cls.VERSION_KEY, version, 0)
+            cls._snapshot = None
+            cls._expires_at = 0.0
+            cls._invalidations += 1
+            return previous, version
+
+    @classmethod
+    def version(cls) -> int:
+        """Current shared catalog version stamp"""
+        version = Cache.get(cls.VERSION_KEY)
+        if version is None:
+            version = time.time_ns()
+            Cache.set(cls.VERSION_KEY, version, 0)
+        return version
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """Hit/miss counters for verifying cache effectiveness"""
+        lookups = cls._hits + cls._misses
+        snapshot = cls._snapshot
+        return {
+            'hits': cls._hits,
+            'shared_hits': cls._shared_hits,
+            'misses': cls._misses,
+            'invalidations': cls._invalidations,
+            'hit_ratio': round(cls._hits / lookups, 4) if lookups else 0.0,
+            'version': snapshot['version'] if snapshot else None,
+            'cached': snapshot is not None
+        }
+
+    @classmethod
+    def reset_stats(cls) -> None:
+        """Zero the hit/miss counters"""
+        with cls._lock:
+            cls._hits = 0
+            cls._shared_hits = 0
+            cls._misses = 0
+            cls._invalidations = 0
+
+    # Helper Methods
+
+    @classmethod
+    def _is_current(cls, snapshot: Optional[Dict[str, Any]], version: int) -> bool:
+        return (
+            snapshot is not None
+            and snapshot['version'] == version
+            and time.monotonic() < cls._expires_at
+        )
+
+    @staticmethod
+    def _index(data: Dict[str, Any], version: int) -> Dict[str, Any]:
+        """
+        Attach lookup tables to freshly built catalog data.
+        'items' and 'items_by_category' hold available items only;
+        sold-out ones (is_available False) go to 'sold_out'.
+        'items_by_id' covers both. Other builder keys are kept as-is.
+        """
+        items = [item for item in data.get('items', []) if item.get('is_available', True)]
+        sold_out = [item for item in data.get('items', []) if not item.get('is_available', True)]
+
+        items_by_category: Dict[int, list] = {}
+        for item in items:
+            items_by_category.setdefault(item['category']['id'], []).append(item)
+
+        return {
+            **data,
+            'version': version,
+            'built_at': time.time(),
+            'categories': data.get('categories', []),
+            'items': items,
+            'sold_out': sold_out,
+            'items_by_id': {item['id']: item for item in items + sold_out},
+            'items_by_category': items_by_category
+        }
@@ -0,0 +1,494 @@
+import os
+import json
+import time
+import bisect
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from flask import Flask, current_app, g, request, has_request_context
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from database import db
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process servers only
+    fcntl = None
+
+
+# Metric Families: name -> (type, help)
+FAMILIES = {
+    "http_requests_total": ("counter", "HTTP requests by endpoint, method and status"),
+    "http_request_duration_seconds": ("histogram", "HTTP request latency by endpoint"),
+    "db_pool_checkout_wait_seconds": ("histogram", "Time spent waiting for a pooled DB connection"),
+    "db_pool_size": ("gauge", "Configured DB pool size (summed over workers)"),
+    "db_pool_checked_out": ("gauge", "DB connections currently checked out"),
+    "db_pool_overflow": ("gauge", "DB connections currently open beyond pool_size"),
+    "cache_requests_total": ("counter", "Cache lookups by cache and result"),
+    "cache_hit_ratio": ("gauge", "Cache hits / lookups since worker start"),
+    "mail_queue_messages": ("gauge", "Spooled mail messages by state"),
+    "orders_created_total": ("counter", "Orders created by order type"),
+    "orders_status_total": ("counter", "Order status transitions by new status"),
+}
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+# Metrics Registry
+class Metrics:
+    """
+    Prometheus-style metrics for every worker on the box.
+
+    Each worker keeps counters/histograms in memory and snapshots them
+    to METRICS_DIR/metrics-<pid>.json every METRICS_FLUSH_INTERVAL
+    seconds. A /metrics scrape flushes the serving worker, then merges
+    all snapshots: counters and histograms are summed over every file,
+    gauges only over live workers.
+
+    Snapshots of exited workers (not rewritten for RETIRE_AFTER_FLUSHES
+    intervals) are folded into METRICS_DIR/archive.json and deleted, as
+    is a file left by an earlier process with the same pid before a new
+    worker first writes it, so totals stay monotonic without the
+    directory growing.
+    """
+
+    RETIRE_AFTER_FLUSHES = 12
+    ARCHIVE_FILE = "archive.json"
+
+    _lock = threading.Lock()
+    _archive_mutex = threading.Lock()
+    _counters: Dict[Tuple[str, LabelKey], float] = {}
+    _histograms: Dict[Tuple[str, LabelKey], Dict] = {}
+    _gauges: Dict[Tuple[str, LabelKey], float] = {}
+    _pid: Optional[int] = None
+    _started_at: float = 0.0
+    _claimed: bool = False
+    _flusher: Optional[threading.Thread] = None
+    _app: Optional[Flask] = None
+
+    @classmethod
+    def init_app(cls, app: Flask) -> None:
+        cls._app = app
+
+        app.before_request(cls._start_request)
+        app.after_request(cls._finish_request)
+
+        with app.app_context():
+            cls._instrument_pool(db.engine)
+
+        if not event.contains(Session, "after_flush", cls._track_orders):
+            event.listen(Session, "after_flush", cls._track_orders)
+            event.listen(Session, "after_commit", cls._count_orders)
+            event.listen(Session, "after_rollback", cls._discard_orders)
+
+    # Recording
+
+    @classmethod
+    def inc(cls, name: str, amount: float = 1, **labels) -> None:
+        key = (name, cls._labels(labels))
+        with cls._lock:
+            cls._reset_after_fork()
+            cls._counters[key] = cls._counters.get(key, 0) + amount
+
+    @classmethod
+    def observe(cls, name: str, value: float, buckets=LATENCY_BUCKETS, **labels) -> None:
+        key = (name, cls._labels(labels))
+        with cls._lock:
+            cls._reset_after_fork()
+            histogram = cls._histograms.get(key)
+            if histogram is None:
+                histogram = cls._histograms[key] = {
+                    'buckets': list(buckets),
+                    'counts': [0] * len(buckets),
+                    'sum': 0.0,
+                    'count': 0
+                }
+            index = bisect.bisect_left(histogram['buckets'], value)
+            if index < len(histogram['counts']):
+                histogram['counts'][index] += 1
+            histogram['sum'] += value
+            histogram['count'] += 1
+
+    @classmethod
+    def set_gauge(cls, name: str, value: float, **labels) -> None:
+        with cls._lock:
+            cls._reset_after_fork()
+            cls._gauges[(name, cls._labels(labels))] = value
+
+    # Exposition
+
+    @classmethod
+    def render(cls) -> str:
+        """Merged text exposition for every worker"""
+        cls._collect_gauges()
+        cls.flush()
+        cls._retire_exited()
+
+        counters: Dict = {}
+        histograms: Dict = {}
+        gauges: Dict = {}
+
+        archive = cls._read(os.path.join(cls._directory(), cls.ARCHIVE_FILE))
+        if archive:
+            cls._add_totals(counters, histograms, archive)
+
+        for _, snapshot in cls._snapshots():
+            cls._add_totals(counters, histograms, snapshot)
+
+            if cls._alive(snapshot.get('pid', 0), snapshot):
+                for name, labels, value in snapshot['gauges']:
+                    key = (name, tuple(map(tuple, labels)))
+                    gauges[key] = gauges.get(key, 0) + value
+
+        # Box-wide values
+        for state, count in cls._mail_queue_depth().items():
+            gauges[("mail_queue_messages", (("state", state),))] = count
+
+        for cache in {labels[0][1] for (name, labels) in counters if name == "cache_requests_total"}:
+            hits = counters.get(("cache_requests_total", (("cache", cache), ("result", "hit"))), 0)
+            misses = counters.get(("cache_requests_total", (("cache", cache), ("result", "miss"))), 0)
+            gauges[("cache_hit_ratio", (("cache", cache),))] = hits / (hits + misses) if hits + misses else 0.0
+
+        return cls._format(counters, histograms, gauges)
+
+    @classmethod
+    def flush(cls) -> None:
+        """Write this worker's snapshot to METRICS_DIR"""
+        with cls._lock:
+            cls._reset_after_fork()
+            snapshot = {
+                'pid': os.getpid(),
+                'started_at': cls._started_at,
+                'written_at': time.time(),
+                'counters': [[name, labels, value] for (name, labels), value in cls._counters.items()],
+                'histograms': [[name, labels, data] for (name, labels), data in cls._histograms.items()],
+                'gauges': [[name, labels, value] for (name, labels), value in cls._gauges.items()]
+            }
+
+        directory = cls._directory()
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"metrics-{os.getpid()}.json")
+
+        if not cls._claimed:
+            # An earlier process with this pid: keep its totals before overwriting
+            with cls._archive_lock(directory):
+                previous = cls._read(path)
+                if previous and previous.get('started_at') != cls._started_at:
+                    cls._archive(directory, [(path, previous)])
+            cls._claimed = True
+
+        cls._write(path, snapshot)
+
+    # Request Hooks
+
+    @classmethod
+    def _start_request(cls) -> None:
+        g.metrics_started = time.perf_counter()
+        cls._ensure_flusher()
+
+    @classmethod
+    def _finish_request(cls, response):
+        started = getattr(g, "metrics_started", None)
+        if started is None:
+            return response
+
+        endpoint = request.endpoint or "unmatched"
+        if endpoint == "metrics.metrics_view":
+            return response
+
+        cls.observe("http_request_duration_seconds", time.perf_counter() - started, endpoint=endpoint)
+        cls.inc(
+            "http_requests_total",
+            endpoint=endpoint,
+            method=request.method,
+            status=str(response.status_code)
+        )
+        return response
+
+    # DB Pool
+
+    @classmethod
+    def _instrument_pool(cls, engine) -> None:
+        pool = engine.pool
+        if getattr(pool, "_metrics_timed", False):
+            return
+        connect = pool.connect
+
+        # Pool has no "waiting" event; time the checkout call itself
+        def timed_connect():
+            started = time.perf_counter()
+            try:
+                return connect()
+            finally:
+                cls.observe("db_pool_checkout_wait_seconds", time.perf_counter() - started)
+
+        pool.connect = timed_connect
+        pool._metrics_timed = True
+
+    # Order Throughput
+
+    @staticmethod
+    def _track_orders(session, flush_context) -> None:
+        from website.models import Order
+
+        pending = session.info.setdefault('metrics_orders', [])
+        for obj in session.new:
+            if isinstance(obj, Order):
+                pending.append(("orders_created_total", {'type': obj.order_type.value}))
+        for obj in session.dirty:
+            if isinstance(obj, Order) and inspect(obj).attrs.status.history.added:
+                pending.append(("orders_status_total", {'status': obj.status.value}))
+
+    @classmethod
+    def _count_orders(cls, session) -> None:
+        for name, labels in session.info.pop('metrics_orders', None) or ():
+            cls.inc(name, **labels)
+
+    @staticmethod
+    def _discard_orders(session) -> None:
+        session.info.pop('metrics_orders', None)
+
+    # Helper Methods
+
+    @classmethod
+    def _collect_gauges(cls) -> None:
+        """Sample this worker's pool and cache state"""
+        from website.modules import Cache, CatalogCache
+
+        pool = db.engine.pool
+        for name, method in (
+            ("db_pool_size", "size"),
+            ("db_pool_checked_out", "checkedout"),
+            ("db_pool_overflow", "overflow")
+        ):
+            if hasattr(pool, method):
+                cls.set_gauge(name, max(getattr(pool, method)(), 0))
+
+        # Counters already kept by the caches; mirrored as absolute values
+        catalog = CatalogCache.stats()
+        backend = Cache.backend()
+        with cls._lock:
+            for cache, hits, misses in (
+                ("catalog", catalog['hits'], catalog['misses']),
+                ("shared", backend.hits, backend.misses)
+            ):
+                cls._counters[("cache_requests_total", (("cache", cache), ("result", "hit")))] = hits
+                cls._counters[("cache_requests_total", (("cache", cache), ("result", "miss")))] = misses
+
+    @staticmethod
+    def _mail_queue_depth() -> Dict[str, int]:
+        from utils import MailQueue
+        return MailQueue.depth()
+
+    @classmethod
+    def _snapshots(cls) -> List[Tuple[str, Dict]]:
+        """(path, snapshot) for every worker file in METRICS_DIR"""
+        directory = cls._directory()
+        snapshots = []
+        for name in os.listdir(directory):
+            if not (name.startswith("metrics-") and name.endswith(".json")):
+                continue
+            path = os.path.join(directory, name)
+            snapshot = cls._read(path)
+            if snapshot is not None:
+                snapshots.append((path, snapshot))
+        return snapshots
+
+    # Archive
+
+    @classmethod
+    def _retire_exited(cls) -> None:
+        """Fold snapshots of exited workers into the archive and delete them"""
+        directory = cls._directory()
+        cutoff = time.time() - cls.RETIRE_AFTER_FLUSHES * cls._flush_interval()
+
+        with cls._archive_lock(directory):
+            exited = [
+                (path, snapshot)
+                for path, snapshot in cls._snapshots()
+                if snapshot.get('pid') != os.getpid() and snapshot.get('written_at', 0) < cutoff
+            ]
+            if exited:
+                cls._archive(directory, exited)
+
+    @classmethod
+    def _archive(cls, directory: str, snapshots: List[Tuple[str, Dict]]) -> None:
+        """Add counters/histograms of `snapshots` to the archive, then remove their files (caller holds the archive lock)"""
+        archive_path = os.path.join(directory, cls.ARCHIVE_FILE)
+
+        counters: Dict = {}
+        histograms: Dict = {}
+        for snapshot in [cls._read(archive_path)] + [snapshot for _, snapshot in snapshots]:
+            if snapshot:
+                cls._add_totals(counters, histograms, snapshot)
+
+        cls._write(archive_path, {
+            'written_at': time.time(),
+            'counters': [[name, labels, value] for (name, labels), value in counters.items()],
+            'histograms': [[name, labels, data] for (name, labels), data in histograms.items()]
+        })
+
+        for path, _ in snapshots:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    @classmethod
+    @contextmanager
+    def _archive_lock(cls, directory: str) -> Iterator[None]:
+        """Serialise archive updates across threads and worker processes"""
+        with cls._archive_mutex:
+            if fcntl is None:
+                yield
+                return
+
+            os.makedirs(directory, exist_ok=True)
+            with open(os.path.join(directory, "archive.lock"), "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _add_totals(counters: Dict, histograms: Dict, snapshot: Dict) -> None:
+        """Sum a snapshot's counters and histograms into the given totals"""
+        for name, labels, value in snapshot.get('counters', ()):
+            key = (name, tuple(map(tuple, labels)))
+            counters[key] = counters.get(key, 0) + value
+
+        for name, labels, data in snapshot.get('histograms', ()):
+            key = (name, tuple(map(tuple, labels)))
+            merged = histograms.setdefault(key, {
+                'buckets': data['buckets'],
+                'counts': [0] * len(data['buckets']),
+                'sum': 0.0,
+                'count': 0
+            })
+            merged['counts'] = [a + b for a, b in zip(merged['counts'], data['counts'])]
+            merged['sum'] += data['sum']
+            merged['count'] += data['count']
+
+    @staticmethod
+    def _read(path: str) -> Optional[Dict]:
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write(path: str, data: Dict) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def _alive(cls, pid: int, snapshot: Dict) -> bool:
+        if pid == os.getpid():
+            return True
+        # A live worker rewrites its snapshot every flush interval
+        return time.time() - snapshot.get('written_at', 0) < 3 * cls._flush_interval()
+
+    @classmethod
+    def _ensure_flusher(cls) -> None:
+        if cls._flusher is not None and cls._pid == os.getpid():
+            return
+
+        with cls._lock:
+            cls._reset_after_fork()
+            if cls._flusher is not None:
+                return
+
+            interval = cls._flush_interval()
+
+            def run():
+                while True:
+                    time.sleep(interval)
+                    try:
+                        with cls._app.app_context():
+                            cls._collect_gauges()
+                        cls.flush()
+                    except Exception:
+                        pass
+
+            cls._flusher = threading.Thread(target=run, name="metrics-flusher", daemon=True)
+            cls._flusher.start()
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        """Forked workers start from empty series (caller holds the lock)"""
+        if cls._pid != os.getpid():
+            cls._pid = os.getpid()
+            cls._started_at = time.time()
+            cls._claimed = False
+            cls._counters = {}
+            cls._histograms = {}
+            cls._gauges = {}
+            cls._flusher = None
+
+    @classmethod
+    def _directory(cls) -> str:
+        app = current_app if has_request_context() else cls._app
+        return (app.config.get("METRICS_DIR") if app else None) or os.path.join("tmp", "metrics")
+
+    @classmethod
+    def _flush_interval(cls) -> float:
+        app = cls._app
+        return float(app.config.get("METRICS_FLUSH_INTERVAL", 5)) if app else 5.0
+
+    @staticmethod
+    def _labels(labels: Dict[str, str]) -> LabelKey:
+        return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    @staticmethod
+    def _format(counters: Dict, histograms: Dict, gauges: Dict) -> str:
+        prefix = "breakfast_bar_"
+
+        def escape(value) -> str:
+            return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+        def label_text(labels, extra=()):
+            pairs = list(labels) + list(extra)
+            if not pairs:
+                return ""
+            return "{" + ",".join(f'{key}="{escape(value)}"' for key, value in pairs) + "}"
+
+        series: Dict[str, List[str]] = {}
+
+        for (name, labels), value in sorted(counters.items()):
+            series.setdefault(name, []).append(f"{prefix}{name}{label_text(labels)} {value}")
+
+        for (name, labels), value in sorted(gauges.items()):
+            series.setdefault(name, []).append(f"{prefix}{name}{label_text(labels)} {value}")
+
+        for (name, labels), data in sorted(histograms.items(), key=lambda item: item[0]):
+            lines = series.setdefault(name, [])
+            cumulative = 0
+            for bound, count in zip(data['buckets'], data['counts']):
+                cumulative += count
+                lines.append(f"{prefix}{name}_bucket{label_text(labels, [('le', bound)])} {cumulative}")
+            lines.append(f"{prefix}{name}_bucket{label_text(labels, [('le', '+Inf')])} {data['count']}")
+            lines.append(f"{prefix}{name}_sum{label_text(labels)} {data['sum']}")
+            lines.append(f"{prefix}{name}_count{label_text(labels)} {data['count']}")
+
+        output = []
+        for name, lines in series.items():
+            kind, help_text = FAMILIES.get(name, ("untyped", name))
+            output.append(f"# HELP {prefix}{name} {help_text}")
+            output.append(f"# TYPE {prefix}{name} {kind}")
+            output.extend(lines)
+
+        return "\n".join(output) + "\n"
@@ -0,0 +1,140 @@
+import os
+import threading
+from datetime import date
+from typing import Dict, Tuple
+
+from flask import current_app, has_app_context
+from sqlalchemy import insert, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
+
+from database import db
+
+
+# Order Number Allocator
+class OrderNumberAllocator:
+    """
+    Hands out BR-YYYYMMDD-XXX order numbers from the per-day
+    order_sequences counter instead of counting today's orders.
+
+    Each allocation is one atomic increment in its own short
+    transaction, so concurrent checkouts never see the same value.
+    With ORDER_NUMBER_BLOCK_SIZE > 1 a worker reserves a block of
+    numbers per increment and serves the rest from memory; numbers stay
+    unique but are no longer strictly in checkout order, and unused
+    numbers of a block are skipped when the worker exits.
+    """
+
+    PREFIX = "BR"
+    DEFAULT_BLOCK_SIZE = 1
+
+    _lock = threading.Lock()
+    _blocks: Dict[date, Tuple[int, int]] = {}  # day -> (next, last)
+    _pid: int = os.getpid()
+
+    @classmethod
+    def next_number(cls, day: date = None) -> str:
+        """Allocate the next order number for a day (default: today)"""
+        if day is None:
+            from website.repositories import DateRange
+            day = DateRange.today()
+
+        return cls.format(day, cls.next_value(day))
+
+    @classmethod
+    def next_value(cls, day: date) -> int:
+        """Allocate the next sequence value for a day"""
+        with cls._lock:
+            # Blocks reserved by the parent must not be reused after fork
+            if cls._pid != os.getpid():
+                cls._blocks = {}
+                cls._pid = os.getpid()
+
+            next_value, last_value = cls._blocks.get(day, (1, 0))
+            if next_value > last_value:
+                size = cls.block_size()
+                last_value = cls.reserve(day, size)
+                next_value = last_value - size + 1
+
+                # Earlier days' blocks are never needed again
+                cls._blocks = {}
+
+            cls._blocks[day] = (next_value + 1, last_value)
+            return next_value
+
+    @classmethod
+    def reserve(cls, day: date, count: int = 1) -> int:
+        """
+        Atomically advance the day's counter by `count`.
+        Returns the last value of the reserved block.
+        """
+        # Own transaction: commit (and release the row lock) immediately,
+        # independent of the checkout's session
+        with db.engine.begin() as connection:
+            if connection.dialect.name == "mysql":
+                return cls._reserve_mysql(connection, day, count)
+            return cls._reserve_generic(connection, day, count)
+
+    @classmethod
+    def block_size(cls) -> int:
+        """Numbers reserved per database round trip"""
+        if has_app_context():
+            return max(int(current_app.config.get("ORDER_NUMBER_BLOCK_SIZE", cls.DEFAULT_BLOCK_SIZE)), 1)
+        return cls.DEFAULT_BLOCK_SIZE
+
+    @classmethod
+    def format(cls, day: date, value: int) -> str:
+        return f'{cls.PREFIX}-{day:%Y%m%d}-{value:03d}'
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop reserved blocks held by this process"""
+        with cls._lock:
+            cls._blocks = {}
+
+    # Helper Methods
+
+    @staticmethod
+    def _reserve_mysql(connection: Connection, day: date, count: int) -> int:
+        """Single upsert; LAST_INSERT_ID(expr) hands the new value back per connection"""
+        connection.exec_driver_sql(
+            "INSERT INTO order_sequences (day, last_value) "
+            "VALUES (%s, LAST_INSERT_ID(%s)) "
+            "ON DUPLICATE KEY UPDATE last_value = LAST_INSERT_ID(last_value + %s)",
+            (day, count, count)
+        )
+        return connection.exec_driver_sql("SELECT LAST_INSERT_ID()").scalar()
+
+    @staticmethod
+    def _reserve_generic(connection: Connection, day: date, count: int) -> int:
+        """UPDATE ... RETURNING (or UPDATE + SELECT under the row lock)"""
+        from website.models import OrderSequence
+
+        table = OrderSequence.__table__
+        increment = (
+            update(table)
+            .where(table.c.day == day)
+            .values(last_value=table.c.last_value + count)
+        )
+        returning = connection.dialect.update_returning
+
+        for _ in range(2):
+            if returning:
+                value = connection.execute(increment.returning(table.c.last_value)).scalar()
+                if value is not None:
+                    return value
+            elif connection.execute(increment).rowcount:
+                return connection.execute(
+                    select(table.c.last_value).where(table.c.day == day)
+                ).scalar()
+
+            # First allocation of the day
+            try:
+                with connection.begin_nested():
+                    connection.execute(insert(table).values(day=day, last_value=count))
+                return count
+            except IntegrityError:
+                # Another worker created the row first; increment it
+                continue
+
+        raise RuntimeError(f"Could not allocate an order number for {day}")
@@ -0,0 +1,144 @@
+import time
+import heapq
+from typing import Any, Dict, List
+
+from flask import Flask, current_app, g, request, has_request_context
+from sqlalchemy import event
+
+from database import db
+from utils import syshandler
+
+
+# SQL Query Profiler
+class QueryProfiler:
+    """
+    Per-request SQL instrumentation via before/after_cursor_execute on
+    db.engine. Tracks, in flask.g:
+    - db_query_count: statements executed
+    - db_time: total time spent in the driver (seconds)
+    - db_slowest: the SQL_PROFILE_TOP slowest (duration, statement) pairs
+
+    SQL_PROFILE_HEADERS adds X-DB-* and Server-Timing response headers
+    (Development). SLOW_QUERY_LOG writes requests that cross any of the
+    SLOW_QUERY_THRESHOLD_MS, SLOW_REQUEST_DB_TIME_MS or
+    SLOW_REQUEST_QUERY_COUNT thresholds to logs/system/database/slow-queries.
+    """
+
+    STATEMENT_PREVIEW = 500
+
+    @classmethod
+    def init_app(cls, app: Flask) -> None:
+        app.before_request(cls._start_request)
+        app.after_request(cls._finish_request)
+
+        with app.app_context():
+            event.listen(db.engine, "before_cursor_execute", cls._before_execute)
+            event.listen(db.engine, "after_cursor_execute", cls._after_execute)
+            event.listen(db.engine, "handle_error", cls._on_error)
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """Profile of the current request so far"""
+        if not has_request_context() or not hasattr(g, "db_query_count"):
+            return {}
+
+        return {
+            'query_count': g.db_query_count,
+            'db_time_ms': round(g.db_time * 1000, 2),
+            'slowest': [
+                {'duration_ms': round(duration * 1000, 2), 'statement': statement}
+                for duration, statement in sorted(g.db_slowest, reverse=True)
+            ]
+        }
+
+    # Hooks
+
+    @staticmethod
+    def _start_request() -> None:
+        g.db_query_count = 0
+        g.db_time = 0.0
+        g.db_slowest = []
+
+    @classmethod
+    def _finish_request(cls, response):
+        stats = cls.stats()
+        if not stats:
+            return response
+
+        config = current_app.config
+
+        if config.get("SQL_PROFILE_HEADERS"):
+            slowest = stats['slowest'][0]['duration_ms'] if stats['slowest'] else 0
+            response.headers["X-DB-Query-Count"] = str(stats['query_count'])
+            response.headers["X-DB-Time-ms"] = str(stats['db_time_ms'])
+            response.headers["X-DB-Slowest-ms"] = str(slowest)
+            response.headers.add(
+                "Server-Timing",
+                f'db;dur={stats["db_time_ms"]};desc="{stats["query_count"]} queries"'
+            )
+
+        if config.get("SLOW_QUERY_LOG") and cls._is_slow(stats, config):
+            cls._log_slow_request(stats, response.status_code)
+
+        return response
+
+    @staticmethod
+    def _before_execute(conn, cursor, statement, parameters, context, executemany):
+        if has_request_context():
+            conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @classmethod
+    def _after_execute(cls, conn, cursor, statement, parameters, context, executemany):
+        # Always pop what _before_execute pushed, counted or not
+        started = conn.info.get("query_started")
+        if not started:
+            return
+        duration = time.perf_counter() - started.pop()
+
+        # e.g. queries from before_request hooks that run ahead of _start_request
+        if not has_request_context() or not hasattr(g, "db_query_count"):
+            return
+
+        g.db_query_count += 1
+        g.db_time += duration
+
+        # Keep only the N slowest (min-heap on duration)
+        top = current_app.config.get("SQL_PROFILE_TOP", 5)
+        entry = (duration, statement[:cls.STATEMENT_PREVIEW])
+        if len(g.db_slowest) < top:
+            heapq.heappush(g.db_slowest, entry)
+        elif g.db_slowest and duration > g.db_slowest[0][0]:
+            heapq.heapreplace(g.db_slowest, entry)
+
+    @staticmethod
+    def _on_error(context) -> None:
+        # after_cursor_execute never fires for a failed statement
+        connection = context.connection
+        if connection is not None and connection.info.get("query_started"):
+            connection.info["query_started"].pop()
+
+    # Helper Methods
+
+    @staticmethod
+    def _is_slow(stats: Dict[str, Any], config) -> bool:
+        slowest = stats['slowest'][0]['duration_ms'] if stats['slowest'] else 0
+        return (
+            slowest >= config.get("SLOW_QUERY_THRESHOLD_MS", 200)
+            or stats['db_time_ms'] >= config.get("SLOW_REQUEST_DB_TIME_MS", 1000)
+            or stats['query_count'] >= config.get("SLOW_REQUEST_QUERY_COUNT", 50)
+        )
+
+    @staticmethod
+    def _log_slow_request(stats: Dict[str, Any], status_code: int) -> None:
+        lines: List[str] = [
+            f"{request.method} {request.path} -> {status_code} ({request.endpoint})",
+            f"Request ID: {getattr(g, 'request_id', None)}",
+            f"Queries: {stats['query_count']}, DB time: {stats['db_time_ms']} ms",
+            "Slowest statements:"
+        ]
+        lines += [
+            f"  [{entry['duration_ms']} ms] {' '.join(entry['statement'].split())}"
+            for entry in stats['slowest']
+        ]
+
+        syshandler("\n".join(lines), log="slow-queries", path="database")
@@ -0,0 +1,7 @@
+from .co_occurrence import CoOccurrence
+from .recommender import Recommender
+
+__all__ = [
+    "Recommender",
+    "CoOccurrence"
+]
@@ -0,0 +1,103 @@
+import time
+import random
+import tracemalloc
+from typing import Any, Dict, List, Tuple
+
+from .co_occurrence import CoOccurrence
+
+
+# Offline Recommender Benchmark
+def synthetic_orders(
+    n_items: int = 200,
+    n_orders: int = 50000,
+    basket_size: int = 3,
+    combo_rate: float = 0.6,
+    seed: int = 7
+) -> Tuple[List[List[int]], Dict[int, int]]:
+    """
+    Random baskets over items 1..n_items. Item popularity is Zipf-like;
+    every item has one planted "combo" partner (1<->2, 3<->4, ...) that
+    joins its basket with probability combo_rate. Returns the baskets
+    and the combo map used to score recommendations.
+    """
+    rng = random.Random(seed)
+    items = list(range(1, n_items + 1))
+    weights = [1 / rank for rank in items]
+    combos = {item: item + 1 if item % 2 else item - 1 for item in items if item + (item % 2) <= n_items}
+
+    baskets = []
+    for _ in range(n_orders):
+        basket = set(rng.choices(items, weights, k=rng.randint(1, basket_size)))
+        for item in list(basket):
+            if item in combos and rng.random() < combo_rate:
+                basket.add(combos[item])
+        baskets.append(sorted(basket))
+    return baskets, combos
+
+
+def run(
+    n_items: int = 200,
+    n_orders: int = 50000,
+    increment: int = 1000,
+    lookups: int = 10000,
+    seed: int = 7
+) -> Dict[str, Any]:
+    """
+    Build a matrix from synthetic orders and report build time, peak
+    memory, incremental refresh time for `increment` new orders, lookup
+    latency and how often the planted combo partner is the top
+    related item.
+    """
+    baskets, combos = synthetic_orders(n_items, n_orders, seed=seed)
+    history, recent = baskets[:-increment], baskets[-increment:]
+
+    def build() -> CoOccurrence:
+        matrix = CoOccurrence()
+        for basket in history:
+            matrix.add_basket(basket)
+        matrix.refresh_neighbors()
+        return matrix
+
+    # Memory on a separate build: tracing slows allocation down a lot
+    tracemalloc.start()
+    build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    matrix = build()
+    build_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for basket in recent:
+        matrix.add_basket(basket)
+    reranked = matrix.refresh_neighbors()
+    refresh_seconds = time.perf_counter() - started
+
+    rng = random.Random(seed)
+    probes = [rng.randint(1, n_items) for _ in range(lookups)]
+    started = time.perf_counter()
+    for item_id in probes:
+        matrix.related(item_id, 4)
+    related_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for position in range(0, len(probes) - 2, 3):
+        matrix.for_basket(probes[position:position + 3], 4)
+    basket_seconds = time.perf_counter() - started
+
+    hits = sum(1 for item, partner in combos.items() if matrix.related(item, 1) == [partner])
+
+    return {
+        'items': n_items,
+        'orders': n_orders,
+        **matrix.stats(),
+        'build_ms': round(build_seconds * 1000, 1),
+        'build_peak_mb': round(peak / 1024 / 1024, 2),
+        'refresh_orders': increment,
+        'refresh_ms': round(refresh_seconds * 1000, 1),
+        'refresh_reranked': reranked,
+        'related_us': round(related_seconds / lookups * 1e6, 2),
+        'basket_us': round(basket_seconds / max(lookups // 3, 1) * 1e6, 2),
+        'combo_top1': round(hits / len(combos), 3) if combos else 0.0
+    }
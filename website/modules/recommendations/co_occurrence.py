@@ -0,0 +1,125 @@
+import math
+import heapq
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+# Item-item Co-occurrence Matrix
+class CoOccurrence:
+    """
+    Sparse, symmetric "bought together" counts over order baskets.
+
+    - baskets[i]: orders containing item i
+    - pairs[i][j]: orders containing both i and j
+    - neighbors[i]: the top_k (item, score) pairs for i, best first
+
+    Scores are cosine similarities, pairs[i][j] / sqrt(baskets[i] *
+    baskets[j]), so an item everyone orders (coffee) does not dominate
+    every list. Pairs seen in fewer than min_support orders are ignored.
+
+    Adding baskets only marks the items involved; refresh_neighbors()
+    then recomputes neighbor lists for those items and everything
+    paired with them (their scores share a denominator), not the whole
+    matrix. The neighbor lists are what gets served.
+    """
+
+    # Very large baskets (catering, events) add noise and pairs^2 work
+    MAX_BASKET = 25
+
+    def __init__(self, top_k: int = 12, min_support: int = 2):
+        self.top_k = top_k
+        self.min_support = min_support
+
+        self.orders = 0
+        self.baskets: Dict[int, int] = {}
+        self.pairs: Dict[int, Dict[int, int]] = {}
+        self.neighbors: Dict[int, List[Tuple[int, float]]] = {}
+
+        self._dirty: Set[int] = set()
+
+    def __len__(self):
+        return len(self.baskets)
+
+    # Building
+
+    def add_basket(self, item_ids: Iterable[int]) -> None:
+        """Count one order's distinct items"""
+        items = sorted(set(item_ids))
+        if not items:
+            return
+
+        self.orders += 1
+        for item_id in items:
+            self.baskets[item_id] = self.baskets.get(item_id, 0) + 1
+        self._dirty.update(items)
+
+        if len(items) > self.MAX_BASKET:
+            return
+
+        for position, first in enumerate(items):
+            first_pairs = self.pairs.setdefault(first, {})
+            for second in items[position + 1:]:
+                first_pairs[second] = first_pairs.get(second, 0) + 1
+                second_pairs = self.pairs.setdefault(second, {})
+                second_pairs[first] = second_pairs.get(first, 0) + 1
+
+    def refresh_neighbors(self) -> int:
+        """Recompute neighbor lists touched since the last call; returns how many"""
+        affected = set(self._dirty)
+        for item_id in self._dirty:
+            affected.update(self.pairs.get(item_id, ()))
+        self._dirty.clear()
+
+        for item_id in affected:
+            ranked = self._rank(item_id)
+            if ranked:
+                self.neighbors[item_id] = ranked
+            else:
+                self.neighbors.pop(item_id, None)
+        return len(affected)
+
+    # Querying
+
+    def score(self, first: int, second: int) -> float:
+        together = self.pairs.get(first, {}).get(second, 0)
+        if together < self.min_support:
+            return 0.0
+        return together / math.sqrt(self.baskets[first] * self.baskets[second])
+
+    def related(self, item_id: int, limit: int = 4) -> List[int]:
+        """Items most often bought with `item_id`, best first"""
+        return [other for other, _ in self.neighbors.get(item_id, [])[:limit]]
+
+    def for_basket(self, item_ids: Iterable[int], limit: int = 4) -> List[int]:
+        """
+        Items to add to a basket: neighbor scores summed over the
+        basket's items, excluding what is already in it.
+        """
+        basket = set(item_ids)
+
+        scores: Dict[int, float] = {}
+        for item_id in basket:
+            for other, score in self.neighbors.get(item_id, []):
+                if other not in basket:
+                    scores[other] = scores.get(other, 0.0) + score
+
+        best = heapq.nsmallest(limit, scores.items(), key=lambda pair: (-pair[1], pair[0]))
+        return [item_id for item_id, _ in best]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'orders': self.orders,
+            'items': len(self.baskets),
+            'pairs': sum(len(pairs) for pairs in self.pairs.values()) // 2,
+            'served_items': len(self.neighbors)
+        }
+
+    # Helper Methods
+
+    def _rank(self, item_id: int) -> List[Tuple[int, float]]:
+        candidates = (
+            (other, self.score(item_id, other))
+            for other, together in self.pairs.get(item_id, {}).items()
+            if together >= self.min_support
+        )
+        best = heapq.nsmallest(self.top_k, candidates, key=lambda pair: (-pair[1], pair[0]))
+        return [(other, round(score, 4)) for other, score in best]
@@ -0,0 +1,157 @@
+import os
+import time
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from flask import Flask, current_app, has_app_context
+
+from utils import errhandler
+from .co_occurrence import CoOccurrence
+
+
+# "Frequently Bought Together" Access Point
+class Recommender:
+    """
+    Serves related items and basket upsells from an in-memory
+    CoOccurrence matrix mined from order_items (cancelled orders
+    excluded).
+
+    Each worker starts a background thread on first use (after any
+    fork) that builds the matrix, then every
+    RECOMMENDATIONS_REFRESH_INTERVAL seconds folds in orders placed
+    since the last run and recomputes only the neighbor lists they
+    touch. A full rebuild every RECOMMENDATIONS_REBUILD_INTERVAL seconds
+    drops orders cancelled after they were counted. Until the first
+    build finishes, lookups return [] and callers fall back.
+    """
+
+    BATCH_SIZE = 1000
+
+    _lock = threading.Lock()
+    _matrix: Optional[CoOccurrence] = None
+    _last_order_id: int = 0
+    _built_at: float = 0.0
+    _refreshed_at: float = 0.0
+    _pid: Optional[int] = None
+    _worker: Optional[threading.Thread] = None
+    _app: Optional[Flask] = None
+
+    @classmethod
+    def init_app(cls, app: Flask) -> None:
+        cls._app = app
+
+    # Serving
+
+    @classmethod
+    def related(cls, item_id: int, limit: int = 4) -> List[int]:
+        """Items most often ordered with `item_id`"""
+        cls._ensure_worker()
+        matrix = cls._matrix
+        return matrix.related(item_id, limit) if matrix is not None else []
+
+    @classmethod
+    def for_basket(cls, item_ids: Iterable[int], limit: int = 4) -> List[int]:
+        """Items to suggest for a basket (excluding its own items)"""
+        cls._ensure_worker()
+        matrix = cls._matrix
+        return matrix.for_basket(item_ids, limit) if matrix is not None else []
+
+    # Building (needs an app context)
+
+    @classmethod
+    def rebuild(cls) -> CoOccurrence:
+        """Mine every order again and swap the new matrix in"""
+        with cls._lock:
+            matrix = CoOccurrence(
+                top_k=cls._config("RECOMMENDATIONS_TOP_K", 12),
+                min_support=cls._config("RECOMMENDATIONS_MIN_SUPPORT", 2)
+            )
+            last_order_id = cls._read_orders(matrix, 0)
+            matrix.refresh_neighbors()
+
+            cls._matrix = matrix
+            cls._last_order_id = last_order_id
+            cls._built_at = cls._refreshed_at = time.time()
+            return matrix
+
+    @classmethod
+    def refresh(cls) -> int:
+        """Fold in orders placed since the last build/refresh; returns items re-ranked"""
+        if cls._matrix is None:
+            return len(cls.rebuild())
+
+        with cls._lock:
+            matrix = cls._matrix
+            cls._last_order_id = cls._read_orders(matrix, cls._last_order_id)
+            cls._refreshed_at = time.time()
+            return matrix.refresh_neighbors()
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        matrix = cls._matrix
+        return {
+            **(matrix.stats() if matrix is not None else {}),
+            'ready': matrix is not None,
+            'last_order_id': cls._last_order_id,
+            'built_at': cls._built_at or None,
+            'refreshed_at': cls._refreshed_at or None
+        }
+
+    # Helper Methods
+
+    @classmethod
+    def _read_orders(cls, matrix: CoOccurrence, after_order_id: int) -> int:
+        """Add baskets of orders after `after_order_id`; returns the last id read"""
+        from website.repositories import OrderRepository
+
+        repo = OrderRepository()
+        while True:
+            baskets = repo.find_baskets(after_order_id, limit=cls.BATCH_SIZE)
+            for order_id, item_ids in baskets:
+                matrix.add_basket(item_ids)
+                after_order_id = order_id
+
+            if len(baskets) < cls.BATCH_SIZE:
+                return after_order_id
+
+    @classmethod
+    def _ensure_worker(cls) -> None:
+        app = cls._app
+        if app is None or not app.config.get("RECOMMENDATIONS_ENABLED"):
+            return
+        if cls._worker is not None and cls._pid == os.getpid():
+            return
+
+        with cls._lock:
+            if cls._pid != os.getpid():
+                # Forked worker: rebuild its own copy
+                cls._pid = os.getpid()
+                cls._matrix = None
+                cls._last_order_id = 0
+                cls._worker = None
+            if cls._worker is not None:
+                return
+
+            refresh_interval = float(app.config.get("RECOMMENDATIONS_REFRESH_INTERVAL", 300))
+            rebuild_interval = float(app.config.get("RECOMMENDATIONS_REBUILD_INTERVAL", 86400))
+
+            def run():
+                while True:
+                    try:
+                        with app.app_context():
+                            if cls._matrix is None or time.time() - cls._built_at >= rebuild_interval:
+                                cls.rebuild()
+                            else:
+                                cls.refresh()
+                    except Exception as e:
+                        errhandler(e, log="recommender", path="modules")
+                    time.sleep(refresh_interval)
+
+            cls._worker = threading.Thread(target=run, name="recommender", daemon=True)
+            cls._worker.start()
+
+    @staticmethod
+    def _config(key: str, default: int) -> int:
+        if has_app_context():
+            return int(current_app.config.get(key, default))
+        return default
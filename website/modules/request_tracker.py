@@ -0,0 +1,47 @@
+import re
+import time
+import uuid
+from typing import Optional
+
+from flask import Flask, g, request, has_request_context
+
+
+# Request Tracker
+class RequestTracker:
+    """
+    Per-request bookkeeping used by the logs:
+    - g.request_id: correlation ID (incoming X-Request-ID or a new one),
+      echoed back in the X-Request-ID response header
+    - g.request_started: perf_counter() at request start (latency)
+
+    SQL statement counts (g.db_query_count) come from QueryProfiler.
+    """
+
+    HEADER = "X-Request-ID"
+
+    # Accept upstream IDs (load balancer/proxy) only if they look sane
+    _VALID_ID = re.compile(r"^[A-Za-z0-9._:-]{1,64}$")
+
+    @classmethod
+    def init_app(cls, app: Flask) -> None:
+        app.before_request(cls._start_request)
+        app.after_request(cls._finish_request)
+
+    @classmethod
+    def request_id(cls) -> Optional[str]:
+        return getattr(g, "request_id", None) if has_request_context() else None
+
+    # Hooks
+
+    @classmethod
+    def _start_request(cls) -> None:
+        incoming = request.headers.get(cls.HEADER, "")
+        g.request_id = incoming if cls._VALID_ID.match(incoming) else uuid.uuid4().hex
+        g.request_started = time.perf_counter()
+
+    @classmethod
+    def _finish_request(cls, response):
+        request_id = getattr(g, "request_id", None)
+        if request_id:
+            response.headers[cls.HEADER] = request_id
+        return response
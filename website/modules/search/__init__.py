@@ -0,0 +1,19 @@
+from .inverted_index import InvertedIndex
+from .search_backend import SearchBackend
+from .index_backend import IndexSearch
+from .fulltext_backend import FullTextSearch
+from .facet_index import FacetIndex
+from .suggest_index import SuggestIndex
+from .suggester import Suggester
+from .search_manager import MenuSearch
+
+__all__ = [
+    "MenuSearch",
+    "SearchBackend",
+    "IndexSearch",
+    "FullTextSearch",
+    "InvertedIndex",
+    "FacetIndex",
+    "Suggester",
+    "SuggestIndex"
+]
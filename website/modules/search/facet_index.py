@@ -0,0 +1,175 @@
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from flask import current_app, has_app_context
+
+
+# Menu Facet Bitsets
+class FacetIndex:
+    """
+    Precomputed bitsets over a fixed list of menu items. Bit i stands for
+    items[i], so a set of items is a Python int and filtering is & / |.
+
+    Facets:
+    - category: {category_id: bits}
+    - price: {band: bits}, bands from ascending edges, e.g. (500, 1000)
+      gives "0-500", "500-1000" and "1000+"
+    - rating: {threshold: bits} with an average rating >= threshold
+    - allergen_free: {True: bits} without any allergen ingredient
+    - available: {True: bits, False: bits}
+
+    Values of one facet are OR-ed, facets are AND-ed. Counts for a facet
+    ignore its own selection (disjunctive faceting), so a customer sees
+    what each alternative would give under everything else selected.
+    """
+
+    FACETS = ("category", "price", "rating", "allergen_free", "available")
+    RATING_THRESHOLDS = (4, 3, 2, 1)
+    DEFAULT_PRICE_EDGES = (10, 20, 30)
+
+    def __init__(self, items: Sequence[Dict[str, Any]], price_edges: Sequence[float] = ()):
+        self.items = list(items)
+        self.positions = {item['id']: position for position, item in enumerate(self.items)}
+        self.price_bands = self.bands(price_edges)
+        self.all = (1 << len(self.items)) - 1
+
+        self.bits: Dict[str, Dict[Any, int]] = {
+            'category': {},
+            'price': {band: 0 for band, _, _ in self.price_bands},
+            'rating': {threshold: 0 for threshold in self.RATING_THRESHOLDS},
+            'allergen_free': {True: 0},
+            'available': {True: 0, False: 0}
+        }
+
+        for position, item in enumerate(self.items):
+            bit = 1 << position
+            facets = self.bits
+
+            category_id = item['category']['id']
+            facets['category'][category_id] = facets['category'].get(category_id, 0) | bit
+
+            band = self.price_band(item['price'])
+            if band is not None:
+                facets['price'][band] |= bit
+
+            average = item['rating']['average'] or 0
+            for threshold in self.RATING_THRESHOLDS:
+                if average >= threshold:
+                    facets['rating'][threshold] |= bit
+
+            if item.get('allergen_free'):
+                facets['allergen_free'][True] |= bit
+
+            facets['available'][bool(item.get('is_available', True))] |= bit
+
+    def __len__(self):
+        return len(self.items)
+
+    # Price Bands
+
+    @classmethod
+    def configured_price_edges(cls) -> Tuple[float, ...]:
+        """Band edges from MENU_PRICE_BANDS ("10,20,30"), else the defaults"""
+        raw = current_app.config.get("MENU_PRICE_BANDS") if has_app_context() else None
+        if not raw:
+            return cls.DEFAULT_PRICE_EDGES
+
+        try:
+            edges = tuple(float(edge) for edge in str(raw).split(",") if edge.strip())
+        except ValueError:
+            return cls.DEFAULT_PRICE_EDGES
+        return edges or cls.DEFAULT_PRICE_EDGES
+
+    @staticmethod
+    def bands(edges: Sequence[float]) -> List[Tuple[str, float, Optional[float]]]:
+        """(name, low, high) bands from ascending edges; the last is open"""
+        edges = sorted({float(edge) for edge in edges if float(edge) > 0})
+        bounds = [0.0] + edges
+
+        bands = []
+        for position, low in enumerate(bounds):
+            high = bounds[position + 1] if position + 1 < len(bounds) else None
+            name = f"{low:g}-{high:g}" if high is not None else f"{low:g}+"
+            bands.append((name, low, high))
+        return bands
+
+    def price_band(self, price: Any) -> Optional[str]:
+        price = float(price) if isinstance(price, (int, float, Decimal)) else None
+        if price is None:
+            return None
+
+        for name, low, high in self.price_bands:
+            if price >= low and (high is None or price < high):
+                return name
+        return None
+
+    # Querying
+
+    def mask(self, selected: Dict[str, Any], within: Optional[int] = None, skip: str = None) -> int:
+        """
+        Bits matching every selected facet (except `skip`).
+        `selected` maps facet -> value or list of values; None/empty
+        means no filter on that facet. Unknown values match nothing.
+        """
+        bits = self.all if within is None else within & self.all
+
+        for facet, values in selected.items():
+            if facet == skip or facet not in self.bits:
+                continue
+
+            values = self._values(values)
+            if not values:
+                continue
+
+            facet_bits = 0
+            for value in values:
+                facet_bits |= self.bits[facet].get(value, 0)
+            bits &= facet_bits
+
+        return bits
+
+    def counts(self, selected: Dict[str, Any], within: Optional[int] = None) -> Dict[str, Dict[Any, int]]:
+        """Matches per facet value under the other facets' selections"""
+        counts = {}
+        for facet, values in self.bits.items():
+            others = self.mask(selected, within, skip=facet)
+            counts[facet] = {value: (others & bits).bit_count() for value, bits in values.items()}
+        return counts
+
+    def select(self, bits: int, ranked_ids: Iterable[int] = None) -> List[Dict[str, Any]]:
+        """
+        Items in `bits`, in index order, or in the order of
+        `ranked_ids` (e.g. search results) when given.
+        """
+        if ranked_ids is not None:
+            return [
+                self.items[self.positions[item_id]]
+                for item_id in ranked_ids
+                if item_id in self.positions and bits >> self.positions[item_id] & 1
+            ]
+
+        items = []
+        while bits:
+            lowest = bits & -bits
+            items.append(self.items[lowest.bit_length() - 1])
+            bits ^= lowest
+        return items
+
+    def bits_for(self, item_ids: Iterable[int]) -> int:
+        """Bitset of the given item ids (ids not indexed are ignored)"""
+        bits = 0
+        for item_id in item_ids:
+            position = self.positions.get(item_id)
+            if position is not None:
+                bits |= 1 << position
+        return bits
+
+    # Helper Methods
+
+    @staticmethod
+    def _values(values: Any) -> List[Any]:
+        if values is None:
+            return []
+        if isinstance(values, (list, tuple, set)):
+            return [value for value in values if value is not None and value != ""]
+        return [values]
@@ -0,0 +1,25 @@
+from typing import Callable, List
+
+from .inverted_index import InvertedIndex
+from .search_backend import SearchBackend
+
+
+# MySQL FULLTEXT Backend
+class FullTextSearch(SearchBackend):
+    """
+    Delegates to MySQL FULLTEXT indexes (food item name/description,
+    category and ingredient names) in BOOLEAN MODE. Every token is
+    searched as a prefix ("pan" -> "pan*"); there is no typo tolerance.
+    Nothing is held in process, so edits need no refresh.
+
+    query(against) runs the MATCH ... AGAINST and returns ranked ids.
+    """
+
+    def __init__(self, query: Callable[[str], List[int]]):
+        self.query = query
+
+    def search(self, query: str) -> List[int]:
+        tokens = InvertedIndex.tokenize(query)
+        if not tokens:
+            return []
+        return self.query(" ".join(f"{token}*" for token in dict.fromkeys(tokens)))
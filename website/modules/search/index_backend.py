@@ -0,0 +1,100 @@
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .inverted_index import InvertedIndex
+from .search_backend import SearchBackend
+
+
+# In-process Index Backend
+class IndexSearch(SearchBackend):
+    """
+    Searches an InvertedIndex held in this process.
+
+    The index is built from `loader()` (all searchable items) on first
+    use and tagged with the catalog version it was built for; when the
+    shared version moves on (an edit in any worker), the next search
+    rebuilds it. Edits made in this process are applied by
+    refresh_items() to a copy that replaces the index, adopting the new
+    version without a rebuild; searches never see a half-patched index.
+
+    loader(ids=None) returns [{'id', 'name', 'description', 'category',
+    'ingredients'}] for available items (restricted to `ids` if given).
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[Optional[List[int]]], List[Dict[str, Any]]],
+        version: Callable[[], int]
+    ):
+        self.loader = loader
+        self.version = version
+
+        self._lock = threading.Lock()
+        self._index: Optional[InvertedIndex] = None
+        self._version: Optional[int] = None
+
+        self.builds = 0
+
+    def search(self, query: str) -> List[int]:
+        return [doc_id for doc_id, _ in self._current_index().search(query)]
+
+    def warm(self) -> None:
+        self._current_index()
+
+    def refresh_items(
+        self,
+        item_ids: Iterable[int],
+        previous_version: Optional[int] = None,
+        version: Optional[int] = None
+    ) -> None:
+        item_ids = list(item_ids)
+
+        with self._lock:
+            # Only patch an index that was current right before this edit;
+            # otherwise it has missed other changes and must be rebuilt
+            if self._index is None or previous_version is None or self._version != previous_version:
+                return
+
+            # Patch a copy: searches read the current index without the lock
+            index = self._index.copy()
+            documents = {document['id']: document for document in self.loader(item_ids)}
+            for item_id in item_ids:
+                if item_id in documents:
+                    index.add(item_id, self._fields(documents[item_id]))
+                else:
+                    # Deleted or no longer available
+                    index.remove(item_id)
+
+            self._index = index
+            self._version = version
+
+    # Helper Methods
+
+    def _current_index(self) -> InvertedIndex:
+        version = self.version()
+
+        index = self._index
+        if index is not None and self._version == version:
+            return index
+
+        with self._lock:
+            if self._index is not None and self._version == version:
+                return self._index
+
+            index = InvertedIndex()
+            for document in self.loader(None):
+                index.add(document['id'], self._fields(document))
+
+            self._index = index
+            self._version = version
+            self.builds += 1
+            return index
+
+    @staticmethod
+    def _fields(document: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'name': document.get('name'),
+            'description': document.get('description'),
+            'category': document.get('category'),
+            'ingredients': document.get('ingredients') or []
+        }
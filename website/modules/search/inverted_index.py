@@ -0,0 +1,217 @@
+import re
+import math
+import bisect
+import unicodedata
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+# In-memory Inverted Index
+class InvertedIndex:
+    """
+    Inverted index over weighted text fields.
+
+    Each document is a dict of field -> text (or list of texts). Terms
+    are lower-cased, accent-stripped alphanumeric tokens; postings keep
+    the field-weighted term frequency per document. The vocabulary is
+    kept as a sorted list so prefix expansion is a bisect.
+
+    A query matches a document when every query token matches one of
+    its terms, tried in order:
+    - exact term
+    - prefix of a term ("pan" -> "pancakes"), tokens of 2+ characters
+    - within 1 edit (2 for tokens of 8+ characters) for typos, only if
+      the token has no exact/prefix match at all
+
+    Scores add up, per query token, the best weight * idf of the terms
+    it matched, discounted for prefix and typo matches.
+
+    Not safe to modify while other threads search it: patch a copy()
+    and swap it in.
+    """
+
+    DEFAULT_WEIGHTS = {'name': 3.0, 'category': 1.5, 'ingredients': 1.0, 'description': 1.0}
+
+    PREFIX_BOOST = 0.7
+    TYPO_BOOST = 0.4
+    MIN_PREFIX_LENGTH = 2
+    MIN_TYPO_LENGTH = 4
+
+    _TOKEN = re.compile(r"[a-z0-9]+")
+
+    def __init__(self, weights: Dict[str, float] = None):
+        self.weights = weights or self.DEFAULT_WEIGHTS
+
+        # term -> {doc_id: weighted frequency}
+        self.postings: Dict[str, Dict[Any, float]] = {}
+        # doc_id -> terms (for removal)
+        self.documents: Dict[Any, Set[str]] = {}
+
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = False
+
+    def __len__(self):
+        return len(self.documents)
+
+    def __contains__(self, doc_id):
+        return doc_id in self.documents
+
+    def copy(self) -> "InvertedIndex":
+        """Independent copy to patch while readers keep using this one"""
+        clone = InvertedIndex(self.weights)
+        clone.postings = {term: dict(postings) for term, postings in self.postings.items()}
+        clone.documents = {doc_id: set(terms) for doc_id, terms in self.documents.items()}
+        clone._vocabulary = list(self._vocabulary)
+        clone._vocabulary_dirty = self._vocabulary_dirty
+        return clone
+
+    # Building
+
+    @classmethod
+    def tokenize(cls, text: Optional[str]) -> List[str]:
+        """Lower-case, accent-stripped alphanumeric tokens"""
+        if not text:
+            return []
+        normalized = unicodedata.normalize("NFKD", str(text))
+        folded = "".join(ch for ch in normalized if not unicodedata.combining(ch)).lower()
+        return cls._TOKEN.findall(folded)
+
+    def add(self, doc_id: Any, fields: Dict[str, Any]) -> None:
+        """Index (or re-index) a document"""
+        if doc_id in self.documents:
+            self.remove(doc_id)
+
+        frequencies: Dict[str, float] = {}
+        for field, value in fields.items():
+            weight = self.weights.get(field, 1.0)
+            texts = value if isinstance(value, (list, tuple, set)) else [value]
+            for text in texts:
+                for term in self.tokenize(text):
+                    frequencies[term] = frequencies.get(term, 0.0) + weight
+
+        for term, frequency in frequencies.items():
+            postings = self.postings.get(term)
+            if postings is None:
+                postings = self.postings[term] = {}
+                self._vocabulary_dirty = True
+            postings[doc_id] = frequency
+
+        self.documents[doc_id] = set(frequencies)
+
+    def remove(self, doc_id: Any) -> bool:
+        """Drop a document; returns False if it was not indexed"""
+        terms = self.documents.pop(doc_id, None)
+        if terms is None:
+            return False
+
+        for term in terms:
+            postings = self.postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self.postings[term]
+                self._vocabulary_dirty = True
+        return True
+
+    # Querying
+
+    def search(self, query: str) -> List[Tuple[Any, float]]:
+        """All matching (doc_id, score) pairs, best first"""
+        tokens = list(dict.fromkeys(self.tokenize(query)))
+        if not tokens or not self.documents:
+            return []
+
+        scores: Optional[Dict[Any, float]] = None
+        for token in tokens:
+            token_scores = self._match_token(token)
+            if not token_scores:
+                return []
+
+            if scores is None:
+                scores = token_scores
+            else:
+                # Every token must match (AND)
+                scores = {
+                    doc_id: score + token_scores[doc_id]
+                    for doc_id, score in scores.items()
+                    if doc_id in token_scores
+                }
+                if not scores:
+                    return []
+
+        return sorted(scores.items(), key=lambda pair: (-pair[1], pair[0]))
+
+    def terms_with_prefix(self, prefix: str) -> List[str]:
+        """Vocabulary terms starting with `prefix` (sorted)"""
+        vocabulary = self._sorted_vocabulary()
+        start = bisect.bisect_left(vocabulary, prefix)
+        end = bisect.bisect_left(vocabulary, prefix + "\uffff")
+        return vocabulary[start:end]
+
+    # Helper Methods
+
+    def _match_token(self, token: str) -> Dict[Any, float]:
+        """Best score per document for one query token"""
+        candidates: List[Tuple[str, float]] = []
+
+        if token in self.postings:
+            candidates.append((token, 1.0))
+
+        if len(token) >= self.MIN_PREFIX_LENGTH:
+            candidates += [
+                (term, self.PREFIX_BOOST)
+                for term in self.terms_with_prefix(token)
+                if term != token
+            ]
+
+        if not candidates and len(token) >= self.MIN_TYPO_LENGTH:
+            max_edits = 2 if len(token) >= 8 else 1
+            candidates = [
+                (term, self.TYPO_BOOST)
+                for term in self._sorted_vocabulary()
+                if abs(len(term) - len(token)) <= max_edits
+                and self._within_edits(token, term, max_edits)
+            ]
+
+        total = len(self.documents)
+        scores: Dict[Any, float] = {}
+        for term, boost in candidates:
+            postings = self.postings[term]
+            idf = math.log(1 + total / len(postings))
+            for doc_id, frequency in postings.items():
+                score = boost * idf * frequency
+                if score > scores.get(doc_id, 0.0):
+                    scores[doc_id] = score
+        return scores
+
+    def _sorted_vocabulary(self) -> List[str]:
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self.postings)
+            self._vocabulary_dirty = False
+        return self._vocabulary
+
+    @staticmethod
+    def _within_edits(a: str, b: str, limit: int) -> bool:
+        """Edit distance (adjacent transpositions count as one) <= limit"""
+        if a == b:
+            return True
+
+        before_previous = None
+        previous = list(range(len(b) + 1))
+        for i in range(1, len(a) + 1):
+            row = [i] + [0] * len(b)
+            for j in range(1, len(b) + 1):
+                cost = 0 if a[i - 1] == b[j - 1] else 1
+                row[j] = min(previous[j] + 1, row[j - 1] + 1, previous[j - 1] + cost)
+                if (
+                    before_previous is not None and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]
+                ):
+                    row[j] = min(row[j], before_previous[j - 2] + 1)
+
+            # A transposition can reach back one row, so stop only once two rows are over
+            if min(row) > limit and min(previous) > limit:
+                return False
+            before_previous, previous = previous, row
+
+        return previous[-1] <= limit
@@ -0,0 +1,29 @@
+from typing import Iterable, List, Optional
+
+
+# Search Backend Interface
+class SearchBackend:
+    """
+    Base class for menu search backends.
+    A search returns every matching food item id, best match first;
+    callers page and filter the ranked ids themselves so totals are
+    exact.
+    """
+
+    def search(self, query: str) -> List[int]:
+        """Ranked ids of food items matching `query`"""
+        raise NotImplementedError
+
+    def warm(self) -> None:
+        """Prepare the backend ahead of the first search"""
+
+    def refresh_items(
+        self,
+        item_ids: Iterable[int],
+        previous_version: Optional[int] = None,
+        version: Optional[int] = None
+    ) -> None:
+        """
+        Pick up edits to the given items. The catalog version stamps
+        before/after the edit let in-process indexes skip a full rebuild.
+        """
@@ -0,0 +1,155 @@
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from flask import Flask, current_app, has_app_context
+
+from utils import errhandler
+from ..catalog_cache import CatalogCache
+from .search_backend import SearchBackend
+from .index_backend import IndexSearch
+from .fulltext_backend import FullTextSearch
+from .suggester import Suggester
+
+
+# Menu Search Access Point
+class MenuSearch:
+    """
+    Builds the configured menu search backend and exposes it to services.
+    Backend is chosen by SEARCH_BACKEND: "index" (in-process inverted
+    index, default) or "fulltext" (MySQL FULLTEXT).
+
+    Typeahead suggestions always come from an in-process Suggester,
+    whichever backend serves full searches.
+    """
+
+    EXTENSION_KEY = "search"
+    SUGGEST_EXTENSION_KEY = "search_suggest"
+    WARMED_EXTENSION_KEY = "search_warmed_pid"
+
+    _warm_lock = threading.Lock()
+
+    # Used outside an app context (CLI scripts, tests)
+    _fallback: Optional[SearchBackend] = None
+    _fallback_suggester: Optional[Suggester] = None
+
+    @classmethod
+    def init_app(cls, app: Flask) -> SearchBackend:
+        """
+        Create the backend and suggester. With SEARCH_WARM_ON_START,
+        each worker builds them in the background when it serves its
+        first request, so CLI commands (flask db upgrade, ...) never
+        touch the catalog.
+        """
+        backend = cls.create_backend(app.config)
+        app.extensions[cls.EXTENSION_KEY] = backend
+
+        suggester = cls.create_suggester()
+        app.extensions[cls.SUGGEST_EXTENSION_KEY] = suggester
+
+        if app.config.get("SEARCH_WARM_ON_START"):
+            app.before_request(cls._warm_in_background)
+
+        return backend
+
+    @staticmethod
+    def create_backend(config) -> SearchBackend:
+        """Instantiate a backend from a config mapping"""
+        from website.repositories import FoodItemRepository
+
+        kind = str(config.get("SEARCH_BACKEND", "index")).strip().lower()
+
+        if kind == "fulltext":
+            return FullTextSearch(query=lambda against: FoodItemRepository().fulltext_search(against))
+
+        if kind == "index":
+            return IndexSearch(
+                loader=lambda ids: FoodItemRepository().find_search_documents(ids),
+                version=CatalogCache.version
+            )
+
+        raise ValueError(f"Unknown SEARCH_BACKEND '{kind}'")
+
+    @staticmethod
+    def create_suggester() -> Suggester:
+        """Name suggester over available items and active categories"""
+        from website.repositories import FoodItemRepository, CategoryRepository
+
+        return Suggester(
+            items=lambda ids: FoodItemRepository().find_names(ids),
+            categories=lambda: [
+                {'id': category.id, 'name': category.name}
+                for category in CategoryRepository().find_all_active()
+            ],
+            version=CatalogCache.version
+        )
+
+    @classmethod
+    def backend(cls) -> SearchBackend:
+        """Backend for the current app"""
+        if has_app_context():
+            backend = current_app.extensions.get(cls.EXTENSION_KEY)
+            if backend is None:
+                backend = current_app.extensions[cls.EXTENSION_KEY] = cls.create_backend(current_app.config)
+            return backend
+
+        if cls._fallback is None:
+            cls._fallback = cls.create_backend({})
+        return cls._fallback
+
+    @classmethod
+    def suggester(cls) -> Suggester:
+        """Suggester for the current app"""
+        if has_app_context():
+            suggester = current_app.extensions.get(cls.SUGGEST_EXTENSION_KEY)
+            if suggester is None:
+                suggester = current_app.extensions[cls.SUGGEST_EXTENSION_KEY] = cls.create_suggester()
+            return suggester
+
+        if cls._fallback_suggester is None:
+            cls._fallback_suggester = cls.create_suggester()
+        return cls._fallback_suggester
+
+    # Warm-up
+
+    @classmethod
+    def _warm_in_background(cls) -> None:
+        app = current_app._get_current_object()
+        pid = os.getpid()
+
+        with cls._warm_lock:
+            if app.extensions.get(cls.WARMED_EXTENSION_KEY) == pid:
+                return
+            app.extensions[cls.WARMED_EXTENSION_KEY] = pid
+
+        def run():
+            with app.app_context():
+                try:
+                    app.extensions[cls.EXTENSION_KEY].warm()
+                    app.extensions[cls.SUGGEST_EXTENSION_KEY].warm()
+                except Exception as e:
+                    # The first search builds it instead
+                    errhandler(e, log="menu_search", path="modules")
+
+        threading.Thread(target=run, name="menu-search-warm", daemon=True).start()
+
+    # Shortcuts
+
+    @classmethod
+    def search(cls, query: str) -> List[int]:
+        return cls.backend().search(query)
+
+    @classmethod
+    def suggest(cls, query: str, limit: int = 8) -> List[Dict[str, Any]]:
+        return cls.suggester().suggest(query, limit)
+
+    @classmethod
+    def refresh_items(
+        cls,
+        item_ids: Iterable[int],
+        previous_version: Optional[int] = None,
+        version: Optional[int] = None
+    ) -> None:
+        item_ids = list(item_ids)
+        cls.backend().refresh_items(item_ids, previous_version, version)
+        cls.suggester().refresh_items(item_ids, previous_version, version)
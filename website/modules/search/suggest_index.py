@@ -0,0 +1,93 @@
+import bisect
+from typing import Any, Dict, List, Tuple
+
+from .inverted_index import InvertedIndex
+
+
+# Prefix Lookup over Names
+class SuggestIndex:
+    """
+    Sorted array of normalized name keys for typeahead.
+
+    Every name is stored once per word start ("avocado toast" and
+    "toast"), so a query matches the beginning of any word; lookup is a
+    bisect to the first key >= query followed by a short scan while keys
+    still start with it. Entries are (kind, id) pairs, e.g.
+    ("item", 12) or ("category", 3). Inserts/removals keep the array
+    sorted, so single edits never need a rebuild.
+
+    Not safe to modify while other threads read it: patch a copy() and
+    swap it in.
+    """
+
+    # Keys inspected per lookup (bounds work for one-letter queries)
+    MAX_SCAN = 200
+
+    def __init__(self):
+        # (key, word position, kind, id), sorted
+        self._keys: List[Tuple[str, int, str, Any]] = []
+        # (kind, id) -> (label, its keys)
+        self._entries: Dict[Tuple[str, Any], Tuple[str, List[Tuple[str, int, str, Any]]]] = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def copy(self) -> "SuggestIndex":
+        """Independent copy to patch while readers keep using this one"""
+        clone = SuggestIndex()
+        clone._keys = list(self._keys)
+        clone._entries = dict(self._entries)
+        return clone
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return " ".join(InvertedIndex.tokenize(text))
+
+    def add(self, kind: str, entry_id: Any, label: str) -> None:
+        """Insert (or replace) a named entry"""
+        self.remove(kind, entry_id)
+
+        words = InvertedIndex.tokenize(label)
+        keys = [(" ".join(words[position:]), position, kind, entry_id) for position in range(len(words))]
+        for key in keys:
+            bisect.insort(self._keys, key)
+
+        self._entries[(kind, entry_id)] = (label, keys)
+
+    def remove(self, kind: str, entry_id: Any) -> bool:
+        """Drop an entry; returns False if it was not present"""
+        entry = self._entries.pop((kind, entry_id), None)
+        if entry is None:
+            return False
+
+        for key in entry[1]:
+            position = bisect.bisect_left(self._keys, key)
+            if position < len(self._keys) and self._keys[position] == key:
+                del self._keys[position]
+        return True
+
+    def lookup(self, query: str, limit: int = 8) -> List[Dict[str, Any]]:
+        """
+        Entries with a word starting with `query`, best first: whole-name
+        prefix matches, then items before categories, then shorter names.
+        """
+        prefix = self.normalize(query)
+        if not prefix:
+            return []
+
+        matches: Dict[Tuple[str, Any], Tuple[int, int, int, str]] = {}
+        start = bisect.bisect_left(self._keys, (prefix,))
+        for key, position, kind, entry_id in self._keys[start:start + self.MAX_SCAN]:
+            if not key.startswith(prefix):
+                break
+
+            label = self._entries[(kind, entry_id)][0]
+            rank = (0 if position == 0 else 1, 0 if kind == "item" else 1, len(label), label)
+            if rank < matches.get((kind, entry_id), (2,)):
+                matches[(kind, entry_id)] = rank
+
+        best = sorted(matches.items(), key=lambda pair: pair[1])[:limit]
+        return [
+            {'type': kind, 'id': entry_id, 'label': rank[3]}
+            for (kind, entry_id), rank in best
+        ]
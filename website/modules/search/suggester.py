@@ -0,0 +1,89 @@
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .suggest_index import SuggestIndex
+
+
+# Typeahead Suggestions
+class Suggester:
+    """
+    Keeps a SuggestIndex of available item and active category names in
+    this process, tagged with the catalog version it was built from.
+    Lookups never touch the database; a version change made by another
+    worker triggers one rebuild, and edits made here are applied to a
+    copy that replaces the index via refresh_items() (same contract as
+    IndexSearch), so lookups never see a half-patched index.
+
+    items(ids) returns [{'id', 'name'}] for available items (all when ids is None);
+    categories() returns [{'id', 'name'}] for active categories.
+    """
+
+    def __init__(
+        self,
+        items: Callable[[Optional[List[int]]], List[Dict[str, Any]]],
+        categories: Callable[[], List[Dict[str, Any]]],
+        version: Callable[[], int]
+    ):
+        self.items = items
+        self.categories = categories
+        self.version = version
+
+        self._lock = threading.Lock()
+        self._index: Optional[SuggestIndex] = None
+        self._version: Optional[int] = None
+
+        self.builds = 0
+
+    def suggest(self, query: str, limit: int = 8) -> List[Dict[str, Any]]:
+        return self._current_index().lookup(query, limit)
+
+    def warm(self) -> None:
+        self._current_index()
+
+    def refresh_items(
+        self,
+        item_ids: Iterable[int],
+        previous_version: Optional[int] = None,
+        version: Optional[int] = None
+    ) -> None:
+        item_ids = list(item_ids)
+
+        with self._lock:
+            if self._index is None or previous_version is None or self._version != previous_version:
+                return
+
+            # Patch a copy: lookups read the current index without the lock
+            index = self._index.copy()
+            names = {item['id']: item['name'] for item in self.items(item_ids)}
+            for item_id in item_ids:
+                if item_id in names:
+                    index.add("item", item_id, names[item_id])
+                else:
+                    index.remove("item", item_id)
+
+            self._index = index
+            self._version = version
+
+    # Helper Methods
+
+    def _current_index(self) -> SuggestIndex:
+        version = self.version()
+
+        index = self._index
+        if index is not None and self._version == version:
+            return index
+
+        with self._lock:
+            if self._index is not None and self._version == version:
+                return self._index
+
+            index = SuggestIndex()
+            for item in self.items(None):
+                index.add("item", item['id'], item['name'])
+            for category in self.categories():
+                index.add("category", category['id'], category['name'])
+
+            self._index = index
+            self._version = version
+            self.builds += 1
+            return index
@@ -1,5 +1,8 @@
 
 from .base_repository import BaseRepository
+from .date_range import DateRange
+from .keyset import Keyset, Page
+from .row_count import RowCount, Total
 from .order_repository import OrderRepository
 from .user_repository import UserRepository
 from .customer_repository import CustomerRepository
@@ -9,9 +12,15 @@ from .food_item_repository import FoodItemRepository
 from .category_repository import CategoryRepository
 from .points_repository import PointsRepository
 from .admin_repository import AdminRepository
+from .sales_summary_repository import SalesSummaryRepository
 
 __all__ = [
     "BaseRepository",
+    "DateRange",
+    "Keyset",
+    "Page",
+    "RowCount",
+    "Total",
     "OrderRepository",
     "UserRepository",
     "CustomerRepository",
@@ -20,5 +29,6 @@ __all__ = [
     "FoodItemRepository",
     "CategoryRepository",
     "PointsRepository",
-    "AdminRepository"
+    "AdminRepository",
+    "SalesSummaryRepository"
 ]
\ No newline at end of file
@@ -1,30 +1,40 @@
 from typing import List, Dict, Any, Optional
-from datetime import datetime, date, timedelta
-from sqlalchemy import select, func, desc, and_, or_
+from datetime import datetime, date, timedelta, timezone
+from sqlalchemy import select, func, desc, and_, or_, case, true
 from sqlalchemy.orm import joinedload
 
 from website.models import (
     User, FoodItem, Category, Order, OrderItem,
     Review, PointsTransaction, OrderStatus, UserRole
 )
+from website.modules import Cache
 from .base_repository import BaseRepository
+from .sales_summary_repository import SalesSummaryRepository
+from .date_range import DateRange
+from .keyset import Keyset, Page
+from .row_count import RowCount, Total
 from database import db
 
 
 class AdminRepository(BaseRepository[User]):
     """Repository for admin-specific queries"""
 
-    def __init__(self):
+    def __init__(self, summary_repo: SalesSummaryRepository = None):
         super().__init__(User)
+        self.summary_repo = summary_repo or SalesSummaryRepository()
+
+    # Cache Keys
+    SYSTEM_STATS_CACHE_KEY = "admin:system_stats"
 
     # User Management
     def find_all_users(
         self,
         page: int = 1,
         per_page: int = 20,
-        role: UserRole = None
-    ) -> List[User]:
-        """Get all users with optional role filter"""
+        role: UserRole = None,
+        cursor: str = None
+    ) -> Page:
+        """Get all users with optional role filter (newest first)"""
         conditions = []
         if role:
             conditions.append(User.role == role)
@@ -33,20 +43,20 @@ class AdminRepository(BaseRepository[User]):
         if conditions:
             stmt = stmt.where(and_(*conditions))
 
-        stmt = (
-            stmt
-            .order_by(desc(User.created_at))
-            .limit(per_page)
-            .offset((page - 1) * per_page)
+        return self.paginate(
+            stmt,
+            Keyset(User.created_at, User.id, descending=True),
+            page=page,
+            per_page=per_page,
+            cursor=cursor
         )
-        return db.session.execute(stmt).scalars().all()
 
-    def count_users(self, role: UserRole = None) -> int:
-        """Count total users"""
-        query = db.session.query(func.count(User.id))
+    def count_users(self, role: UserRole = None, strategy: str = RowCount.EXACT) -> Total:
+        """Count total users (see RowCount for strategies)"""
+        stmt = select(func.count(User.id))
         if role:
-            query = query.filter(User.role == role)
-        return query.scalar() or 0
+            stmt = stmt.where(User.role == role)
+        return RowCount.count(stmt, strategy)
 
     def search_users(self, search_term: str) -> List[User]:
         """Search users by name, email, or phone"""
@@ -71,26 +81,31 @@ class AdminRepository(BaseRepository[User]):
         start_date: date = None,
         end_date: date = None
     ) -> Dict[str, Any]:
-        """Get revenue statistics for date range"""
-        query = db.session.query(
-            func.count(Order.id).label('total_orders'),
-            func.sum(Order.total_amount).label('total_revenue'),
-            func.avg(Order.total_amount).label('average_order_value'),
-            func.sum(Order.discount_amount).label('total_discounts')
-        ).filter(Order.status == OrderStatus.COMPLETED)
+        """
+        Get revenue statistics for date range.
+        Closed days come from daily_sales_summary; only today is read
+        from live orders.
+        """
+        today = self._today()
+        closed_end = min(end_date, today - timedelta(days=1)) if end_date else today - timedelta(days=1)
+
+        closed = {'total_orders': 0, 'total_revenue': 0, 'total_discounts': 0}
+        if not start_date or start_date <= closed_end:
+            closed = self.summary_repo.aggregate_range(start_date, closed_end)
 
-        if start_date:
-            query = query.filter(func.date(Order.completed_at) >= start_date)
-        if end_date:
-            query = query.filter(func.date(Order.completed_at) <= end_date)
+        live = {'total_orders': 0, 'total_revenue': 0, 'total_discounts': 0}
+        if (not end_date or end_date >= today) and (not start_date or start_date <= today):
+            live = self._live_day_totals(today)
 
-        result = query.first()
+        total_orders = closed['total_orders'] + live['total_orders']
+        total_revenue = float(closed['total_revenue']) + float(live['total_revenue'])
+        total_discounts = float(closed['total_discounts']) + float(live['total_discounts'])
 
         return {
-            'total_orders': result.total_orders or 0,
-            'total_revenue': float(result.total_revenue or 0),
-            'average_order_value': float(result.average_order_value or 0),
-            'total_discounts': float(result.total_discounts or 0)
+            'total_orders': total_orders,
+            'total_revenue': total_revenue,
+            'average_order_value': total_revenue / total_orders if total_orders else 0.0,
+            'total_discounts': total_discounts
         }
 
     def get_daily_revenue(
@@ -98,29 +113,55 @@ class AdminRepository(BaseRepository[User]):
         start_date: date,
         end_date: date
     ) -> List[Dict[str, Any]]:
-        """Get daily revenue breakdown"""
-        results = db.session.query(
-            func.date(Order.completed_at).label('date'),
-            func.count(Order.id).label('orders'),
-            func.sum(Order.total_amount).label('revenue')
-        ).filter(
-            Order.status == OrderStatus.COMPLETED,
-            func.date(Order.completed_at).between(start_date, end_date)
-        ).group_by(
-            func.date(Order.completed_at)
-        ).order_by(
-            func.date(Order.completed_at)
-        ).all()
+        """Get daily revenue breakdown (summary rows + live today)"""
+        today = self._today()
 
-        return [
+        daily = [
             {
-                'date': str(r.date),
-                'orders': r.orders,
-                'revenue': float(r.revenue)
+                'date': str(row.date),
+                'orders': row.order_count,
+                'revenue': float(row.total_revenue)
             }
-            for r in results
+            for row in self.summary_repo.find_range(
+                start_date,
+                min(end_date, today - timedelta(days=1))
+            )
+            if row.order_count
         ]
 
+        if start_date <= today <= end_date:
+            live = self._live_day_totals(today)
+            if live['total_orders']:
+                daily.append({
+                    'date': str(today),
+                    'orders': live['total_orders'],
+                    'revenue': float(live['total_revenue'])
+                })
+
+        return daily
+
+    def _live_day_totals(self, day: date) -> Dict[str, Any]:
+        """Aggregate completed orders for one (open) day from the orders table"""
+        result = db.session.query(
+            func.count(Order.id).label('total_orders'),
+            func.sum(Order.total_amount).label('total_revenue'),
+            func.sum(Order.discount_amount).label('total_discounts')
+        ).filter(
+            Order.status == OrderStatus.COMPLETED,
+            *DateRange.for_day(day).filter(Order.completed_at)
+        ).first()
+
+        return {
+            'total_orders': result.total_orders or 0,
+            'total_revenue': result.total_revenue or 0,
+            'total_discounts': result.total_discounts or 0
+        }
+
+    @staticmethod
+    def _today() -> date:
+        """Open rollup day (reporting timezone)"""
+        return DateRange.today()
+
     def get_top_customers(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get top customers by total spending"""
         results = db.session.query(
@@ -184,26 +225,56 @@ class AdminRepository(BaseRepository[User]):
             for r in results
         ]
 
-    def get_system_stats(self) -> Dict[str, Any]:
-        """Get overall system statistics"""
-        total_users = db.session.query(func.count(User.id)).scalar() or 0
-        total_orders = db.session.query(func.count(Order.id)).scalar() or 0
-        total_items = db.session.query(func.count(FoodItem.id)).scalar() or 0
-        total_reviews = db.session.query(func.count(Review.id)).scalar() or 0
+    def get_system_stats(self, max_staleness: int = None) -> Dict[str, Any]:
+        """
+        Get overall system statistics in a single round trip.
+        With max_staleness (seconds), serve a shared cached snapshot
+        no older than that instead of recounting every call.
+        """
+        if max_staleness:
+            return Cache.get_or_set(
+                self.SYSTEM_STATS_CACHE_KEY,
+                self._query_system_stats,
+                max_staleness
+            )
+        return self._query_system_stats()
 
-        active_users = db.session.query(func.count(User.id)).filter(
-            User.is_verified == True
-        ).scalar() or 0
+    def _query_system_stats(self) -> Dict[str, Any]:
+        """All dashboard counters via conditional aggregation + scalar subqueries"""
+        user_stats = select(
+            func.count(User.id).label('total_users'),
+            func.sum(case((User.is_verified == True, 1), else_=0)).label('active_users')
+        ).subquery()
 
-        pending_orders = db.session.query(func.count(Order.id)).filter(
-            Order.status.in_([OrderStatus.PENDING, OrderStatus.PREPARING])
-        ).scalar() or 0
+        order_stats = select(
+            func.count(Order.id).label('total_orders'),
+            func.sum(
+                case(
+                    (Order.status.in_([OrderStatus.PENDING, OrderStatus.PREPARING]), 1),
+                    else_=0
+                )
+            ).label('pending_orders')
+        ).subquery()
+
+        stmt = select(
+            user_stats.c.total_users,
+            user_stats.c.active_users,
+            order_stats.c.total_orders,
+            order_stats.c.pending_orders,
+            select(func.count(FoodItem.id)).scalar_subquery().label('total_items'),
+            select(func.count(Review.id)).scalar_subquery().label('total_reviews')
+        ).select_from(
+            user_stats.join(order_stats, true())
+        )
+
+        result = db.session.execute(stmt).one()
 
         return {
-            'total_users': total_users,
-            'active_users': active_users,
-            'total_orders': total_orders,
-            'pending_orders': pending_orders,
-            'total_items': total_items,
-            'total_reviews': total_reviews
+            'total_users': int(result.total_users or 0),
+            'active_users': int(result.active_users or 0),
+            'total_orders': int(result.total_orders or 0),
+            'pending_orders': int(result.pending_orders or 0),
+            'total_items': int(result.total_items or 0),
+            'total_reviews': int(result.total_reviews or 0),
+            'generated_at': datetime.now(timezone.utc).isoformat()
         }
\ No newline at end of file
@@ -1,6 +1,7 @@
 # repositories/base_repository.py
 from typing import TypeVar, Generic, Type, List, Optional
-from sqlalchemy import select, func
+from sqlalchemy import select, func, Select
+from .keyset import Keyset, Page
 from database import db
 
 T = TypeVar('T')
@@ -15,10 +16,44 @@ class BaseRepository(Generic[T]):
         """Get single record by ID"""
         return db.session.get(self.model, id)
 
-    def get_all(self, page: int = 1, per_page: int = 20) -> List[T]:
-        """Get all records with pagination"""
-        stmt = select(self.model).limit(per_page).offset((page - 1) * per_page)
-        return db.session.execute(stmt).scalars().all()
+    def get_all(self, page: int = 1, per_page: int = 20, cursor: str = None) -> Page:
+        """Get all records with pagination (by id)"""
+        return self.paginate(
+            select(self.model),
+            Keyset(self.model.id),
+            page=page,
+            per_page=per_page,
+            cursor=cursor
+        )
+
+    def paginate(
+        self,
+        stmt: Select,
+        keyset: Keyset,
+        page: int = 1,
+        per_page: int = 20,
+        cursor: str = None
+    ) -> Page:
+        """
+        Run a listing query one page at a time.
+        With a cursor, seeks past it (keyset pagination); without one,
+        falls back to OFFSET for `page`. Either way the returned Page
+        carries the cursor for the next page.
+        """
+        values = keyset.decode(cursor) if cursor else None
+
+        if values is not None:
+            stmt = stmt.where(*keyset.filter(values))
+        elif page > 1:
+            stmt = stmt.offset((page - 1) * per_page)
+
+        # One extra row tells us whether there is a next page
+        stmt = stmt.order_by(*keyset.order_by()).limit(per_page + 1)
+        rows = db.session.execute(stmt).scalars().unique().all()
+
+        items = rows[:per_page]
+        next_cursor = keyset.encode(items[-1]) if len(rows) > per_page else None
+        return Page(items, next_cursor)
 
     def create(self, instance: T) -> T:
         """Create new record"""
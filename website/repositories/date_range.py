@@ -0,0 +1,113 @@
+from typing import List, Optional, Tuple
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from zoneinfo import ZoneInfo
+
+from flask import current_app, has_app_context
+from sqlalchemy import DateTime
+
+
+class DateRange:
+    """
+    Inclusive span of calendar days expressed as a half-open
+    [start, end) timestamp range.
+
+    Days are reporting-timezone days (REPORTING_TIMEZONE, default UTC).
+    Timestamps are stored in UTC, so bounds are converted to UTC before
+    being compared against a column. Filters compare the bare column,
+    which keeps the predicate sargable (index range scan) instead of
+    wrapping it in DATE().
+    """
+
+    DEFAULT_TIMEZONE = "UTC"
+
+    def __init__(self, start_date: date = None, end_date: date = None):
+        if start_date and end_date and end_date < start_date:
+            raise ValueError("End date must not be before start date")
+
+        self.start_date = start_date
+        self.end_date = end_date
+
+    def __repr__(self):
+        return f'<DateRange {self.start_date} .. {self.end_date}>'
+
+    # Constructors
+
+    @classmethod
+    def for_day(cls, day: date) -> 'DateRange':
+        """Range covering a single day"""
+        return cls(day, day)
+
+    @classmethod
+    def last_days(cls, days: int) -> 'DateRange':
+        """Range covering the last N days up to and including today"""
+        today = cls.today()
+        return cls(today - timedelta(days=days), today)
+
+    # Timezone Helpers
+
+    @classmethod
+    def reporting_timezone(cls) -> tzinfo:
+        """Reporting timezone"""
+        name = cls.DEFAULT_TIMEZONE
+        if has_app_context():
+            name = current_app.config.get("REPORTING_TIMEZONE") or name
+        return timezone.utc if name == "UTC" else ZoneInfo(name)
+
+    @classmethod
+    def today(cls) -> date:
+        """Current day in the reporting timezone"""
+        return datetime.now(cls.reporting_timezone()).date()
+
+    @classmethod
+    def local_date(cls, value: datetime) -> date:
+        """Reporting day a stored timestamp falls on (naive = UTC)"""
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.astimezone(cls.reporting_timezone()).date()
+
+    # Bounds & Predicates
+
+    def bounds(self, column=None) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """
+        UTC (start, end) timestamps; either is None when open-ended.
+        Naive values are returned for columns without timezone=True.
+        """
+        tz = self.reporting_timezone()
+        aware = self._is_timezone_aware(column)
+
+        def midnight(day: date) -> datetime:
+            value = datetime.combine(day, time.min, tzinfo=tz).astimezone(timezone.utc)
+            return value if aware else value.replace(tzinfo=None)
+
+        start = midnight(self.start_date) if self.start_date else None
+        end = midnight(self.end_date + timedelta(days=1)) if self.end_date else None
+
+        return start, end
+
+    def filter(self, column) -> List:
+        """Sargable predicates: start <= column < end"""
+        start, end = self.bounds(column)
+
+        conditions = []
+        if start is not None:
+            conditions.append(column >= start)
+        if end is not None:
+            conditions.append(column < end)
+        return conditions
+
+    def days(self) -> List[date]:
+        """Every day in the range (both ends required)"""
+        if not (self.start_date and self.end_date):
+            raise ValueError("Open-ended ranges cannot be enumerated")
+
+        return [
+            self.start_date + timedelta(days=i)
+            for i in range((self.end_date - self.start_date).days + 1)
+        ]
+
+    # Helper Methods
+
+    @staticmethod
+    def _is_timezone_aware(column) -> bool:
+        column_type = getattr(column, 'type', None)
+        return isinstance(column_type, DateTime) and bool(column_type.timezone)
@@ -1,9 +1,12 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 from sqlalchemy import select, func, desc, and_
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.dialects.mysql import match
 
-from website.models import FoodItem, Category, Ingredient, Review, OrderItem
+from website.models import FoodItem, Category, Ingredient, OrderItem
 from .base_repository import BaseRepository
+from .keyset import Keyset, Page
+from .row_count import RowCount, Total
 from database import db
 
 
@@ -15,43 +18,66 @@ class FoodItemRepository(BaseRepository[FoodItem]):
 
     def find_by_id_with_details(self, food_item_id: int) -> Optional[FoodItem]:
         """
-        Get food item with all related data (ingredients, reviews, category).
-        Optimized with eager loading to reduce queries.
+        Get food item with its category and ingredients.
+        Category is joined (one row); ingredients come from a second
+        SELECT ... IN so they never multiply the item row. Reviews are
+        not loaded: page them with ReviewRepository.find_by_food_item.
         """
         stmt = (
             select(FoodItem)
             .where(FoodItem.id == food_item_id)
             .options(
                 joinedload(FoodItem.category),
-                joinedload(FoodItem.ingredients),
-                joinedload(FoodItem.reviews).joinedload(Review.user)
+                selectinload(FoodItem.ingredients)
             )
         )
         return db.session.execute(stmt).scalar_one_or_none()
 
+    # Catalog listings page alphabetically
+    BY_NAME = Keyset(FoodItem.name, FoodItem.id)
+
     def find_all_available(
         self,
         page: int = 1,
-        per_page: int = 20
-    ) -> List[FoodItem]:
+        per_page: int = 20,
+        cursor: str = None
+    ) -> Page:
         """Get all available food items with pagination"""
         stmt = (
             select(FoodItem)
             .where(FoodItem.is_available == True)
             .options(joinedload(FoodItem.category))
+        )
+        return self.paginate(stmt, self.BY_NAME, page=page, per_page=per_page, cursor=cursor)
+
+    def find_catalog_items(self, available_only: bool = True) -> List[FoodItem]:
+        """Get every (available) food item with its category (no pagination)"""
+        stmt = (
+            select(FoodItem)
+            .options(joinedload(FoodItem.category))
             .order_by(FoodItem.name)
-            .limit(per_page)
-            .offset((page - 1) * per_page)
         )
+        if available_only:
+            stmt = stmt.where(FoodItem.is_available == True)
         return db.session.execute(stmt).scalars().unique().all()
 
+    def find_allergen_item_ids(self) -> Set[int]:
+        """Ids of food items with at least one allergen ingredient"""
+        stmt = (
+            select(Ingredient.food_item_id)
+            .where(Ingredient.is_allergen == True)
+            .distinct()
+        )
+        return set(db.session.execute(stmt).scalars().all())
+
     def find_by_category(
         self,
         category_id: int,
         available_only: bool = True,
         page: int = 1,
-        per_page: int = 20
-    ) -> List[FoodItem]:
+        per_page: int = 20,
+        cursor: str = None
+    ) -> Page:
         """Get food items by category"""
         conditions = [FoodItem.category_id == category_id]
 
@@ -62,19 +88,17 @@ class FoodItemRepository(BaseRepository[FoodItem]):
             select(FoodItem)
             .where(and_(*conditions))
             .options(joinedload(FoodItem.category))
-            .order_by(FoodItem.name)
-            .limit(per_page)
-            .offset((page - 1) * per_page)
         )
-        return db.session.execute(stmt).scalars().unique().all()
+        return self.paginate(stmt, self.BY_NAME, page=page, per_page=per_page, cursor=cursor)
 
     def search_by_name(
         self,
         search_term: str,
         available_only: bool = True,
         page: int = 1,
-        per_page: int = 20
-    ) -> List[FoodItem]:
+        per_page: int = 20,
+        cursor: str = None
+    ) -> Page:
         """Search food items by name"""
         conditions = [FoodItem.name.ilike(f'%{search_term}%')]
 
@@ -85,28 +109,87 @@ class FoodItemRepository(BaseRepository[FoodItem]):
             select(FoodItem)
             .where(and_(*conditions))
             .options(joinedload(FoodItem.category))
-            .order_by(FoodItem.name)
-            .limit(per_page)
-            .offset((page - 1) * per_page)
         )
-        return db.session.execute(stmt).scalars().unique().all()
+        return self.paginate(stmt, self.BY_NAME, page=page, per_page=per_page, cursor=cursor)
 
-    def count_available(self) -> int:
-        """Count total available items"""
-        return db.session.query(func.count(FoodItem.id)).filter(
-            FoodItem.is_available == True
-        ).scalar() or 0
+    def find_search_documents(self, food_item_ids: List[int] = None) -> List[Dict[str, Any]]:
+        """
+        Searchable text of available items (name, description, category
+        and ingredient names), optionally restricted to some ids.
+        """
+        stmt = (
+            select(FoodItem)
+            .where(FoodItem.is_available == True)
+            .options(joinedload(FoodItem.category), selectinload(FoodItem.ingredients))
+        )
+        if food_item_ids is not None:
+            stmt = stmt.where(FoodItem.id.in_(food_item_ids))
 
-    def count_by_category(self, category_id: int, available_only: bool = True) -> int:
-        """Count items in a category"""
+        items = db.session.execute(stmt).scalars().unique().all()
+        return [
+            {
+                'id': item.id,
+                'name': item.name,
+                'description': item.description,
+                'category': item.category.name,
+                'ingredients': [ing.name for ing in item.ingredients]
+            }
+            for item in items
+        ]
+
+    def find_names(self, food_item_ids: List[int] = None) -> List[Dict[str, Any]]:
+        """Ids and names of available items, optionally restricted to some ids"""
+        stmt = select(FoodItem.id, FoodItem.name).where(FoodItem.is_available == True)
+        if food_item_ids is not None:
+            stmt = stmt.where(FoodItem.id.in_(food_item_ids))
+
+        return [{'id': row.id, 'name': row.name} for row in db.session.execute(stmt)]
+
+    def fulltext_search(self, against: str) -> List[int]:
+        """
+        Ranked ids of available items for a MySQL BOOLEAN MODE query
+        (FULLTEXT indexes on food item, category and ingredient text).
+        """
+        text_score = match(FoodItem.name, FoodItem.description, against=against).in_boolean_mode()
+        category_score = match(Category.name, against=against).in_boolean_mode()
+        ingredient_score = (
+            select(func.coalesce(func.max(match(Ingredient.name, against=against).in_boolean_mode()), 0))
+            .where(Ingredient.food_item_id == FoodItem.id)
+            .scalar_subquery()
+        )
+        score = text_score * 2 + category_score + ingredient_score
+
+        stmt = (
+            select(FoodItem.id)
+            .join(Category, Category.id == FoodItem.category_id)
+            .where(FoodItem.is_available == True, score > 0)
+            .order_by(desc(score), FoodItem.name)
+        )
+        return list(db.session.execute(stmt).scalars().all())
+
+    def count_available(self, strategy: str = RowCount.EXACT) -> Total:
+        """Count total available items (see RowCount for strategies)"""
+        return RowCount.count(
+            select(func.count(FoodItem.id)).where(FoodItem.is_available == True),
+            strategy
+        )
+
+    def count_by_category(
+        self,
+        category_id: int,
+        available_only: bool = True,
+        strategy: str = RowCount.EXACT
+    ) -> Total:
+        """Count items in a category (see RowCount for strategies)"""
         conditions = [FoodItem.category_id == category_id]
 
         if available_only:
             conditions.append(FoodItem.is_available == True)
 
-        return db.session.query(func.count(FoodItem.id)).filter(
-            and_(*conditions)
-        ).scalar() or 0
+        return RowCount.count(
+            select(func.count(FoodItem.id)).where(and_(*conditions)),
+            strategy
+        )
 
     def get_popular_items(self, limit: int = 10) -> List[FoodItem]:
         """
@@ -116,6 +199,7 @@ class FoodItemRepository(BaseRepository[FoodItem]):
             select(FoodItem)
             .join(OrderItem, OrderItem.food_item_id == FoodItem.id)
             .where(FoodItem.is_available == True)
+            .options(selectinload(FoodItem.category))
             .group_by(FoodItem.id)
             .order_by(desc(func.count(OrderItem.id)))
             .limit(limit)
@@ -128,20 +212,22 @@ class FoodItemRepository(BaseRepository[FoodItem]):
         """
         stmt = (
             select(FoodItem)
-            .join(Review, Review.food_item_id == FoodItem.id)
-            .where(FoodItem.is_available == True)
-            .group_by(FoodItem.id)
-            .having(func.count(Review.id) >= min_reviews)
-            .order_by(desc(func.avg(Review.rating)))
+            .where(
+                FoodItem.is_available == True,
+                FoodItem.rating_count >= max(min_reviews, 1)
+            )
+            .options(selectinload(FoodItem.category))
+            .order_by(desc(FoodItem.rating_sum / FoodItem.rating_count))
             .limit(limit)
         )
-        return db.session.execute(stmt).scalars().unique().all()
+        return db.session.execute(stmt).scalars().all()
 
     def get_newest_items(self, limit: int = 10) -> List[FoodItem]:
         """Get newest food items"""
         stmt = (
             select(FoodItem)
             .where(FoodItem.is_available == True)
+            .options(selectinload(FoodItem.category))
             .order_by(desc(FoodItem.created_at))
             .limit(limit)
         )
@@ -149,16 +235,35 @@ class FoodItemRepository(BaseRepository[FoodItem]):
 
     def get_average_rating(self, food_item_id: int) -> float:
         """Get average rating for a food item"""
-        avg_rating = db.session.query(
-            func.avg(Review.rating)
-        ).filter(
-            Review.food_item_id == food_item_id
-        ).scalar()
-
-        return float(avg_rating) if avg_rating else 0.0
+        return self.get_rating_stats([food_item_id])[food_item_id]['average']
 
     def get_review_count(self, food_item_id: int) -> int:
         """Get total reviews for a food item"""
-        return db.session.query(func.count(Review.id)).filter(
-            Review.food_item_id == food_item_id
-        ).scalar() or 0
\ No newline at end of file
+        return self.get_rating_stats([food_item_id])[food_item_id]['count']
+
+    def get_rating_stats(self, food_item_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Get average rating and review count for many food items.
+        Reads the denormalized counters in one query; unknown IDs get zeroed stats.
+        """
+        ids = {item_id for item_id in food_item_ids if item_id is not None}
+        stats = {item_id: {'average': 0.0, 'count': 0} for item_id in ids}
+
+        if not ids:
+            return stats
+
+        results = db.session.query(
+            FoodItem.id,
+            FoodItem.rating_sum,
+            FoodItem.rating_count
+        ).filter(
+            FoodItem.id.in_(ids)
+        ).all()
+
+        for r in results:
+            stats[r.id] = {
+                'average': r.rating_sum / r.rating_count if r.rating_count else 0.0,
+                'count': r.rating_count or 0
+            }
+
+        return stats
\ No newline at end of file
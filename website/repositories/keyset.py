@@ -0,0 +1,129 @@
+from typing import Any, List, Optional, Sequence
+from datetime import date, datetime
+from decimal import Decimal
+
+from flask import current_app
+from itsdangerous import BadSignature, URLSafeSerializer
+from sqlalchemy import and_, or_
+
+
+class Page(list):
+    """
+    A page of results. Behaves like the list it used to be, plus
+    `next_cursor`: an opaque token for the following page (None on the
+    last page).
+    """
+
+    def __init__(self, items=(), next_cursor: Optional[str] = None):
+        super().__init__(items)
+        self.next_cursor = next_cursor
+
+
+class Keyset:
+    """
+    Sort order for keyset ("seek") pagination.
+
+    Instead of OFFSET, the next page starts after the last row seen:
+        WHERE (a, b) < (:a, :b) ORDER BY a DESC, b DESC LIMIT n
+    so every page costs the same index range scan no matter how deep it
+    is. The last column must be unique (usually the primary key) to
+    break ties. All columns sort in the same direction.
+
+    Cursors carry the last row's sort values, signed with SECRET_KEY via
+    itsdangerous, so clients can't forge positions. A cursor is only
+    accepted by listings with the same sort columns; anything else
+    (tampered, foreign, stale format) starts from the first page.
+    """
+
+    SALT = "page-cursor"
+
+    def __init__(self, *columns, descending: bool = False):
+        if not columns:
+            raise ValueError("Keyset needs at least one column")
+
+        self.columns = columns
+        self.descending = descending
+
+    def __repr__(self):
+        return f'<Keyset {self.name} {"desc" if self.descending else "asc"}>'
+
+    @property
+    def name(self) -> str:
+        """Identifies the listing a cursor belongs to"""
+        return ",".join(str(column) for column in self.columns)
+
+    def order_by(self) -> List[Any]:
+        """ORDER BY clauses matching the seek predicate"""
+        return [column.desc() if self.descending else column.asc() for column in self.columns]
+
+    def filter(self, values: Sequence[Any]) -> List[Any]:
+        """
+        Conditions selecting rows after `values`. Expanded to
+        a < x OR (a = x AND b < y) rather than a row-value comparison,
+        which MySQL does not always turn into an index range.
+        """
+        clauses = []
+        for position, column in enumerate(self.columns):
+            ties = [self.columns[i] == values[i] for i in range(position)]
+            after = column < values[position] if self.descending else column > values[position]
+            clauses.append(and_(*ties, after))
+        return [or_(*clauses)]
+
+    # Cursors
+
+    def values(self, row: Any) -> List[Any]:
+        """Sort values of a loaded row"""
+        return [getattr(row, column.key) for column in self.columns]
+
+    def encode(self, row: Any) -> str:
+        """Opaque cursor pointing just after `row`"""
+        return self._serializer().dumps({
+            'k': self.name,
+            'v': [self._dump(value) for value in self.values(row)]
+        })
+
+    def decode(self, cursor: str) -> Optional[List[Any]]:
+        """Sort values from a cursor, or None if it is invalid/foreign"""
+        try:
+            payload = self._serializer().loads(cursor)
+        except BadSignature:
+            return None
+
+        if not isinstance(payload, dict) or payload.get('k') != self.name:
+            return None
+
+        raw = payload.get('v')
+        if not isinstance(raw, list) or len(raw) != len(self.columns):
+            return None
+
+        try:
+            return [self._load(column, value) for column, value in zip(self.columns, raw)]
+        except (TypeError, ValueError):
+            return None
+
+    # Helper Methods
+
+    def _serializer(self) -> URLSafeSerializer:
+        return URLSafeSerializer(current_app.config['SECRET_KEY'], salt=self.SALT)
+
+    @staticmethod
+    def _dump(value: Any) -> Any:
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if isinstance(value, Decimal):
+            return str(value)
+        if hasattr(value, 'value'):  # enum
+            return value.value
+        return value
+
+    @staticmethod
+    def _load(column: Any, value: Any) -> Any:
+        if value is None:
+            return None
+
+        python_type = column.type.python_type
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type is date:
+            return date.fromisoformat(value)
+        return python_type(value)
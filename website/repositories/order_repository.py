@@ -1,10 +1,13 @@
 # repositories/order_repository.py
-from typing import List, Dict, Optional
-from datetime import date, datetime
-from sqlalchemy import select, func, desc
+from typing import Any, List, Dict, Optional, Iterable
+from datetime import date
+from sqlalchemy import select, func, desc, or_
 from sqlalchemy.orm import joinedload
 from website.models import Order, OrderStatus, OrderItem, FoodItem
 from . import BaseRepository
+from .date_range import DateRange
+from .keyset import Keyset, Page
+from .row_count import RowCount, Total
 from database import db
 
 class OrderRepository(BaseRepository[Order]):
@@ -17,22 +20,44 @@ class OrderRepository(BaseRepository[Order]):
         stmt = select(Order).where(Order.order_number == order_number)
         return db.session.execute(stmt).scalar_one_or_none()
 
+    # Order listings page newest first
+    NEWEST_FIRST = Keyset(Order.created_at, Order.id, descending=True)
+
     def find_by_customer(
         self,
         customer_id: int,
         page: int = 1,
-        per_page: int = 10
-    ) -> List[Order]:
+        per_page: int = 10,
+        cursor: str = None
+    ) -> Page:
         """Get orders for a specific customer with pagination"""
         stmt = (
             select(Order)
             .where(Order.customer_id == customer_id)
             .options(joinedload(Order.order_items).joinedload(OrderItem.food_item))
-            .order_by(desc(Order.created_at))
-            .limit(per_page)
-            .offset((page - 1) * per_page)
         )
-        return db.session.execute(stmt).scalars().unique().all()
+        return self.paginate(stmt, self.NEWEST_FIRST, page=page, per_page=per_page, cursor=cursor)
+
+    def find_all(
+        self,
+        status: OrderStatus = None,
+        page: int = 1,
+        per_page: int = 20,
+        cursor: str = None
+    ) -> Page:
+        """Get all orders with optional status filter (admin listing)"""
+        stmt = select(Order)
+        if status:
+            stmt = stmt.where(Order.status == status)
+
+        return self.paginate(stmt, self.NEWEST_FIRST, page=page, per_page=per_page, cursor=cursor)
+
+    def count_all(self, status: OrderStatus = None, strategy: str = RowCount.EXACT) -> Total:
+        """Count orders with optional status filter (see RowCount for strategies)"""
+        stmt = select(func.count(Order.id))
+        if status:
+            stmt = stmt.where(Order.status == status)
+        return RowCount.count(stmt, strategy)
 
     def get_orders_by_status(
         self,
@@ -56,8 +81,8 @@ class OrderRepository(BaseRepository[Order]):
         stmt = (
             select(func.sum(Order.total_amount))
             .where(
-                func.date(Order.completed_at) == target_date,
-                Order.status == OrderStatus.COMPLETED
+                Order.status == OrderStatus.COMPLETED,
+                *DateRange.for_day(target_date).filter(Order.completed_at)
             )
         )
         result = db.session.execute(stmt).scalar()
@@ -75,8 +100,8 @@ class OrderRepository(BaseRepository[Order]):
             .join(OrderItem, OrderItem.food_item_id == FoodItem.id)
             .join(Order, Order.id == OrderItem.order_id)
             .where(
-                func.date(Order.completed_at).between(start_date, end_date),
-                Order.status == OrderStatus.COMPLETED
+                Order.status == OrderStatus.COMPLETED,
+                *DateRange(start_date, end_date).filter(Order.completed_at)
             )
             .group_by(FoodItem.id, FoodItem.name)
             .order_by(func.sum(OrderItem.quantity).desc())
@@ -100,7 +125,7 @@ class OrderRepository(BaseRepository[Order]):
             Order.customer_id == customer_id
         ).scalar() or 0
 
-    def get_customer_metrics(self, customer_id: int) -> Dict[str, any]:
+    def get_customer_metrics(self, customer_id: int) -> Dict[str, Any]:
         """
         Get aggregated metrics for a customer.
         Returns total orders, total spent, average order value.
@@ -120,6 +145,59 @@ class OrderRepository(BaseRepository[Order]):
             'avg_order_value': float(result.avg_order_value or 0)
         }
 
+    def get_status_summary(self, customer_id: int) -> Dict[OrderStatus, Dict[str, Any]]:
+        """
+        Order count and amount per status for a customer, in one GROUP BY.
+        Returns {status: {'count', 'total'}}; statuses with no orders are absent.
+        """
+        results = db.session.execute(
+            select(
+                Order.status,
+                func.count(Order.id).label('count'),
+                func.sum(Order.total_amount).label('total')
+            )
+            .where(Order.customer_id == customer_id)
+            .group_by(Order.status)
+        ).all()
+
+        return {
+            r.status: {'count': r.count, 'total': float(r.total or 0)}
+            for r in results
+        }
+
+    def get_recent_and_active_orders(
+        self,
+        customer_id: int,
+        statuses: Iterable[OrderStatus],
+        limit: int = 5
+    ) -> List[Order]:
+        """
+        The `limit` most recent orders plus every order in `statuses`,
+        with items loaded, in a single query (newest first).
+        """
+        # MySQL rejects LIMIT directly inside IN (...); a derived table is fine
+        recent = (
+            select(Order.id)
+            .where(Order.customer_id == customer_id)
+            .order_by(desc(Order.created_at))
+            .limit(limit)
+            .subquery()
+        )
+
+        stmt = (
+            select(Order)
+            .where(
+                Order.customer_id == customer_id,
+                or_(
+                    Order.status.in_(list(statuses)),
+                    Order.id.in_(select(recent.c.id))
+                )
+            )
+            .options(joinedload(Order.order_items).joinedload(OrderItem.food_item))
+            .order_by(desc(Order.created_at))
+        )
+        return db.session.execute(stmt).scalars().unique().all()
+
     def get_recent_orders(
         self,
         customer_id: int,
@@ -139,32 +217,59 @@ class OrderRepository(BaseRepository[Order]):
         self,
         customer_id: int,
         days: int = 30
-    ) -> List[Dict[str, any]]:
+    ) -> List[Dict[str, Any]]:
         """
         Get order history summary grouped by date.
         Returns list of {date, count, total} for last N days.
         """
-        cutoff_date = datetime.now() - timedelta(days=days)
+        results = db.session.execute(
+            select(Order.created_at, Order.total_amount)
+            .where(
+                Order.customer_id == customer_id,
+                Order.status == OrderStatus.COMPLETED,
+                *DateRange.last_days(days).filter(Order.created_at)
+            )
+            .order_by(Order.created_at)
+        ).all()
 
-        results = db.session.query(
-            func.date(Order.created_at).label('order_date'),
-            func.count(Order.id).label('order_count'),
-            func.sum(Order.total_amount).label('total_amount')
-        ).filter(
-            Order.customer_id == customer_id,
-            Order.created_at >= cutoff_date,
-            Order.status == OrderStatus.COMPLETED
-        ).group_by(
-            func.date(Order.created_at)
-        ).order_by(
-            func.date(Order.created_at)
+        # Bucket by reporting day in Python: grouping on DATE(created_at)
+        # would bucket by UTC day and can't use the index either
+        summary: Dict[date, Dict[str, Any]] = {}
+        for r in results:
+            day = DateRange.local_date(r.created_at)
+            bucket = summary.setdefault(day, {'date': str(day), 'count': 0, 'total': 0.0})
+            bucket['count'] += 1
+            bucket['total'] += float(r.total_amount)
+
+        return list(summary.values())
+
+    def find_baskets(
+        self,
+        after_order_id: int = 0,
+        limit: int = 1000
+    ) -> List[tuple[int, List[int]]]:
+        """
+        (order_id, food_item_ids) for up to `limit` non-cancelled orders
+        with id > after_order_id, in id order. Feed the last id back in
+        to read the next batch.
+        """
+        order_ids = (
+            select(Order.id)
+            .where(Order.id > after_order_id, Order.status != OrderStatus.CANCELLED)
+            .order_by(Order.id)
+            .limit(limit)
+            .subquery()
+        )
+        # Outer join keeps item-less orders, so the caller's position still advances
+        rows = db.session.execute(
+            select(order_ids.c.id, OrderItem.food_item_id)
+            .outerjoin(OrderItem, OrderItem.order_id == order_ids.c.id)
+            .order_by(order_ids.c.id)
         ).all()
 
-        return [
-            {
-                'date': str(r.order_date),
-                'count': r.order_count,
-                'total': float(r.total_amount)
-            }
-            for r in results
-        ]
\ No newline at end of file
+        baskets: Dict[int, List[int]] = {}
+        for order_id, food_item_id in rows:
+            basket = baskets.setdefault(order_id, [])
+            if food_item_id is not None:
+                basket.append(food_item_id)
+        return list(baskets.items())
@@ -1,9 +1,10 @@
 from typing import List, Optional
-from sqlalchemy import select, desc
+from sqlalchemy import select, desc, func
 from sqlalchemy.orm import joinedload
 
 from website.models import Review, FoodItem
 from .base_repository import BaseRepository
+from .keyset import Keyset, Page
 from database import db
 
 
@@ -23,6 +24,24 @@ class ReviewRepository(BaseRepository[Review]):
         )
         return db.session.execute(stmt).scalars().unique().all()
 
+    # Item reviews page newest first
+    NEWEST_FIRST = Keyset(Review.created_at, Review.id, descending=True)
+
+    def find_by_food_item(
+        self,
+        food_item_id: int,
+        page: int = 1,
+        per_page: int = 10,
+        cursor: str = None
+    ) -> Page:
+        """Get a page of an item's reviews with their authors, newest first"""
+        stmt = (
+            select(Review)
+            .where(Review.food_item_id == food_item_id)
+            .options(joinedload(Review.user))
+        )
+        return self.paginate(stmt, self.NEWEST_FIRST, page=page, per_page=per_page, cursor=cursor)
+
     def find_by_user_and_item(
         self,
         user_id: int,
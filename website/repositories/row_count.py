@@ -0,0 +1,112 @@
+import hashlib
+from typing import Optional
+
+from flask import current_app, has_app_context
+from sqlalchemy import Select, text
+from sqlalchemy.exc import SQLAlchemyError
+
+from website.modules import Cache
+from database import db
+
+
+class Total(int):
+    """A row count that remembers whether it is an estimate"""
+
+    def __new__(cls, value: int, estimated: bool = False):
+        total = super().__new__(cls, value)
+        total.estimated = estimated
+        return total
+
+
+class RowCount:
+    """
+    Total-count strategies for paginated listings:
+    - exact: run the COUNT on every call
+    - cached: exact COUNT, cached per filter for COUNT_CACHE_TTL seconds
+    - estimate: optimizer row estimates (MySQL only): TABLE_ROWS from
+      information_schema for unfiltered listings, EXPLAIN rows x filtered
+      for filtered ones. Falls back to an exact count elsewhere.
+
+    Counting statements are plain `SELECT count(...) FROM t WHERE ...`;
+    the cache key is derived from the rendered SQL, so every filter
+    combination gets its own entry.
+    """
+
+    EXACT = "exact"
+    CACHED = "cached"
+    ESTIMATE = "estimate"
+    STRATEGIES = (EXACT, CACHED, ESTIMATE)
+
+    # Cache Keys
+    CACHE_KEY = "count:{digest}"
+
+    @classmethod
+    def strategy(cls, config_key: str, requested: Optional[str] = None) -> str:
+        """Requested strategy, else the listing's configured one, else exact"""
+        if requested is None and has_app_context():
+            requested = current_app.config.get(config_key)
+
+        requested = str(requested or cls.EXACT).strip().lower()
+        return requested if requested in cls.STRATEGIES else cls.EXACT
+
+    @classmethod
+    def count(cls, stmt: Select, strategy: str = EXACT) -> Total:
+        """Total rows for a counting statement using `strategy`"""
+        if strategy == cls.ESTIMATE:
+            estimate = cls._estimate(stmt)
+            if estimate is not None:
+                return Total(estimate, estimated=True)
+
+        if strategy == cls.CACHED:
+            return Total(Cache.get_or_set(
+                cls.CACHE_KEY.format(digest=cls._digest(stmt)),
+                lambda: cls._exact(stmt),
+                Cache.timeout("COUNT_CACHE_TTL", 60)
+            ))
+
+        return Total(cls._exact(stmt))
+
+    # Helper Methods
+
+    @staticmethod
+    def _exact(stmt: Select) -> int:
+        return db.session.execute(stmt).scalar() or 0
+
+    @classmethod
+    def _estimate(cls, stmt: Select) -> Optional[int]:
+        connection = db.session.connection()
+        if connection.dialect.name != "mysql":
+            return None
+
+        try:
+            if stmt.whereclause is None:
+                table = stmt.get_final_froms()[0]
+                rows = connection.execute(
+                    text(
+                        "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table"
+                    ),
+                    {"table": table.name}
+                ).scalar()
+            else:
+                plan = connection.exec_driver_sql(
+                    f"EXPLAIN {cls._render(stmt, connection.dialect)}"
+                ).mappings().first()
+                rows = None
+                if plan is not None and plan.get("rows") is not None:
+                    rows = plan["rows"] * float(plan.get("filtered") or 100) / 100
+        except SQLAlchemyError:
+            # No estimate (e.g. no access to information_schema): count exactly
+            return None
+
+        return None if rows is None else int(round(rows))
+
+    @staticmethod
+    def _render(stmt: Select, dialect) -> str:
+        """SQL with parameters inlined (EXPLAIN and cache keys)"""
+        return str(stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+
+    @classmethod
+    def _digest(cls, stmt: Select) -> str:
+        sql = cls._render(stmt, db.session.get_bind().dialect)
+        return hashlib.sha1(sql.encode("utf-8")).hexdigest()
@@ -0,0 +1,131 @@
+from typing import List, Dict, Any, Optional
+from datetime import date, datetime
+from decimal import Decimal
+from sqlalchemy import select, func, desc, update, insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
+
+from website.models import DailySalesSummary, Order, OrderItem, OrderStatus
+from .base_repository import BaseRepository
+from database import db
+
+
+class SalesSummaryRepository(BaseRepository[DailySalesSummary]):
+    """Repository for the daily_sales_summary rollup table"""
+
+    def __init__(self):
+        super().__init__(DailySalesSummary)
+
+    # Reads
+
+    def find_by_date(self, day: date) -> Optional[DailySalesSummary]:
+        """Get summary row for one day"""
+        stmt = select(DailySalesSummary).where(DailySalesSummary.date == day)
+        return db.session.execute(stmt).scalar_one_or_none()
+
+    def find_range(self, start_date: date, end_date: date) -> List[DailySalesSummary]:
+        """Get summary rows for an inclusive date range, oldest first"""
+        stmt = (
+            select(DailySalesSummary)
+            .where(DailySalesSummary.date.between(start_date, end_date))
+            .order_by(DailySalesSummary.date)
+        )
+        return db.session.execute(stmt).scalars().all()
+
+    def aggregate_range(
+        self,
+        start_date: date = None,
+        end_date: date = None
+    ) -> Dict[str, Any]:
+        """Sum summary rows over an inclusive date range"""
+        query = db.session.query(
+            func.sum(DailySalesSummary.order_count).label('total_orders'),
+            func.sum(DailySalesSummary.total_revenue).label('total_revenue'),
+            func.sum(DailySalesSummary.total_discounts).label('total_discounts')
+        )
+
+        if start_date:
+            query = query.filter(DailySalesSummary.date >= start_date)
+        if end_date:
+            query = query.filter(DailySalesSummary.date <= end_date)
+
+        result = query.first()
+
+        return {
+            'total_orders': int(result.total_orders or 0),
+            'total_revenue': Decimal(result.total_revenue or 0),
+            'total_discounts': Decimal(result.total_discounts or 0)
+        }
+
+    # Rollup (Core, on an explicit connection)
+
+    def compute_day(
+        self,
+        connection: Connection,
+        start: datetime,
+        end: datetime
+    ) -> Dict[str, Any]:
+        """
+        Aggregate completed orders with completed_at in [start, end).
+        Range predicate so idx_order_completed_at is usable.
+        """
+        in_window = (
+            Order.status == OrderStatus.COMPLETED,
+            Order.completed_at >= start,
+            Order.completed_at < end
+        )
+
+        totals = connection.execute(
+            select(
+                func.count(Order.id).label('order_count'),
+                func.sum(Order.total_amount).label('total_revenue'),
+                func.sum(Order.discount_amount).label('total_discounts')
+            ).where(*in_window)
+        ).one()
+
+        top_item_id = connection.execute(
+            select(OrderItem.food_item_id)
+            .join(Order, Order.id == OrderItem.order_id)
+            .where(*in_window)
+            .group_by(OrderItem.food_item_id)
+            .order_by(desc(func.sum(OrderItem.quantity)))
+            .limit(1)
+        ).scalar()
+
+        order_count = int(totals.order_count or 0)
+        total_revenue = Decimal(totals.total_revenue or 0)
+
+        return {
+            'order_count': order_count,
+            'total_revenue': total_revenue,
+            'total_discounts': Decimal(totals.total_discounts or 0),
+            'average_order_value': (
+                (total_revenue / order_count).quantize(Decimal('0.01'))
+                if order_count else Decimal('0.00')
+            ),
+            'top_selling_item_id': top_item_id
+        }
+
+    def save_day(
+        self,
+        connection: Connection,
+        day: date,
+        values: Dict[str, Any]
+    ) -> None:
+        """Upsert the summary row for a day"""
+        table = DailySalesSummary.__table__
+
+        result = connection.execute(
+            update(table).where(table.c.date == day).values(**values)
+        )
+        if result.rowcount:
+            return
+
+        try:
+            with connection.begin_nested():
+                connection.execute(insert(table).values(date=day, **values))
+        except IntegrityError:
+            # Another worker inserted the row first
+            connection.execute(
+                update(table).where(table.c.date == day).values(**values)
+            )
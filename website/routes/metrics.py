@@ -0,0 +1,30 @@
+import hmac
+
+from flask import Blueprint, Response, abort, current_app, request
+
+from website.modules import Metrics
+
+from utils import errhandler
+
+# Blueprint Object (registered beside `routes`, outside its url_prefix)
+metrics = Blueprint("metrics", __name__)
+
+# Prometheus Scrape Route
+@metrics.route("/metrics")
+def metrics_view():
+    token = current_app.config.get("METRICS_TOKEN")
+    if token:
+        supplied = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+        if not hmac.compare_digest(supplied, token):
+            abort(401)
+    elif not current_app.debug:
+        # No unauthenticated scrapes outside development
+        abort(404)
+
+    try:
+        body = Metrics.render()
+    except Exception as e:
+        errhandler(e, log="metrics", path="routes")
+        abort(500)
+
+    return Response(body, mimetype="text/plain; version=0.0.4")
@@ -1,9 +1,10 @@
 from . import routes
-from flask import render_template, redirect, url_for, flash, request
+from flask import render_template, redirect, url_for, flash, request, jsonify
 
 from flask_login import current_user
 
 from website.services import MenuService
+from website.modules import MenuSearch
 from website.helpers import serializer
 
 from utils import errhandler
@@ -39,6 +40,12 @@ def menu():
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 20, type=int)
 
+    # Facet filters
+    price_bands = request.args.getlist('price')
+    allergen_free = request.args.get('allergen_free', 0, type=int) == 1
+    min_rating = request.args.get('rating', type=int)
+    include_sold_out = request.args.get('sold_out', 0, type=int) == 1
+
     # Get user ID if logged in
     user_id = user.id if user else None
 
@@ -48,7 +55,11 @@ def menu():
         search=search if search else None,
         page=page if page else None,
         per_page=per_page if per_page else None,
-        user_id=user_id
+        user_id=user_id,
+        price_bands=price_bands,
+        allergen_free=allergen_free,
+        min_rating=min_rating,
+        include_sold_out=include_sold_out
     )
 
     return render_template(
@@ -59,6 +70,29 @@ def menu():
         serializer=serial
     )
 
+# Menu Suggestions (typeahead)
+@routes.route("/menu/suggest")
+def menu_suggest():
+
+    query = request.args.get('q', '', type=str).strip()
+    limit = min(max(request.args.get('limit', 8, type=int), 1), 20)
+
+    if not query:
+        return jsonify({'query': query, 'suggestions': []})
+
+    suggestions = []
+    try:
+        for suggestion in MenuSearch.suggest(query, limit):
+            if suggestion['type'] == "item":
+                url = url_for('routes.food', item_id=suggestion['id'])
+            else:
+                url = url_for('routes.menu', category=suggestion['id'])
+            suggestions.append({**suggestion, 'url': url})
+    except Exception as e:
+        errhandler(e, log="menu_suggest", path="routes")
+
+    return jsonify({'query': query, 'suggestions': suggestions})
+
 # Food Details
 @routes.route("/menu/<int:item_id>")
 def food(item_id):
@@ -94,6 +128,21 @@ def food(item_id):
         food=item_data
     )
 
+# Food Reviews (next page)
+@routes.route("/menu/<int:item_id>/reviews")
+def food_reviews(item_id):
+
+    cursor = request.args.get('cursor', type=str)
+    per_page = min(max(request.args.get('per_page', 10, type=int), 1), 50)
+
+    service = MenuService()
+
+    return jsonify(service.get_item_reviews(
+        food_item_id=item_id,
+        cursor=cursor,
+        per_page=per_page
+    ))
+
 # Services Route
 @routes.route("/services")
 def services():
@@ -118,4 +167,17 @@ def checkout():
         "checkout/checkout.html",
         title="Checkout",
         user=user
-    )
\ No newline at end of file
+    )
+
+# Checkout Suggestions (upsell for the cart)
+@routes.route("/checkout/suggestions")
+def checkout_suggestions():
+
+    cart_item_ids = request.args.getlist('items', type=int)
+    limit = min(max(request.args.get('limit', 3, type=int), 1), 12)
+
+    service = MenuService()
+
+    return jsonify({
+        'suggestions': service.get_upsell_items(cart_item_ids, limit=limit)
+    })
\ No newline at end of file
@@ -3,11 +3,13 @@ from .dashboard_service import DashboardService
 from .menu_service import MenuService
 from .points_service import PointsService
 from .admin_service import AdminService
+from .sales_rollup_service import SalesRollupService
 
 __all__ = [
     "AuthService",
     "DashboardService",
     "MenuService",
     "PointsService",
-    "AdminService"
+    "AdminService",
+    "SalesRollupService"
 ]
\ No newline at end of file
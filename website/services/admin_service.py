@@ -1,6 +1,7 @@
 from typing import Dict, List, Optional, Any
 from datetime import datetime, date, timedelta
 from decimal import Decimal
+from sqlalchemy import desc
 
 from website.models import (
     User, FoodItem, Category, Order, Ingredient,
@@ -12,9 +13,12 @@ from website.repositories import (
     FoodItemRepository,
     CategoryRepository,
     OrderRepository,
-    PointsRepository
+    PointsRepository,
+    DateRange,
+    RowCount
 )
 from website.validators import ValidationResult
+from website.modules import Cache, CatalogCache, MenuSearch
 from utils import errhandler
 from database import db
 
@@ -41,38 +45,34 @@ class AdminService:
         self.order_repo = order_repo or OrderRepository()
         self.points_repo = points_repo or PointsRepository()
 
+    # Cache Keys
+    DASHBOARD_CACHE_KEY = "admin:dashboard"
+
     # Dashboard
 
     def get_admin_dashboard(self) -> Dict[str, Any]:
         """
         Get complete admin dashboard data.
-        Overview of system performance.
+        Overview of system performance, cached for ADMIN_DASHBOARD_CACHE_TTL.
+        System stats are read separately so they stay within
+        SYSTEM_STATS_MAX_STALENESS rather than aging with the dashboard.
         """
         try:
-            # System stats
-            system_stats = self.admin_repo.get_system_stats()
-
-            # Revenue stats (last 30 days)
-            thirty_days_ago = date.today() - timedelta(days=30)
-            revenue_stats = self.admin_repo.get_revenue_stats(
-                start_date=thirty_days_ago
+            dashboard = Cache.get_or_set(
+                self.DASHBOARD_CACHE_KEY,
+                self._build_admin_dashboard,
+                Cache.timeout("ADMIN_DASHBOARD_CACHE_TTL", 60)
             )
 
-            # Top customers
-            top_customers = self.admin_repo.get_top_customers(limit=5)
-
-            # Popular items
-            popular_items = self.admin_repo.get_popular_items(limit=5)
-
-            # Recent orders
-            recent_orders = self.get_recent_orders(limit=10)
+            # System stats (shared snapshot, bounded staleness)
+            system_stats = self.admin_repo.get_system_stats(
+                max_staleness=Cache.timeout("SYSTEM_STATS_MAX_STALENESS", 30)
+            )
 
             return {
+                **dashboard,
                 'system_stats': system_stats,
-                'revenue_stats': revenue_stats,
-                'top_customers': top_customers,
-                'popular_items': popular_items,
-                'recent_orders': recent_orders
+                'cache_stats': CatalogCache.stats()
             }
         except Exception as e:
             errhandler(e, log="admin_service", path="services")
@@ -81,9 +81,34 @@ class AdminService:
                 'revenue_stats': {},
                 'top_customers': [],
                 'popular_items': [],
-                'recent_orders': []
+                'recent_orders': [],
+                'cache_stats': {}
             }
 
+    def _build_admin_dashboard(self) -> Dict[str, Any]:
+        """Query the cached admin dashboard sections (system stats excluded)"""
+        # Revenue stats (last 30 days)
+        thirty_days_ago = DateRange.today() - timedelta(days=30)
+        revenue_stats = self.admin_repo.get_revenue_stats(
+            start_date=thirty_days_ago
+        )
+
+        # Top customers
+        top_customers = self.admin_repo.get_top_customers(limit=5)
+
+        # Popular items
+        popular_items = self.admin_repo.get_popular_items(limit=5)
+
+        # Recent orders
+        recent_orders = self.get_recent_orders(limit=10)
+
+        return {
+            'revenue_stats': revenue_stats,
+            'top_customers': top_customers,
+            'popular_items': popular_items,
+            'recent_orders': recent_orders
+        }
+
     def get_analytics_data(
         self,
         start_date: date = None,
@@ -95,7 +120,7 @@ class AdminService:
         try:
             # Default to last 30 days if not specified
             if not end_date:
-                end_date = date.today()
+                end_date = DateRange.today()
             if not start_date:
                 start_date = end_date - timedelta(days=30)
 
@@ -135,12 +160,21 @@ class AdminService:
         self,
         page: int = 1,
         per_page: int = 20,
-        role: UserRole = None
+        role: UserRole = None,
+        cursor: str = None,
+        count_strategy: str = None
     ) -> Dict[str, Any]:
-        """Get paginated list of users"""
+        """
+        Get paginated list of users.
+        Pass the previous result's `next_cursor` to page without OFFSET.
+        `count_strategy` overrides ADMIN_USERS_COUNT (see RowCount).
+        """
         try:
-            users = self.admin_repo.find_all_users(page, per_page, role)
-            total = self.admin_repo.count_users(role)
+            users = self.admin_repo.find_all_users(page, per_page, role, cursor=cursor)
+            total = self.admin_repo.count_users(
+                role,
+                strategy=RowCount.strategy("ADMIN_USERS_COUNT", count_strategy)
+            )
 
             formatted_users = [
                 {
@@ -162,7 +196,9 @@ class AdminService:
                 'total': total,
                 'page': page,
                 'per_page': per_page,
-                'total_pages': (total + per_page - 1) // per_page
+                'total_pages': (total + per_page - 1) // per_page,
+                'total_estimated': total.estimated,
+                'next_cursor': users.next_cursor
             }
         except Exception as e:
             errhandler(e, log="admin_service", path="services")
@@ -171,7 +207,9 @@ class AdminService:
                 'total': 0,
                 'page': page,
                 'per_page': per_page,
-                'total_pages': 0
+                'total_pages': 0,
+                'total_estimated': False,
+                'next_cursor': None
             }
 
     def get_user_details(self, user_id: int) -> Optional[Dict[str, Any]]:
@@ -328,21 +366,34 @@ class AdminService:
         self,
         page: int = 1,
         per_page: int = 20,
-        category_id: int = None
+        category_id: int = None,
+        cursor: str = None,
+        count_strategy: str = None
     ) -> Dict[str, Any]:
-        """Get all food items with pagination"""
+        """
+        Get all food items with pagination.
+        Pass the previous result's `next_cursor` to page without OFFSET.
+        `count_strategy` overrides ADMIN_FOOD_ITEMS_COUNT (see RowCount).
+        """
         try:
+            strategy = RowCount.strategy("ADMIN_FOOD_ITEMS_COUNT", count_strategy)
+
             if category_id:
                 items = self.food_item_repo.find_by_category(
                     category_id=category_id,
                     available_only=False,
                     page=page,
-                    per_page=per_page
+                    per_page=per_page,
+                    cursor=cursor
+                )
+                total = self.food_item_repo.count_by_category(
+                    category_id,
+                    available_only=False,
+                    strategy=strategy
                 )
-                total = self.food_item_repo.count_by_category(category_id, available_only=False)
             else:
-                items = self.food_item_repo.find_all_available(page, per_page)
-                total = self.food_item_repo.count_available()
+                items = self.food_item_repo.find_all_available(page, per_page, cursor=cursor)
+                total = self.food_item_repo.count_available(strategy=strategy)
 
             formatted_items = [
                 {
@@ -364,7 +415,9 @@ class AdminService:
                 'total': total,
                 'page': page,
                 'per_page': per_page,
-                'total_pages': (total + per_page - 1) // per_page
+                'total_pages': (total + per_page - 1) // per_page,
+                'total_estimated': total.estimated,
+                'next_cursor': items.next_cursor
             }
         except Exception as e:
             errhandler(e, log="admin_service", path="services")
@@ -373,7 +426,9 @@ class AdminService:
                 'total': 0,
                 'page': page,
                 'per_page': per_page,
-                'total_pages': 0
+                'total_pages': 0,
+                'total_estimated': False,
+                'next_cursor': None
             }
 
     def create_food_item(
@@ -415,6 +470,7 @@ class AdminService:
                     food_item.ingredients.append(ingredient)
 
             created_item = self.food_item_repo.create(food_item)
+            MenuSearch.refresh_items([created_item.id], *CatalogCache.invalidate())
 
             return ValidationResult.ok(
                 message="Food item created successfully",
@@ -461,6 +517,7 @@ class AdminService:
                 item.is_available = is_available
 
             updated_item = self.food_item_repo.update(item)
+            MenuSearch.refresh_items([item_id], *CatalogCache.invalidate())
 
             return ValidationResult.ok(
                 message="Food item updated successfully",
@@ -484,6 +541,7 @@ class AdminService:
                 return ValidationResult.fail("Item not found", code="item_not_found")
 
             self.food_item_repo.delete(item)
+            MenuSearch.refresh_items([item_id], *CatalogCache.invalidate())
 
             return ValidationResult.ok(
                 message="Food item deleted successfully",
@@ -534,6 +592,7 @@ class AdminService:
             )
 
             created_category = self.category_repo.create(category)
+            CatalogCache.invalidate()
 
             return ValidationResult.ok(
                 message="Category created successfully",
@@ -573,6 +632,7 @@ class AdminService:
                 category.is_active = is_active
 
             updated_category = self.category_repo.update(category)
+            CatalogCache.invalidate()
 
             return ValidationResult.ok(
                 message="Category updated successfully",
@@ -593,25 +653,20 @@ class AdminService:
         self,
         page: int = 1,
         per_page: int = 20,
-        status: OrderStatus = None
+        status: OrderStatus = None,
+        cursor: str = None,
+        count_strategy: str = None
     ) -> Dict[str, Any]:
-        """Get all orders with optional status filter"""
+        """
+        Get all orders with optional status filter.
+        Pass the previous result's `next_cursor` to page without OFFSET.
+        `count_strategy` overrides ADMIN_ORDERS_COUNT (see RowCount).
+        """
         try:
-            # This would need a method in OrderRepository
-            # For now, using a simple query
-            query = db.session.query(Order)
-
-            if status:
-                query = query.filter(Order.status == status)
-
-            total = query.count()
-
-            orders = (
-                query
-                .order_by(desc(Order.created_at))
-                .limit(per_page)
-                .offset((page - 1) * per_page)
-                .all()
+            orders = self.order_repo.find_all(status, page, per_page, cursor=cursor)
+            total = self.order_repo.count_all(
+                status,
+                strategy=RowCount.strategy("ADMIN_ORDERS_COUNT", count_strategy)
             )
 
             formatted_orders = [
@@ -623,7 +678,9 @@ class AdminService:
                 'total': total,
                 'page': page,
                 'per_page': per_page,
-                'total_pages': (total + per_page - 1) // per_page
+                'total_pages': (total + per_page - 1) // per_page,
+                'total_estimated': total.estimated,
+                'next_cursor': orders.next_cursor
             }
         except Exception as e:
             errhandler(e, log="admin_service", path="services")
@@ -632,7 +689,9 @@ class AdminService:
                 'total': 0,
                 'page': page,
                 'per_page': per_page,
-                'total_pages': 0
+                'total_pages': 0,
+                'total_estimated': False,
+                'next_cursor': None
             }
 
     def get_recent_orders(self, limit: int = 10) -> List[Dict[str, Any]]:
@@ -679,6 +738,7 @@ class AdminService:
                     )
 
             db.session.commit()
+            Cache.delete(self.DASHBOARD_CACHE_KEY)
 
             return ValidationResult.ok(
                 message=f"Order status updated from {old_status.value} to {new_status.value}",
@@ -1,7 +1,8 @@
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterable
 from datetime import datetime
+from functools import cached_property
 
-from website.models import User, Order, Favorite, Review
+from website.models import User, Order, OrderStatus, Favorite, Review
 from website.repositories import (
     UserRepository,
     OrderRepository,
@@ -10,6 +11,7 @@ from website.repositories import (
     PointsRepository
 )
 from website.validators import ValidationResult
+from website.modules import Cache, CatalogCache
 from utils import errhandler
 from database import db
 
@@ -34,6 +36,56 @@ class DashboardService:
         self.review_repo = review_repo or ReviewRepository()
         self.points_repo = points_repo or PointsRepository()
 
+    # Cache Keys
+    DASHBOARD_CACHE_KEY = "dashboard:{user_id}:{section}"
+
+    # Dashboard sections, each cached on its own. Metrics come last so a
+    # cold build can count the favorites/reviews it has just loaded.
+    DASHBOARD_SECTIONS = ('user', 'points', 'orders', 'favorites', 'reviews', 'metrics')
+
+    # Sections embedding food item details; their keys carry the catalog
+    # version so menu edits (names, prices) show without waiting for the TTL
+    CATALOG_SECTIONS = ('orders', 'favorites', 'reviews')
+
+    # Sections a committed change to each table makes stale (models/events.py)
+    SECTION_DEPENDENCIES = {
+        'users': ('user', 'points'),
+        'orders': ('orders', 'metrics'),
+        'favorites': ('favorites', 'metrics'),
+        'reviews': ('reviews', 'metrics'),
+        'points_transactions': ('points',),
+    }
+
+    # Orders shown under "active" on the dashboard
+    ACTIVE_STATUSES = (OrderStatus.PENDING, OrderStatus.PREPARING)
+
+    @classmethod
+    def invalidate_dashboard(cls, user_id: int, sections: Iterable[str] = None) -> None:
+        """Drop a user's cached dashboard sections (all by default)"""
+        sections = sections or cls.DASHBOARD_SECTIONS
+        catalog_version = CatalogCache.version() if set(sections) & set(cls.CATALOG_SECTIONS) else None
+        for section in sections:
+            Cache.delete(cls._cache_key(user_id, section, catalog_version))
+
+    @classmethod
+    def _cache_key(cls, user_id: int, section: str, catalog_version: Optional[int]) -> str:
+        key = cls.DASHBOARD_CACHE_KEY.format(user_id=user_id, section=section)
+        if section in cls.CATALOG_SECTIONS:
+            # Keys of older catalog versions are never read again and expire
+            key = f"{key}:{catalog_version}"
+        return key
+
+    @classmethod
+    def invalidate_for_tables(cls, user_id: int, tables: Iterable[str]) -> None:
+        """Drop the sections that depend on the given (changed) tables"""
+        sections = {
+            section
+            for table in tables
+            for section in cls.SECTION_DEPENDENCIES.get(table, ())
+        }
+        if sections:
+            cls.invalidate_dashboard(user_id, sections)
+
     # User Details
     def get_user_details(self, user_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -46,22 +98,26 @@ class DashboardService:
             if not user:
                 return None
 
-            return {
-                'id': user.id,
-                'first_name': user.first_name,
-                'last_name': user.last_name,
-                'full_name': f"{user.first_name} {user.last_name}",
-                'email': user.email,
-                'phone': user.phone,
-                'is_verified': user.is_verified,
-                'is_active': getattr(user, 'is_active', True),
-                'created_at': user.created_at.isoformat() if user.created_at else None,
-                'last_login_at': user.last_login_at.isoformat() if user.last_login_at else None
-            }
+            return self._format_user(user)
         except Exception as e:
             errhandler(e, log="dashboard_service", path="services")
             return None
 
+    def _format_user(self, user: User) -> Dict[str, Any]:
+        """Format user object for display"""
+        return {
+            'id': user.id,
+            'first_name': user.first_name,
+            'last_name': user.last_name,
+            'full_name': f"{user.first_name} {user.last_name}",
+            'email': user.email,
+            'phone': user.phone,
+            'is_verified': user.is_verified,
+            'is_active': getattr(user, 'is_active', True),
+            'created_at': user.created_at.isoformat() if user.created_at else None,
+            'last_login_at': user.last_login_at.isoformat() if user.last_login_at else None
+        }
+
     def update_user_profile(
         self,
         user_id: int,
@@ -89,6 +145,8 @@ class DashboardService:
                 phone=phone
             )
 
+            self.invalidate_dashboard(user_id)
+
             return ValidationResult.ok(
                 message="Profile updated successfully",
                 code="profile_updated",
@@ -118,36 +176,39 @@ class DashboardService:
             # TODO: Assuming user has a customer relationship or customer_id. To be adjusted based on the actual model structure
             customer_id = getattr(user, 'customer_id', None) or user.id
 
-            # Get order metrics
-            order_metrics = self.order_repo.get_customer_metrics(customer_id)
+            # Order counts and totals per status (one GROUP BY)
+            status_summary = self.order_repo.get_status_summary(customer_id)
 
-            # Get favorites count
-            favorites_count = self.favorite_repo.count_by_user(user_id)
-
-            # Get reviews count
-            reviews_count = self.review_repo.count_by_user(user_id)
-
-            # Get active orders count
-            active_orders = len(self.order_repo.get_orders_by_status(
-                customer_id,
-                OrderStatus.PENDING
-            )) + len(self.order_repo.get_orders_by_status(
-                customer_id,
-                OrderStatus.PREPARING
-            ))
-
-            return {
-                'total_orders': order_metrics['total_orders'],
-                'total_spent': order_metrics['total_spent'],
-                'average_order_value': order_metrics['avg_order_value'],
-                'favorites_count': favorites_count,
-                'reviews_count': reviews_count,
-                'active_orders_count': active_orders
-            }
+            return self._build_metrics(
+                status_summary,
+                favorites_count=self.favorite_repo.count_by_user(user_id),
+                reviews_count=self.review_repo.count_by_user(user_id)
+            )
         except Exception as e:
             errhandler(e, log="dashboard_service", path="services")
             return self._empty_metrics()
 
+    def _build_metrics(
+        self,
+        status_summary: Dict[OrderStatus, Dict[str, Any]],
+        favorites_count: int,
+        reviews_count: int
+    ) -> Dict[str, Any]:
+        """Dashboard metrics from OrderRepository.get_status_summary()"""
+        completed = status_summary.get(OrderStatus.COMPLETED, {'count': 0, 'total': 0.0})
+
+        return {
+            'total_orders': completed['count'],
+            'total_spent': completed['total'],
+            'average_order_value': completed['total'] / completed['count'] if completed['count'] else 0.0,
+            'favorites_count': favorites_count,
+            'reviews_count': reviews_count,
+            'active_orders_count': sum(
+                status_summary.get(status, {'count': 0})['count']
+                for status in self.ACTIVE_STATUSES
+            )
+        }
+
     def _empty_metrics(self) -> Dict[str, Any]:
         """Return empty metrics structure"""
         return {
@@ -164,10 +225,12 @@ class DashboardService:
         self,
         user_id: int,
         page: int = 1,
-        per_page: int = 10
+        per_page: int = 10,
+        cursor: str = None
     ) -> Dict[str, Any]:
         """
         Get paginated order history for user.
+        Pass the previous result's `next_cursor` to page without OFFSET.
         """
         try:
             user = self.user_repo.get_by_id(user_id)
@@ -177,7 +240,7 @@ class DashboardService:
             customer_id = getattr(user, 'customer_id', None) or user.id
 
             # Get orders
-            orders = self.order_repo.find_by_customer(customer_id, page, per_page)
+            orders = self.order_repo.find_by_customer(customer_id, page, per_page, cursor=cursor)
 
             # Get total count
             total = self.order_repo.count_by_customer(customer_id)
@@ -192,7 +255,8 @@ class DashboardService:
                 'total': total,
                 'page': page,
                 'per_page': per_page,
-                'total_pages': (total + per_page - 1) // per_page
+                'total_pages': (total + per_page - 1) // per_page,
+                'next_cursor': orders.next_cursor
             }
         except Exception as e:
             errhandler(e, log="dashboard_service", path="services")
@@ -222,15 +286,25 @@ class DashboardService:
 
             customer_id = getattr(user, 'customer_id', None) or user.id
 
-            pending = self.order_repo.get_orders_by_status(customer_id, OrderStatus.PENDING)
-            preparing = self.order_repo.get_orders_by_status(customer_id, OrderStatus.PREPARING)
-
-            all_active = pending + preparing
-            return [self._format_order(order) for order in all_active]
+            orders = self.order_repo.get_recent_and_active_orders(
+                customer_id,
+                self.ACTIVE_STATUSES,
+                limit=0
+            )
+            return [self._format_order(order) for order in self._active_orders(orders)]
         except Exception as e:
             errhandler(e, log="dashboard_service", path="services")
             return []
 
+    def _active_orders(self, orders: List[Order]) -> List[Order]:
+        """Active orders grouped by status (pending first), newest first"""
+        return [
+            order
+            for status in self.ACTIVE_STATUSES
+            for order in orders
+            if order.status == status
+        ]
+
     def _format_order(self, order: Order) -> Dict[str, Any]:
         """Format order object for display"""
         return {
@@ -259,22 +333,23 @@ class DashboardService:
         try:
             favorites = self.favorite_repo.find_by_user(user_id)
 
-            return [
-                {
-                    'id': fav.food_item_id,
-                    'name': fav.food_item.name,
-                    'description': fav.food_item.description,
-                    'price': float(fav.food_item.price),
-                    'image_url': fav.food_item.image_url,
-                    'is_available': fav.food_item.is_available,
-                    'favorited_at': fav.created_at.isoformat()
-                }
-                for fav in favorites
-            ]
+            return [self._format_favorite(fav) for fav in favorites]
         except Exception as e:
             errhandler(e, log="dashboard_service", path="services")
             return []
 
+    def _format_favorite(self, fav: Favorite) -> Dict[str, Any]:
+        """Format favorite object for display"""
+        return {
+            'id': fav.food_item_id,
+            'name': fav.food_item.name,
+            'description': fav.food_item.description,
+            'price': float(fav.food_item.price),
+            'image_url': fav.food_item.image_url,
+            'is_available': fav.food_item.is_available,
+            'favorited_at': fav.created_at.isoformat()
+        }
+
     def toggle_favorite(
         self,
         user_id: int,
@@ -317,22 +392,23 @@ class DashboardService:
         try:
             reviews = self.review_repo.find_by_user(user_id)
 
-            return [
-                {
-                    'id': review.id,
-                    'food_item_id': review.food_item_id,
-                    'food_item_name': review.food_item.name,
-                    'rating': review.rating,
-                    'comment': review.comment,
-                    'created_at': review.created_at.isoformat(),
-                    'updated_at': review.updated_at.isoformat() if hasattr(review, 'updated_at') else None
-                }
-                for review in reviews
-            ]
+            return [self._format_review(review) for review in reviews]
         except Exception as e:
             errhandler(e, log="dashboard_service", path="services")
             return []
 
+    def _format_review(self, review: Review) -> Dict[str, Any]:
+        """Format review object for display"""
+        return {
+            'id': review.id,
+            'food_item_id': review.food_item_id,
+            'food_item_name': review.food_item.name,
+            'rating': review.rating,
+            'comment': review.comment,
+            'created_at': review.created_at.isoformat(),
+            'updated_at': review.updated_at.isoformat() if hasattr(review, 'updated_at') else None
+        }
+
     # Points Logic
     def get_user_points(self, user_id: int) -> Dict[str, Any]:
         """Get user's points information"""
@@ -352,26 +428,130 @@ class DashboardService:
     def get_dashboard_data(self, user_id: int) -> Dict[str, Any]:
         """
         Get complete dashboard data in one call.
-        Optimized to reduce multiple round trips.
+        Each section is cached per user for DASHBOARD_CACHE_TTL and dropped
+        when a commit touches that user's account, orders, favorites,
+        reviews or points transactions. Sections showing food items also
+        move on with every catalog edit.
         """
         try:
-            return {
-                'user': self.get_user_details(user_id),
-                'metrics': self.get_user_metrics(user_id),
-                'points': self.get_user_points(user_id),
-                'recent_orders': self.get_recent_orders(user_id, limit=5),
-                'active_orders': self.get_active_orders(user_id),
-                'favorites': self.get_user_favorites(user_id),
-                'reviews': self.get_user_reviews(user_id)
-            }
+            return self._build_dashboard_data(user_id)
         except Exception as e:
             errhandler(e, log="dashboard_service", path="services")
-            return {
-                'user': None,
-                'metrics': self._empty_metrics(),
-                'points': {'points_balance': 0, 'lifetime_points': 0, 'cash_value': 0.0},
-                'recent_orders': [],
-                'active_orders': [],
-                'favorites': [],
-                'reviews': []
-            }
\ No newline at end of file
+            return self._empty_dashboard()
+
+    def _empty_dashboard(self) -> Dict[str, Any]:
+        """Return empty dashboard structure"""
+        return {
+            'user': None,
+            'metrics': self._empty_metrics(),
+            'points': {'points_balance': 0, 'lifetime_points': 0, 'cash_value': 0.0},
+            'recent_orders': [],
+            'active_orders': [],
+            'favorites': [],
+            'reviews': []
+        }
+
+    def _build_dashboard_data(self, user_id: int, recent_limit: int = 5) -> Dict[str, Any]:
+        """
+        Assemble every dashboard section for a user, rebuilding only the
+        sections missing from the cache. A cold build costs a fixed set of
+        queries: the user, order counts per status, recent + active orders
+        (with items), favorites and reviews.
+        """
+        from website.services import PointsService
+
+        rows = _DashboardRows(self, user_id, recent_limit)
+
+        builders = {
+            'user': lambda: self._format_user(rows.user) if rows.user else None,
+            'points': lambda: (
+                PointsService(user_repo=self.user_repo).summarize_points(rows.user)
+                if rows.user else None
+            ),
+            'orders': lambda: {
+                'recent': [self._format_order(order) for order in rows.orders[:recent_limit]],
+                'active': [self._format_order(order) for order in self._active_orders(rows.orders)]
+            } if rows.user else None,
+            'favorites': lambda: [self._format_favorite(fav) for fav in rows.favorites],
+            'reviews': lambda: [self._format_review(review) for review in rows.reviews],
+            'metrics': lambda: self._build_metrics(
+                rows.status_summary,
+                favorites_count=rows.favorites_count,
+                reviews_count=rows.reviews_count
+            ) if rows.user else None,
+        }
+
+        timeout = Cache.timeout("DASHBOARD_CACHE_TTL", 300)
+        catalog_version = CatalogCache.version()
+        sections = {}
+        for section in self.DASHBOARD_SECTIONS:
+            sections[section] = Cache.get_or_set(
+                self._cache_key(user_id, section, catalog_version),
+                builders[section],
+                timeout
+            )
+            # Only the user-dependent sections can come back empty
+            if sections[section] is None:
+                return self._empty_dashboard()
+
+        return {
+            'user': sections['user'],
+            'metrics': sections['metrics'],
+            'points': sections['points'],
+            'recent_orders': sections['orders']['recent'],
+            'active_orders': sections['orders']['active'],
+            'favorites': sections['favorites'],
+            'reviews': sections['reviews']
+        }
+
+
+class _DashboardRows:
+    """
+    Rows behind the dashboard sections, loaded on first use so that
+    cached sections cost nothing and a cold build loads each row set once.
+    """
+
+    def __init__(self, service: DashboardService, user_id: int, recent_limit: int):
+        self.service = service
+        self.user_id = user_id
+        self.recent_limit = recent_limit
+
+    @cached_property
+    def user(self) -> Optional[User]:
+        return self.service.user_repo.get_by_id(self.user_id)
+
+    @cached_property
+    def customer_id(self) -> int:
+        return getattr(self.user, 'customer_id', None) or self.user.id
+
+    @cached_property
+    def status_summary(self) -> Dict[OrderStatus, Dict[str, Any]]:
+        return self.service.order_repo.get_status_summary(self.customer_id)
+
+    @cached_property
+    def orders(self) -> List[Order]:
+        return self.service.order_repo.get_recent_and_active_orders(
+            self.customer_id,
+            self.service.ACTIVE_STATUSES,
+            limit=self.recent_limit
+        )
+
+    @cached_property
+    def favorites(self) -> List[Favorite]:
+        return self.service.favorite_repo.find_by_user(self.user_id)
+
+    @cached_property
+    def reviews(self) -> List[Review]:
+        return self.service.review_repo.find_by_user(self.user_id)
+
+    @property
+    def favorites_count(self) -> int:
+        if 'favorites' in self.__dict__:
+            return len(self.favorites)
+        return self.service.favorite_repo.count_by_user(self.user_id)
+
+    @property
+    def reviews_count(self) -> int:
+        if 'reviews' in self.__dict__:
+            return len(self.reviews)
+        return self.service.review_repo.count_by_user(self.user_id)
@@ -1,11 +1,12 @@
 from typing import List, Dict, Any, Optional
-from website.models import FoodItem, Category
+from website.models import FoodItem, Category, Review
 from website.repositories import (
     FoodItemRepository,
     CategoryRepository,
     FavoriteRepository,
     ReviewRepository
 )
+from website.modules import Cache, CatalogCache, MenuSearch, FacetIndex, Recommender
 from utils import errhandler
 
 
@@ -26,6 +27,9 @@ class MenuService:
         self.favorite_repo = favorite_repo or FavoriteRepository()
         self.review_repo = review_repo or ReviewRepository()
 
+    # Cache Keys
+    FEATURED_CACHE_KEY = "menu:featured:{version}"
+
     # Menu Listing
 
     def get_menu_data(
@@ -34,39 +38,24 @@ class MenuService:
         search: str = None,
         page: int = 1,
         per_page: int = 20,
-        user_id: int = None
+        user_id: int = None,
+        price_bands: List[str] = None,
+        allergen_free: bool = False,
+        min_rating: int = None,
+        include_sold_out: bool = False
     ) -> Dict[str, Any]:
         """
         Get complete menu data with categories and items.
         Main method for menu page.
+
+        Filters run on the snapshot's facet bitsets, so no filter
+        combination queries the database; 'facets' carries the
+        per-option counts for the filter form.
         """
         try:
-            # Get all active categories
-            categories = self.category_repo.find_all_active()
-
-            # Get food items based on filters
-            if search:
-                items = self.food_item_repo.search_by_name(
-                    search_term=search,
-                    available_only=True,
-                    page=page,
-                    per_page=per_page
-                )
-                total_items = len(items)  # Approximate for search
-            elif category_id:
-                items = self.food_item_repo.find_by_category(
-                    category_id=category_id,
-                    available_only=True,
-                    page=page,
-                    per_page=per_page
-                )
-                total_items = self.food_item_repo.count_by_category(category_id)
-            else:
-                items = self.food_item_repo.find_all_available(
-                    page=page,
-                    per_page=per_page
-                )
-                total_items = self.food_item_repo.count_available()
+            # Cached catalog snapshot (categories + items + facet bitsets)
+            catalog = self.get_catalog()
+            facets = self._catalog_facets(catalog)
 
             # Get user favorites if logged in
             user_favorites = set()
@@ -74,23 +63,41 @@ class MenuService:
                 favorites = self.favorite_repo.find_by_user(user_id)
                 user_favorites = {fav.food_item_id for fav in favorites}
 
-            # Format items
-            formatted_items = [
-                self._format_menu_item(item, item.id in user_favorites)
-                for item in items
-            ]
+            selected = {
+                'category': category_id,
+                'price': price_bands,
+                'rating': min_rating,
+                'allergen_free': True if allergen_free else None,
+                'available': None if include_sold_out else True
+            }
 
-            # Format categories
-            formatted_categories = [
-                self._format_category(cat)
-                for cat in categories
-            ]
+            # Search narrows the candidates and supplies the ranking
+            ranked_ids = MenuSearch.search(search) if search else None
+            within = facets.bits_for(ranked_ids) if ranked_ids is not None else None
+
+            catalog_items = facets.select(facets.mask(selected, within), ranked_ids)
+
+            total_items = len(catalog_items)
+            formatted_items = self._page_catalog_items(
+                catalog_items, page, per_page, user_favorites
+            )
+
+            formatted_categories = catalog['categories']
 
             return {
                 'categories': formatted_categories,
                 'items': formatted_items,
                 'current_category': category_id,
                 'search_term': search,
+                'filters': {
+                    'price_bands': list(price_bands or []),
+                    'allergen_free': bool(allergen_free),
+                    'min_rating': min_rating,
+                    'include_sold_out': bool(include_sold_out)
+                },
+                'facets': self._format_facets(
+                    facets, facets.counts(selected, within), selected, formatted_categories
+                ),
                 'pagination': {
                     'page': page,
                     'per_page': per_page,
@@ -105,6 +112,8 @@ class MenuService:
                 'items': [],
                 'current_category': None,
                 'search_term': None,
+                'filters': {},
+                'facets': {},
                 'pagination': {'page': 1, 'per_page': per_page, 'total': 0, 'total_pages': 0}
             }
 
@@ -117,7 +126,16 @@ class MenuService:
     ) -> Dict[str, Any]:
         """Get items for a specific category"""
         try:
-            category = self.category_repo.get_by_id(category_id)
+            catalog = self.get_catalog()
+
+            # Active categories come from the snapshot; fall back for inactive ones
+            category = next(
+                (cat for cat in catalog['categories'] if cat['id'] == category_id),
+                None
+            )
+            if not category:
+                db_category = self.category_repo.get_by_id(category_id)
+                category = self._format_category(db_category) if db_category else None
 
             if not category:
                 return {
@@ -126,14 +144,8 @@ class MenuService:
                     'pagination': {'page': 1, 'per_page': per_page, 'total': 0, 'total_pages': 0}
                 }
 
-            items = self.food_item_repo.find_by_category(
-                category_id=category_id,
-                available_only=True,
-                page=page,
-                per_page=per_page
-            )
-
-            total_items = self.food_item_repo.count_by_category(category_id)
+            catalog_items = catalog['items_by_category'].get(category_id, [])
+            total_items = len(catalog_items)
 
             # Get user favorites
             user_favorites = set()
@@ -141,13 +153,12 @@ class MenuService:
                 favorites = self.favorite_repo.find_by_user(user_id)
                 user_favorites = {fav.food_item_id for fav in favorites}
 
-            formatted_items = [
-                self._format_menu_item(item, item.id in user_favorites)
-                for item in items
-            ]
+            formatted_items = self._page_catalog_items(
+                catalog_items, page, per_page, user_favorites
+            )
 
             return {
-                'category': self._format_category(category),
+                'category': category,
                 'items': formatted_items,
                 'pagination': {
                     'page': page,
@@ -171,14 +182,10 @@ class MenuService:
         per_page: int = 20,
         user_id: int = None
     ) -> Dict[str, Any]:
-        """Search food items by name"""
+        """Search food items by name, description, category and ingredients"""
         try:
-            items = self.food_item_repo.search_by_name(
-                search_term=search_term,
-                available_only=True,
-                page=page,
-                per_page=per_page
-            )
+            catalog_items = self._search_catalog(self.get_catalog(), search_term)
+            total_items = len(catalog_items)
 
             # Get user favorites
             user_favorites = set()
@@ -186,10 +193,9 @@ class MenuService:
                 favorites = self.favorite_repo.find_by_user(user_id)
                 user_favorites = {fav.food_item_id for fav in favorites}
 
-            formatted_items = [
-                self._format_menu_item(item, item.id in user_favorites)
-                for item in items
-            ]
+            formatted_items = self._page_catalog_items(
+                catalog_items, page, per_page, user_favorites
+            )
 
             return {
                 'search_term': search_term,
@@ -197,8 +203,8 @@ class MenuService:
                 'pagination': {
                     'page': page,
                     'per_page': per_page,
-                    'total': len(items),
-                    'total_pages': 1
+                    'total': total_items,
+                    'total_pages': (total_items + per_page - 1) // per_page
                 }
             }
         except Exception as e:
@@ -214,14 +220,18 @@ class MenuService:
     def get_food_item_details(
         self,
         food_item_id: int,
-        user_id: int = None
+        user_id: int = None,
+        reviews_per_page: int = 10,
+        related_limit: int = 4
     ) -> Optional[Dict[str, Any]]:
         """
         Get complete details for a single food item.
         Main method for food item detail page.
+        Only the latest `reviews_per_page` reviews are loaded;
+        'reviews_next_cursor' fetches more via get_item_reviews.
         """
         try:
-            # Get item with all relationships
+            # Get item with category and ingredients
             item = self.food_item_repo.find_by_id_with_details(food_item_id)
 
             if not item:
@@ -244,24 +254,13 @@ class MenuService:
                         'created_at': review.created_at.isoformat()
                     }
 
-            # Get rating statistics
-            avg_rating = self.food_item_repo.get_average_rating(food_item_id)
-            review_count = self.food_item_repo.get_review_count(food_item_id)
+            # Rating statistics (denormalized on the item)
+            avg_rating = item.average_rating or 0.0
+            review_count = item.rating_count
+            rating_distribution = item.rating_distribution
 
-            # Calculate rating distribution
-            rating_distribution = self._calculate_rating_distribution(item.reviews)
-
-            # Format reviews
-            formatted_reviews = [
-                {
-                    'id': review.id,
-                    'user_name': f"{review.user.first_name} {review.user.last_name}",
-                    'rating': review.rating,
-                    'comment': review.comment,
-                    'created_at': review.created_at.isoformat()
-                }
-                for review in sorted(item.reviews, key=lambda r: r.created_at, reverse=True)
-            ]
+            # Latest reviews (first page)
+            reviews = self.review_repo.find_by_food_item(food_item_id, per_page=reviews_per_page)
 
             # Format ingredients
             formatted_ingredients = [
@@ -294,7 +293,9 @@ class MenuService:
                     'count': review_count,
                     'distribution': rating_distribution
                 },
-                'reviews': formatted_reviews,
+                'reviews': self._format_reviews(reviews),
+                'reviews_next_cursor': reviews.next_cursor,
+                'related': self.get_related_items(item.id, item.category_id, related_limit),
                 'user_review': user_review,
                 'created_at': item.created_at.isoformat() if item.created_at else None
             }
@@ -302,6 +303,89 @@ class MenuService:
             errhandler(e, log="menu_service", path="services")
             return None
 
+    def get_item_reviews(
+        self,
+        food_item_id: int,
+        cursor: str = None,
+        per_page: int = 10
+    ) -> Dict[str, Any]:
+        """Next page of an item's reviews, newest first"""
+        try:
+            reviews = self.review_repo.find_by_food_item(
+                food_item_id, per_page=per_page, cursor=cursor
+            )
+
+            return {
+                'reviews': self._format_reviews(reviews),
+                'next_cursor': reviews.next_cursor
+            }
+        except Exception as e:
+            errhandler(e, log="menu_service", path="services")
+            return {
+                'reviews': [],
+                'next_cursor': None
+            }
+
+    # Recommendations
+
+    def get_related_items(
+        self,
+        food_item_id: int,
+        category_id: int = None,
+        limit: int = 4
+    ) -> List[Dict[str, Any]]:
+        """
+        Items frequently ordered with this one, topped up with items from
+        its category while order history is thin.
+        """
+        try:
+            catalog = self.get_catalog()
+
+            # Ask for extra in case some are sold out
+            related = self._available_catalog_items(
+                catalog, Recommender.related(food_item_id, limit * 2), exclude={food_item_id}
+            )[:limit]
+
+            if len(related) < limit and category_id:
+                seen = {food_item_id} | {item['id'] for item in related}
+                related += [
+                    item for item in catalog['items_by_category'].get(category_id, [])
+                    if item['id'] not in seen
+                ][:limit - len(related)]
+
+            return related
+        except Exception as e:
+            errhandler(e, log="menu_service", path="services")
+            return []
+
+    def get_upsell_items(
+        self,
+        cart_item_ids: List[int],
+        limit: int = 3
+    ) -> List[Dict[str, Any]]:
+        """
+        Checkout suggestions for a cart: items frequently ordered with
+        its contents, topped up with popular items.
+        """
+        try:
+            cart = set(cart_item_ids)
+
+            suggestions = self._available_catalog_items(
+                self.get_catalog(), Recommender.for_basket(cart, limit * 2), exclude=cart
+            )[:limit]
+
+            if len(suggestions) < limit:
+                seen = cart | {item['id'] for item in suggestions}
+                suggestions += [
+                    item for item in self.get_featured_items()['popular']
+                    if item['id'] not in seen
+                ][:limit - len(suggestions)]
+
+            return suggestions
+        except Exception as e:
+            errhandler(e, log="menu_service", path="services")
+            return []
+
     # Featured Items
 
     def get_featured_items(self) -> Dict[str, List[Dict[str, Any]]]:
@@ -310,15 +394,12 @@ class MenuService:
         Returns popular, top-rated, and newest items.
         """
         try:
-            popular = self.food_item_repo.get_popular_items(limit=6)
-            top_rated = self.food_item_repo.get_top_rated_items(limit=6, min_reviews=3)
-            newest = self.food_item_repo.get_newest_items(limit=6)
-
-            return {
-                'popular': [self._format_menu_item(item) for item in popular],
-                'top_rated': [self._format_menu_item(item) for item in top_rated],
-                'newest': [self._format_menu_item(item) for item in newest]
-            }
+            # Keyed by catalog version so admin edits drop it immediately
+            return Cache.get_or_set(
+                self.FEATURED_CACHE_KEY.format(version=CatalogCache.version()),
+                self._build_featured_items,
+                CatalogCache.ttl()
+            )
         except Exception as e:
             errhandler(e, log="menu_service", path="services")
             return {
@@ -327,16 +408,143 @@ class MenuService:
                 'newest': []
             }
 
+    def _build_featured_items(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Query popular, top-rated and newest lists"""
+        popular = self.food_item_repo.get_popular_items(limit=6)
+        top_rated = self.food_item_repo.get_top_rated_items(limit=6, min_reviews=3)
+        newest = self.food_item_repo.get_newest_items(limit=6)
+
+        return {
+            'popular': self._format_menu_items(popular),
+            'top_rated': self._format_menu_items(top_rated),
+            'newest': self._format_menu_items(newest)
+        }
+
+    # Catalog Cache
+
+    def get_catalog(self) -> Dict[str, Any]:
+        """Get the cached catalog snapshot, rebuilding on miss/expiry"""
+        return CatalogCache.get_snapshot(self._build_catalog)
+
+    def _build_catalog(self) -> Dict[str, Any]:
+        """Load categories and menu items for the catalog snapshot"""
+        categories = self.category_repo.find_all_active()
+        items = self.food_item_repo.find_catalog_items(available_only=False)
+        allergen_ids = self.food_item_repo.find_allergen_item_ids()
+
+        formatted_items = self._format_menu_items(items)
+        for item in formatted_items:
+            item['allergen_free'] = item['id'] not in allergen_ids
+
+        # Sold-out items sort last when a listing includes them
+        formatted_items.sort(key=lambda item: not item['is_available'])
+
+        return {
+            'categories': [self._format_category(cat) for cat in categories],
+            'items': formatted_items,
+            'facets': FacetIndex(formatted_items, FacetIndex.configured_price_edges())
+        }
+
+    def _catalog_facets(self, catalog: Dict[str, Any]) -> FacetIndex:
+        """Facet bitsets of a snapshot (built here for snapshots cached without them)"""
+        facets = catalog.get('facets')
+        if facets is None:
+            facets = catalog['facets'] = FacetIndex(
+                catalog['items'] + catalog.get('sold_out', []),
+                FacetIndex.configured_price_edges()
+            )
+        return facets
+
+    def _search_catalog(
+        self,
+        catalog: Dict[str, Any],
+        search: str,
+        category_id: int = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Snapshot items matching `search`, best match first.
+        Ranking comes from MenuSearch; the snapshot supplies the listing
+        data, so every match is counted and paged like a category listing.
+        """
+        items_by_id = catalog['items_by_id']
+
+        matches = [
+            items_by_id[item_id]
+            for item_id in MenuSearch.search(search)
+            if item_id in items_by_id
+        ]
+        if category_id:
+            matches = [item for item in matches if item['category']['id'] == category_id]
+        return matches
+
+    def _available_catalog_items(
+        self,
+        catalog: Dict[str, Any],
+        item_ids: List[int],
+        exclude: set = None
+    ) -> List[Dict[str, Any]]:
+        """Snapshot entries for available items among `item_ids`, in order"""
+        exclude = exclude or set()
+        items_by_id = catalog['items_by_id']
+
+        return [
+            items_by_id[item_id]
+            for item_id in item_ids
+            if item_id in items_by_id
+            and item_id not in exclude
+            and items_by_id[item_id]['is_available']
+        ]
+
+    def _page_catalog_items(
+        self,
+        catalog_items: List[Dict[str, Any]],
+        page: int,
+        per_page: int,
+        user_favorites: set = None
+    ) -> List[Dict[str, Any]]:
+        """Slice a page of snapshot items and mark the user's favorites"""
+        user_favorites = user_favorites or set()
+        start = (page - 1) * per_page
+
+        # Copy so the shared snapshot is never mutated per request
+        return [
+            {**item, 'is_favorited': item['id'] in user_favorites}
+            for item in catalog_items[start:start + per_page]
+        ]
+
     # Helper Methods
 
+    def _format_menu_items(
+        self,
+        items: List[FoodItem],
+        user_favorites: set = None
+    ) -> List[Dict[str, Any]]:
+        """Format a list of food items for menu listing"""
+        user_favorites = user_favorites or set()
+
+        return [
+            self._format_menu_item(item, item.id in user_favorites)
+            for item in items
+        ]
+
     def _format_menu_item(
         self,
         item: FoodItem,
-        is_favorited: bool = False
+        is_favorited: bool = False,
+        rating: Dict[str, Any] = None
     ) -> Dict[str, Any]:
-        """Format food item for menu listing"""
-        avg_rating = self.food_item_repo.get_average_rating(item.id)
-        review_count = self.food_item_repo.get_review_count(item.id)
+        """
+        Format food item for menu listing.
+        Rating stats come from the item's counters unless passed in.
+        """
+        if rating is None:
+            rating = {
+                'average': item.average_rating or 0.0,
+                'count': item.rating_count
+            }
+
+        avg_rating = rating['average']
+        review_count = rating['count']
 
         return {
             'id': item.id,
@@ -356,6 +564,67 @@ class MenuService:
             'is_favorited': is_favorited
         }
 
+    def _format_facets(
+        self,
+        facets: FacetIndex,
+        counts: Dict[str, Dict[Any, int]],
+        selected: Dict[str, Any],
+        categories: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Facet options with counts for the filter form"""
+        price_bands = set(selected.get('price') or [])
+
+        return {
+            'categories': [
+                {
+                    'id': category['id'],
+                    'name': category['name'],
+                    'count': counts['category'].get(category['id'], 0),
+                    'selected': category['id'] == selected.get('category')
+                }
+                for category in categories
+            ],
+            'price_bands': [
+                {
+                    'value': band,
+                    'low': low,
+                    'high': high,
+                    'count': counts['price'][band],
+                    'selected': band in price_bands
+                }
+                for band, low, high in facets.price_bands
+            ],
+            'ratings': [
+                {
+                    'value': threshold,
+                    'count': counts['rating'][threshold],
+                    'selected': threshold == selected.get('rating')
+                }
+                for threshold in FacetIndex.RATING_THRESHOLDS
+            ],
+            'allergen_free': {
+                'count': counts['allergen_free'][True],
+                'selected': bool(selected.get('allergen_free'))
+            },
+            'sold_out': {
+                'count': counts['available'][False],
+                'selected': selected.get('available') is None
+            }
+        }
+
+    def _format_reviews(self, reviews: List[Review]) -> List[Dict[str, Any]]:
+        """Format reviews (with their authors loaded) for display"""
+        return [
+            {
+                'id': review.id,
+                'user_name': f"{review.user.first_name} {review.user.last_name}",
+                'rating': review.rating,
+                'comment': review.comment,
+                'created_at': review.created_at.isoformat()
+            }
+            for review in reviews
+        ]
+
     def _format_category(self, category: Category) -> Dict[str, Any]:
         """Format category for display"""
         return {
@@ -363,14 +632,4 @@ class MenuService:
             'name': category.name,
             'description': category.description,
             'sort_order': category.sort_order
-        }
-
-    def _calculate_rating_distribution(self, reviews: List) -> Dict[int, int]:
-        """Calculate how many reviews for each star rating"""
-        distribution = {5: 0, 4: 0, 3: 0, 2: 0, 1: 0}
-
-        for review in reviews:
-            if review.rating in distribution:
-                distribution[review.rating] += 1
-
-        return distribution
\ No newline at end of file
+        }
\ No newline at end of file
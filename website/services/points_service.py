@@ -209,19 +209,7 @@ class PointsService:
                     'next_reward_points': 0
                 }
 
-            # Calculate cash value
-            cash_value = user.points_to_cash()
-
-            # Calculate points to next reward tier (example: every 1000 points)
-            next_milestone = 1000
-            points_to_next = next_milestone - (user.lifetime_points_earned % next_milestone)
-
-            return {
-                'points_balance': user.points_balance,
-                'lifetime_points': user.lifetime_points_earned,
-                'cash_value': round(cash_value, 2),
-                'next_reward_points': points_to_next
-            }
+            return self.summarize_points(user)
         except Exception as e:
             errhandler(e, log="points_service", path="services")
             return {
@@ -231,6 +219,22 @@ class PointsService:
                 'next_reward_points': 0
             }
 
+    def summarize_points(self, user: User) -> Dict[str, Any]:
+        """Points summary for an already loaded user (no queries)"""
+        # Calculate cash value
+        cash_value = user.points_to_cash()
+
+        # Calculate points to next reward tier (example: every 1000 points)
+        next_milestone = 1000
+        points_to_next = next_milestone - (user.lifetime_points_earned % next_milestone)
+
+        return {
+            'points_balance': user.points_balance,
+            'lifetime_points': user.lifetime_points_earned,
+            'cash_value': round(cash_value, 2),
+            'next_reward_points': points_to_next
+        }
+
     def get_points_history(
         self,
         user_id: int,
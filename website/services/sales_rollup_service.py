@@ -0,0 +1,62 @@
+from typing import Dict, Any, Iterable
+from datetime import date
+
+from website.models import Order
+from website.repositories import SalesSummaryRepository, DateRange
+from utils import errhandler, syshandler
+from database import db
+
+
+class SalesRollupService:
+    """
+    Maintains daily_sales_summary.
+    A day's row is recomputed whenever one of its orders completes,
+    and can be backfilled for any range from the CLI.
+    Days are reporting-timezone days over Order.completed_at.
+    """
+
+    def __init__(self, summary_repo: SalesSummaryRepository = None):
+        self.summary_repo = summary_repo or SalesSummaryRepository()
+
+    @staticmethod
+    def today() -> date:
+        """Current (still open) rollup day"""
+        return DateRange.today()
+
+    @staticmethod
+    def day_bounds(day: date) -> tuple:
+        """Half-open [start, end) timestamps covering a day"""
+        return DateRange.for_day(day).bounds(Order.completed_at)
+
+    def rollup_day(self, day: date) -> Dict[str, Any]:
+        """Recompute and store the summary row for one day"""
+        start, end = self.day_bounds(day)
+
+        # Own transaction: safe to call from session after_commit hooks
+        with db.engine.begin() as connection:
+            values = self.summary_repo.compute_day(connection, start, end)
+            self.summary_repo.save_day(connection, day, values)
+
+        return values
+
+    def rollup_days(self, days: Iterable[date]) -> int:
+        """Recompute several days, logging (not raising) failures"""
+        updated = 0
+        for day in sorted(set(days)):
+            try:
+                self.rollup_day(day)
+                updated += 1
+            except Exception as e:
+                errhandler(e, log="sales_rollup_service", path="services")
+        return updated
+
+    def rollup_range(self, start_date: date, end_date: date) -> int:
+        """Backfill every day in an inclusive range"""
+        updated = self.rollup_days(DateRange(start_date, end_date).days())
+
+        syshandler(
+            f"Sales rollup rebuilt {updated} day(s) from {start_date} to {end_date}",
+            log="sales_rollup_service",
+            path="services"
+        )
+        return updated